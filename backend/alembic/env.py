@@ -20,6 +20,7 @@ from app.models.task import (
 )
 from app.models.calendar import Calendar, Event
 from app.models.permission import Role, Permission, RolePermission, UserRole
+from app.models.stats import StatsCounter
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -0,0 +1,43 @@
+"""Keyset pagination indexes
+
+Revision ID: 002
+Revises: 001
+Create Date: 2024-01-15 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "002"
+down_revision: Union[str, None] = "001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # (created_at, id) 키셋 페이지네이션용 인덱스
+    op.create_index(
+        "ix_users_created_at_id", "users", ["created_at", "id"], unique=False
+    )
+    op.create_index(
+        "ix_projects_created_at_id", "projects", ["created_at", "id"], unique=False
+    )
+    op.create_index(
+        "ix_tasks_created_at_id", "tasks", ["created_at", "id"], unique=False
+    )
+    op.create_index(
+        "ix_tasks_project_id_created_at_id",
+        "tasks",
+        ["project_id", "created_at", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_tasks_project_id_created_at_id", table_name="tasks")
+    op.drop_index("ix_tasks_created_at_id", table_name="tasks")
+    op.drop_index("ix_projects_created_at_id", table_name="projects")
+    op.drop_index("ix_users_created_at_id", table_name="users")
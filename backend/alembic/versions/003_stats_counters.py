@@ -0,0 +1,78 @@
+"""Dashboard stats counters
+
+Revision ID: 003
+Revises: 002
+Create Date: 2024-01-22 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "003"
+down_revision: Union[str, None] = "002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "stats_counters",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("scope", sa.String(length=20), nullable=False),
+        sa.Column("scope_id", sa.Integer(), nullable=False),
+        sa.Column("metric", sa.String(length=50), nullable=False),
+        sa.Column("value", sa.Integer(), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "scope", "scope_id", "metric", name="uq_stats_counters_scope_metric"
+        ),
+    )
+    op.create_index(
+        op.f("ix_stats_counters_id"), "stats_counters", ["id"], unique=False
+    )
+
+    # 기존 데이터로 카운터 초기화
+    op.execute("""
+        INSERT INTO stats_counters (scope, scope_id, metric, value)
+        SELECT 'user', u.id, 'projects_total', count(pm.id)
+        FROM users u LEFT JOIN project_members pm ON pm.user_id = u.id
+        GROUP BY u.id
+        UNION ALL
+        SELECT 'user', pm.user_id, 'projects_' || p.status::text, count(*)
+        FROM project_members pm JOIN projects p ON p.id = pm.project_id
+        WHERE p.status IS NOT NULL
+        GROUP BY pm.user_id, p.status
+        UNION ALL
+        SELECT 'user', ta.user_id, 'tasks_total', count(*)
+        FROM task_assignments ta
+        GROUP BY ta.user_id
+        UNION ALL
+        SELECT 'user', ta.user_id, 'tasks_' || t.status::text, count(*)
+        FROM task_assignments ta JOIN tasks t ON t.id = ta.task_id
+        WHERE t.status IS NOT NULL
+        GROUP BY ta.user_id, t.status
+        UNION ALL
+        SELECT 'project', t.project_id, 'tasks_total', count(*)
+        FROM tasks t
+        GROUP BY t.project_id
+        UNION ALL
+        SELECT 'project', t.project_id, 'tasks_' || t.status::text, count(*)
+        FROM tasks t
+        WHERE t.status IS NOT NULL
+        GROUP BY t.project_id, t.status
+        """)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_stats_counters_id"), table_name="stats_counters")
+    op.drop_table("stats_counters")
@@ -0,0 +1,79 @@
+"""Hot-path composite indexes
+
+Revision ID: 004
+Revises: 003
+Create Date: 2024-01-29 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "004"
+down_revision: Union[str, None] = "003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        op.f("ix_projects_creator_id"), "projects", ["creator_id"], unique=False
+    )
+    # 담당자/멤버 조인은 양방향으로 조회하므로 두 순서 모두 인덱스를 둔다
+    op.create_index(
+        "ix_task_assignments_user_id_task_id",
+        "task_assignments",
+        ["user_id", "task_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_task_assignments_task_id_user_id",
+        "task_assignments",
+        ["task_id", "user_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_project_members_user_id_project_id",
+        "project_members",
+        ["user_id", "project_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_project_members_project_id_user_id",
+        "project_members",
+        ["project_id", "user_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_tasks_project_id_status_due_date",
+        "tasks",
+        ["project_id", "status", "due_date"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_events_calendar_id_start_time",
+        "events",
+        ["calendar_id", "start_time"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_user_activity_logs_user_id_created_at",
+        "user_activity_logs",
+        ["user_id", "created_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_user_activity_logs_user_id_created_at", table_name="user_activity_logs"
+    )
+    op.drop_index("ix_events_calendar_id_start_time", table_name="events")
+    op.drop_index("ix_tasks_project_id_status_due_date", table_name="tasks")
+    op.drop_index("ix_project_members_project_id_user_id", table_name="project_members")
+    op.drop_index("ix_project_members_user_id_project_id", table_name="project_members")
+    op.drop_index("ix_task_assignments_task_id_user_id", table_name="task_assignments")
+    op.drop_index("ix_task_assignments_user_id_task_id", table_name="task_assignments")
+    op.drop_index(op.f("ix_projects_creator_id"), table_name="projects")
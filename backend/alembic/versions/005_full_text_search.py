@@ -0,0 +1,51 @@
+"""Full-text search vectors
+
+Revision ID: 005
+Revises: 004
+Create Date: 2024-02-05 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "005"
+down_revision: Union[str, None] = "004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 테이블 -> [(컬럼, 가중치)] (app/models/search.py와 동일하게 유지)
+SEARCH_DOCUMENTS = {
+    "projects": [("name", "A"), ("description", "B")],
+    "tasks": [("title", "A"), ("description", "B")],
+    "task_comments": [("content", "B")],
+    "project_comments": [("content", "B")],
+}
+
+
+def upgrade() -> None:
+    # 저장 생성 컬럼이라 쓰기 시 자동으로 갱신된다
+    for table, columns in SEARCH_DOCUMENTS.items():
+        vector = " || ".join(
+            f"setweight(to_tsvector('simple', coalesce({column}, '')), '{weight}')"
+            for column, weight in columns
+        )
+        op.execute(
+            f"ALTER TABLE {table} ADD COLUMN search_vector tsvector "
+            f"GENERATED ALWAYS AS ({vector}) STORED"
+        )
+        op.create_index(
+            f"ix_{table}_search_vector",
+            table,
+            ["search_vector"],
+            unique=False,
+            postgresql_using="gin",
+        )
+
+
+def downgrade() -> None:
+    for table in reversed(list(SEARCH_DOCUMENTS)):
+        op.drop_index(f"ix_{table}_search_vector", table_name=table)
+        op.drop_column(table, "search_vector")
@@ -0,0 +1,28 @@
+"""Index tasks.parent_task_id for subtask tree queries
+
+Revision ID: 006
+Revises: 005
+Create Date: 2024-02-12 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "006"
+down_revision: Union[str, None] = "005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 재귀 CTE가 단계마다 parent_task_id = ? 로 자식을 찾는다
+    op.create_index(
+        op.f("ix_tasks_parent_task_id"), "tasks", ["parent_task_id"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_tasks_parent_task_id"), table_name="tasks")
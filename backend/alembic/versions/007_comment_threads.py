@@ -0,0 +1,60 @@
+"""Comment thread indexes and denormalized reply counts
+
+Revision ID: 007
+Revises: 006
+Create Date: 2024-02-19 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "007"
+down_revision: Union[str, None] = "006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (테이블, 범위 컬럼)
+COMMENT_TABLES = [("task_comments", "task_id"), ("project_comments", "project_id")]
+
+
+def upgrade() -> None:
+    for table, scope in COMMENT_TABLES:
+        op.add_column(
+            table,
+            sa.Column("reply_count", sa.Integer(), nullable=False, server_default="0"),
+        )
+        op.create_index(
+            op.f(f"ix_{table}_parent_id"), table, ["parent_id"], unique=False
+        )
+        op.create_index(
+            f"ix_{table}_{scope}_parent_id_created_at_id",
+            table,
+            [scope, "parent_id", "created_at", "id"],
+            unique=False,
+        )
+
+        # 기존 스레드의 하위 답글 수 채우기: (조상, 자손) 쌍을 재귀로 펼쳐 센다
+        op.execute(f"""
+            WITH RECURSIVE closure(ancestor_id, descendant_id) AS (
+                SELECT parent_id, id FROM {table} WHERE parent_id IS NOT NULL
+                UNION ALL
+                SELECT c.parent_id, closure.descendant_id
+                FROM {table} c JOIN closure ON c.id = closure.ancestor_id
+                WHERE c.parent_id IS NOT NULL
+            )
+            UPDATE {table} SET reply_count = (
+                SELECT count(*) FROM closure WHERE closure.ancestor_id = {table}.id
+            )
+            WHERE id IN (SELECT ancestor_id FROM closure)
+            """)
+
+
+def downgrade() -> None:
+    for table, scope in reversed(COMMENT_TABLES):
+        op.drop_index(f"ix_{table}_{scope}_parent_id_created_at_id", table_name=table)
+        op.drop_index(op.f(f"ix_{table}_parent_id"), table_name=table)
+        op.drop_column(table, "reply_count")
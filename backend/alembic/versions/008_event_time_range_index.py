@@ -0,0 +1,60 @@
+"""Range-overlap index for calendar events
+
+Revision ID: 008
+Revises: 007
+Create Date: 2024-02-26 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "008"
+down_revision: Union[str, None] = "007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        op.f("ix_calendars_owner_id"), "calendars", ["owner_id"], unique=False
+    )
+    op.create_check_constraint(
+        "ck_events_end_after_start", "events", "end_time >= start_time"
+    )
+
+    # calendar_id(스칼라) + tstzrange를 한 GiST 인덱스에 넣기 위해 btree_gist 사용
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+    op.execute(
+        "CREATE INDEX ix_events_calendar_id_time_range ON events USING gist "
+        "(calendar_id, tstzrange(start_time, end_time, '[]'))"
+    )
+
+    # B-tree 대체 경로(SQLite 등)가 쓰는 캘린더별 최장 일정 길이
+    op.add_column(
+        "calendars",
+        sa.Column(
+            "max_event_seconds", sa.Integer(), nullable=False, server_default="0"
+        ),
+    )
+    op.execute("""
+        UPDATE calendars SET max_event_seconds = durations.seconds
+        FROM (
+            SELECT calendar_id,
+                   ceil(extract(epoch FROM max(end_time - start_time)))::integer
+                       AS seconds
+            FROM events
+            GROUP BY calendar_id
+        ) AS durations
+        WHERE durations.calendar_id = calendars.id
+        """)
+
+
+def downgrade() -> None:
+    op.drop_column("calendars", "max_event_seconds")
+    op.drop_index("ix_events_calendar_id_time_range", table_name="events")
+    op.drop_constraint("ck_events_end_after_start", "events", type_="check")
+    op.drop_index(op.f("ix_calendars_owner_id"), table_name="calendars")
@@ -0,0 +1,77 @@
+"""Recurring events and sparse per-occurrence exceptions
+
+Revision ID: 009
+Revises: 008
+Create Date: 2024-03-04 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "009"
+down_revision: Union[str, None] = "008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("events", sa.Column("rrule", sa.String(length=500), nullable=True))
+    op.add_column(
+        "events",
+        sa.Column("recurrence_end", sa.DateTime(timezone=True), nullable=True),
+    )
+    # 기간 조회 시 시리즈 후보만 따로 찾는다
+    op.create_index(
+        "ix_events_calendar_id_recurring",
+        "events",
+        ["calendar_id", "start_time"],
+        unique=False,
+        postgresql_where=sa.text("rrule IS NOT NULL"),
+    )
+
+    op.create_table(
+        "event_exceptions",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("event_id", sa.Integer(), nullable=False),
+        sa.Column("original_start", sa.DateTime(timezone=True), nullable=False),
+        sa.Column(
+            "is_cancelled",
+            sa.Boolean(),
+            nullable=False,
+            server_default=sa.text("false"),
+        ),
+        sa.Column("title", sa.String(length=200), nullable=True),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("start_time", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("end_time", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("location", sa.String(length=200), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["event_id"], ["events.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "event_id",
+            "original_start",
+            name="uq_event_exceptions_event_id_original_start",
+        ),
+    )
+    op.create_index(
+        op.f("ix_event_exceptions_id"), "event_exceptions", ["id"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_event_exceptions_id"), table_name="event_exceptions")
+    op.drop_table("event_exceptions")
+    op.drop_index("ix_events_calendar_id_recurring", table_name="events")
+    op.drop_column("events", "recurrence_end")
+    op.drop_column("events", "rrule")
@@ -0,0 +1,69 @@
+"""Per-status task counts and progress roll-up on projects
+
+Revision ID: 010
+Revises: 009
+Create Date: 2024-03-11 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "010"
+down_revision: Union[str, None] = "009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TASK_STATUSES = ["todo", "in_progress", "in_review", "done", "blocked"]
+COUNT_COLUMNS = ["tasks_total"] + [f"tasks_{status}" for status in TASK_STATUSES]
+
+
+def upgrade() -> None:
+    for column in COUNT_COLUMNS:
+        op.add_column(
+            "projects",
+            sa.Column(column, sa.Integer(), nullable=False, server_default="0"),
+        )
+
+    # 기존 작업으로 롤업과 진행률 채우기
+    counts = ",\n".join(
+        f"count(*) FILTER (WHERE status = '{status}') AS tasks_{status}"
+        for status in TASK_STATUSES
+    )
+    assignments = ",\n".join(f"{column} = counts.{column}" for column in COUNT_COLUMNS)
+    op.execute(f"""
+        UPDATE projects SET
+            {assignments},
+            progress = counts.tasks_done * 100 / counts.tasks_total
+        FROM (
+            SELECT project_id, count(*) AS tasks_total,
+                   {counts}
+            FROM tasks
+            GROUP BY project_id
+        ) AS counts
+        WHERE counts.project_id = projects.id
+        """)
+    op.execute(
+        "UPDATE projects SET progress = 0 "
+        "WHERE tasks_total = 0 AND progress IS DISTINCT FROM 0"
+    )
+
+    # 프로젝트 작업 수는 이제 projects 행에 있으므로 003의 'project' 카운터는 버린다
+    op.execute("DELETE FROM stats_counters WHERE scope = 'project'")
+
+
+def downgrade() -> None:
+    # 이전 리비전이 읽던 'project' 카운터를 롤업 컬럼에서 복원
+    selects = "\n        UNION ALL\n        ".join(
+        f"SELECT 'project', id, '{column}', {column} FROM projects"
+        for column in COUNT_COLUMNS
+    )
+    op.execute(f"""
+        INSERT INTO stats_counters (scope, scope_id, metric, value)
+        {selects}
+        """)
+    for column in reversed(COUNT_COLUMNS):
+        op.drop_column("projects", column)
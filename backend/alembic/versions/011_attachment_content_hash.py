@@ -0,0 +1,37 @@
+"""Content hash on attachments for deduplicated storage
+
+Revision ID: 011
+Revises: 010
+Create Date: 2024-03-18 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "011"
+down_revision: Union[str, None] = "010"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ATTACHMENT_TABLES = ["project_attachments", "task_attachments"]
+
+
+def upgrade() -> None:
+    # 기존 첨부는 해시가 없는 채로 둔다 (업로드 경로에서만 채워진다)
+    for table in ATTACHMENT_TABLES:
+        op.add_column(
+            table, sa.Column("content_hash", sa.String(length=64), nullable=True)
+        )
+        op.create_index(
+            op.f(f"ix_{table}_content_hash"), table, ["content_hash"], unique=False
+        )
+
+
+def downgrade() -> None:
+    for table in reversed(ATTACHMENT_TABLES):
+        op.drop_index(op.f(f"ix_{table}_content_hash"), table_name=table)
+        op.drop_column(table, "content_hash")
@@ -0,0 +1,32 @@
+"""Time zone (TZID) for expanding recurring events
+
+Revision ID: 012
+Revises: 011
+Create Date: 2024-03-25 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "012"
+down_revision: Union[str, None] = "011"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 기존 시리즈는 지금까지처럼 UTC 기준으로 펼친다
+    op.add_column(
+        "events",
+        sa.Column(
+            "timezone", sa.String(length=64), nullable=False, server_default="UTC"
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("events", "timezone")
@@ -0,0 +1,407 @@
+import asyncio
+import os
+from typing import Literal, Optional
+from urllib.parse import quote
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import FileResponse, JSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.requests import ClientDisconnect
+
+from app.api.graphql.http_cache import etag_matches
+from app.core.config import settings
+from app.core.database import get_db
+from app.core.dependencies import get_current_active_user
+from app.models.user import User
+from app.services.attachment_service import (
+    AttachmentService,
+    UploadBusy,
+    UploadOffsetMismatch,
+    UploadTooLarge,
+    clean_filename,
+    guess_mime_type,
+    resolve_upload_path,
+)
+from app.utils.logger import log_user_activity
+
+router = APIRouter(prefix="/attachments", tags=["attachments"])
+
+AttachmentTarget = Literal["projects", "tasks"]
+
+# 브라우저에서 바로 열어도 스크립트가 실행되지 않는 형식 (그 외는 내려받기)
+INLINE_MIME_PREFIXES = ("image/", "video/", "audio/", "application/pdf", "text/plain")
+INLINE_MIME_EXCLUDED = ("image/svg+xml",)
+
+
+class SendfileResponse(FileResponse):
+    """서버가 ASGI zero-copy 확장을 지원하면 os.sendfile로 보내는 FileResponse
+
+    지원하지 않는 서버(uvicorn 등)에서는 큰 청크로 읽어 보낸다. Range 해석과
+    206/416 응답은 FileResponse가 처리한다.
+    """
+
+    chunk_size = 256 * 1024
+
+    async def __call__(self, scope, receive, send) -> None:
+        self._zerocopy = "http.response.zerocopysend" in scope.get("extensions", {})
+        await super().__call__(scope, receive, send)
+
+    async def _handle_simple(self, send, send_header_only: bool) -> None:
+        if not self._zerocopy or send_header_only:
+            return await super()._handle_simple(send, send_header_only)
+        await send(
+            {
+                "type": "http.response.start",
+                "status": self.status_code,
+                "headers": self.raw_headers,
+            }
+        )
+        await self._sendfile(send, 0, self.stat_result.st_size)
+
+    async def _handle_single_range(
+        self, send, start: int, end: int, file_size: int, send_header_only: bool
+    ) -> None:
+        if not self._zerocopy or send_header_only:
+            return await super()._handle_single_range(
+                send, start, end, file_size, send_header_only
+            )
+        self.headers["content-range"] = f"bytes {start}-{end - 1}/{file_size}"
+        self.headers["content-length"] = str(end - start)
+        await send(
+            {"type": "http.response.start", "status": 206, "headers": self.raw_headers}
+        )
+        await self._sendfile(send, start, end - start)
+
+    async def _sendfile(self, send, offset: int, count: int) -> None:
+        with open(self.path, "rb") as file:
+            await send(
+                {
+                    "type": "http.response.zerocopysend",
+                    "file": file,
+                    "offset": offset,
+                    "count": count,
+                    "more_body": False,
+                }
+            )
+
+
+def _content_disposition(filename: str, media_type: str) -> str:
+    disposition = (
+        "inline"
+        if media_type.startswith(INLINE_MIME_PREFIXES)
+        and media_type not in INLINE_MIME_EXCLUDED
+        else "attachment"
+    )
+    quoted = quote(filename)
+    if quoted != filename:
+        return f"{disposition}; filename*=utf-8''{quoted}"
+    return f'{disposition}; filename="{filename}"'
+
+
+def _attachment_response(attachment, deduplicated: bool) -> dict:
+    return {
+        "id": attachment.id,
+        "filename": attachment.filename,
+        "file_size": attachment.file_size,
+        "mime_type": attachment.mime_type,
+        "content_hash": attachment.content_hash,
+        "uploaded_at": attachment.uploaded_at,
+        "deduplicated": deduplicated,
+    }
+
+
+def _too_large() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=f"File exceeds {settings.MAX_FILE_SIZE} bytes",
+    )
+
+
+async def _require_target(
+    db: AsyncSession, user_id: int, target: str, target_id: int
+) -> None:
+    if (
+        await AttachmentService.get_target_project_id(db, user_id, target, target_id)
+        is None
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"{'Project' if target == 'projects' else 'Task'} not found",
+        )
+
+
+async def _finish_upload(
+    db: AsyncSession,
+    user_id: int,
+    target: str,
+    target_id: int,
+    filename: str,
+    mime_type: str,
+    stored,
+) -> dict:
+    attachment = await AttachmentService.create_attachment(
+        db, target, target_id, user_id, filename, mime_type, stored
+    )
+    await db.commit()
+
+    log_user_activity(
+        user_id=user_id,
+        action="attachment_uploaded",
+        resource_type=target[:-1],
+        resource_id=target_id,
+        description=f"Uploaded attachment: {filename}",
+    )
+    return _attachment_response(attachment, stored.deduplicated)
+
+
+@router.post("/{target}/{target_id}", status_code=status.HTTP_201_CREATED)
+async def upload_attachment(
+    target: AttachmentTarget,
+    target_id: int,
+    request: Request,
+    filename: str = Query(..., min_length=1, max_length=255),
+    content_length: Optional[int] = Header(None),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+) -> dict:
+    """파일 한 번에 올리기 (요청 본문 = 파일 내용, Content-Type = 파일 형식)
+
+    본문은 디스크로 바로 스트리밍되며 MAX_FILE_SIZE를 넘는 순간 413으로
+    중단한다. 같은 내용의 파일이 이미 있으면 저장소를 공유한다.
+    """
+    user_id = current_user.id
+    await _require_target(db, user_id, target, target_id)
+    if content_length is not None and content_length > settings.MAX_FILE_SIZE:
+        raise _too_large()
+    # 본문을 받는 동안 DB 커넥션을 풀에 돌려준다
+    await db.rollback()
+
+    try:
+        stored = await AttachmentService.save_stream(request.stream())
+    except UploadTooLarge:
+        raise _too_large()
+
+    filename = clean_filename(filename)
+    return await _finish_upload(
+        db,
+        user_id,
+        target,
+        target_id,
+        filename,
+        guess_mime_type(filename, request.headers.get("content-type")),
+        stored,
+    )
+
+
+@router.post("/{target}/{target_id}/uploads", status_code=status.HTTP_201_CREATED)
+async def create_upload(
+    target: AttachmentTarget,
+    target_id: int,
+    response: Response,
+    filename: str = Query(..., min_length=1, max_length=255),
+    mime_type: Optional[str] = Query(None, max_length=100),
+    upload_length: int = Header(..., ge=0),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+) -> dict:
+    """이어 올리기 세션 생성 (Upload-Length = 전체 파일 크기)
+
+    이후 PATCH /attachments/uploads/{id}에 Upload-Offset과 함께 나머지 바이트를
+    보내고, 끊기면 HEAD로 서버가 받은 오프셋을 확인해 그 지점부터 다시 보낸다.
+    """
+    await _require_target(db, current_user.id, target, target_id)
+
+    filename = clean_filename(filename)
+    try:
+        session = await AttachmentService.create_session(
+            current_user.id,
+            target,
+            target_id,
+            filename,
+            guess_mime_type(filename, mime_type),
+            upload_length,
+        )
+    except UploadTooLarge:
+        raise _too_large()
+
+    response.headers["Location"] = f"/attachments/uploads/{session.id}"
+    return {"upload_id": session.id, "offset": session.offset, "length": session.length}
+
+
+@router.head("/uploads/{upload_id}")
+async def get_upload_offset(
+    upload_id: str,
+    current_user: User = Depends(get_current_active_user),
+) -> Response:
+    session = AttachmentService.get_session(upload_id, current_user.id)
+    if session is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Upload not found"
+        )
+    return Response(
+        headers={
+            "Upload-Offset": str(session.offset),
+            "Upload-Length": str(session.length),
+            "Cache-Control": "no-store",
+        }
+    )
+
+
+@router.patch("/uploads/{upload_id}")
+async def append_upload(
+    upload_id: str,
+    request: Request,
+    upload_offset: int = Header(..., ge=0),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+) -> Response:
+    """세션에 이어 쓰기 (다 받으면 201과 첨부 정보, 아니면 204와 Upload-Offset)"""
+    user_id = current_user.id
+    await db.rollback()
+
+    session = AttachmentService.get_session(upload_id, user_id)
+    if session is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Upload not found"
+        )
+
+    try:
+        stored = await AttachmentService.append_session(
+            session, request.stream(), upload_offset
+        )
+    except FileNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Upload not found"
+        )
+    except UploadOffsetMismatch as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e),
+            headers={"Upload-Offset": str(e.offset)},
+        )
+    except UploadBusy as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except UploadTooLarge:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Upload exceeds declared length {session.length}",
+        )
+    except ClientDisconnect:
+        # 받은 바이트는 세션에 남아 있다 (응답을 받을 클라이언트는 없음)
+        return Response(status_code=status.HTTP_400_BAD_REQUEST)
+
+    if stored is None:
+        return Response(
+            status_code=status.HTTP_204_NO_CONTENT,
+            headers={"Upload-Offset": str(session.offset)},
+        )
+
+    # 업로드 중에 대상이 삭제되었을 수 있다
+    await _require_target(db, user_id, session.target, session.target_id)
+    body = await _finish_upload(
+        db,
+        user_id,
+        session.target,
+        session.target_id,
+        session.filename,
+        session.mime_type,
+        stored,
+    )
+    return JSONResponse(
+        status_code=status.HTTP_201_CREATED,
+        content=jsonable_encoder(body),
+        headers={"Upload-Offset": str(session.offset)},
+    )
+
+
+@router.delete("/uploads/{upload_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def cancel_upload(
+    upload_id: str,
+    current_user: User = Depends(get_current_active_user),
+) -> Response:
+    session = AttachmentService.get_session(upload_id, current_user.id)
+    if session is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Upload not found"
+        )
+    AttachmentService.delete_session(session)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+@router.api_route("/{target}/files/{attachment_id}", methods=["GET", "HEAD"])
+async def download_attachment(
+    target: AttachmentTarget,
+    attachment_id: int,
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+) -> Response:
+    """첨부 다운로드 (프로젝트 멤버/생성자만)
+
+    내용 주소로 저장된 파일은 경로가 내용과 함께 바뀌므로 ETag를 내용 해시로
+    두고 immutable로 오래 캐시한다. ATTACHMENT_ACCEL_REDIRECT_PREFIX가 있으면
+    권한 확인만 하고 전송(sendfile, Range)은 nginx에 맡긴다.
+    """
+    attachment_file = await AttachmentService.get_attachment_file(
+        db, current_user.id, target, attachment_id
+    )
+    # 파일을 보내는 동안 DB 커넥션을 풀에 돌려준다
+    await db.rollback()
+    if attachment_file is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Attachment not found"
+        )
+
+    full_path = resolve_upload_path(attachment_file.path)
+    try:
+        stat_result = await asyncio.to_thread(os.stat, full_path) if full_path else None
+    except FileNotFoundError:
+        stat_result = None
+    if stat_result is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Attachment not found"
+        )
+
+    media_type = attachment_file.mime_type or guess_mime_type(
+        attachment_file.filename, None
+    )
+    headers = {
+        "Content-Disposition": _content_disposition(
+            attachment_file.filename, media_type
+        ),
+        "X-Content-Type-Options": "nosniff",
+    }
+    if attachment_file.content_hash:
+        headers["ETag"] = f'"{attachment_file.content_hash}"'
+        # 권한이 필요한 파일이므로 공유 캐시에는 두지 않는다
+        headers["Cache-Control"] = (
+            f"private, max-age={settings.ATTACHMENT_CACHE_MAX_AGE}, immutable"
+        )
+        if etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    else:
+        # 해시 없는 이전 첨부는 같은 경로의 내용이 바뀔 수 있어 오래 캐시하지 않는다
+        headers["Cache-Control"] = "private, no-cache"
+
+    if settings.ATTACHMENT_ACCEL_REDIRECT_PREFIX:
+        # nginx는 Content-Type/Content-Disposition/Cache-Control을 그대로 넘긴다
+        headers["X-Accel-Redirect"] = (
+            settings.ATTACHMENT_ACCEL_REDIRECT_PREFIX.rstrip("/")
+            + "/"
+            + quote(attachment_file.path)
+        )
+        return Response(headers=headers, media_type=media_type)
+
+    return SendfileResponse(
+        full_path, headers=headers, media_type=media_type, stat_result=stat_result
+    )
@@ -0,0 +1,40 @@
+from typing import Literal
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_db
+from app.core.dependencies import get_current_active_user
+from app.models.user import User
+from app.services.export_service import EXPORT_FORMATS, ExportService
+
+router = APIRouter(prefix="/exports", tags=["exports"])
+
+EXPORT_QUERIES = {
+    "tasks": ExportService.tasks_query,
+    "assignments": ExportService.assignments_query,
+    "activity": ExportService.activity_query,
+}
+
+
+@router.get("/projects/{project_id}/{dataset}")
+async def export_project_data(
+    project_id: int,
+    dataset: Literal["tasks", "assignments", "activity"],
+    format: Literal["csv", "ndjson"] = "csv",
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+) -> StreamingResponse:
+    """프로젝트 작업/담당자/활동 로그를 CSV 또는 NDJSON으로 스트리밍"""
+    if not await ExportService.can_export(db, current_user.id, project_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Project not found"
+        )
+
+    filename = f"project-{project_id}-{dataset}.{format}"
+    return StreamingResponse(
+        ExportService.stream(EXPORT_QUERIES[dataset](project_id), format),
+        media_type=EXPORT_FORMATS[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
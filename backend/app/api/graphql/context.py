@@ -0,0 +1,58 @@
+from typing import Any, Dict, Optional
+
+from fastapi import Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from strawberry.types import Info
+
+from app.api.graphql.loaders import Loaders
+from app.core.database import async_session_maker, get_db
+from app.core.dependencies import get_current_user_optional, get_token_user
+from app.models.user import User
+
+
+async def get_context(
+    db: AsyncSession = Depends(get_db),
+    current_user: Optional[User] = Depends(get_current_user_optional),
+) -> Dict[str, Any]:
+    """GraphQL 요청 컨텍스트 (DB 세션, 인증 사용자, 요청 단위 DataLoader)"""
+    return {
+        "db": db,
+        "current_user": current_user,
+        "loaders": Loaders(db),
+    }
+
+
+def get_context_user(info: Info) -> User:
+    """인증된 활성 사용자를 반환 (없으면 401)"""
+    current_user = info.context["current_user"]
+
+    if current_user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+        )
+
+    if not current_user.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Inactive user"
+        )
+
+    return current_user
+
+
+async def get_subscription_user(info: Info) -> User:
+    """구독 사용자: 업그레이드 요청 헤더의 토큰, 없으면 connection_init 페이로드의
+    `Authorization: Bearer ...`
+
+    구독은 오래 열려 있으므로 컨텍스트의 세션 대신 짧은 세션으로 조회해
+    커넥션을 바로 반납한다.
+    """
+    if info.context["current_user"] is None:
+        params = info.context.get("connection_params") or {}
+        authorization = params.get("Authorization") or params.get("authorization") or ""
+        scheme, _, token = authorization.partition(" ")
+        if scheme.lower() == "bearer" and token:
+            async with async_session_maker() as session:
+                info.context["current_user"] = await get_token_user(session, token)
+
+    return get_context_user(info)
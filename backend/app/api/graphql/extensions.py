@@ -0,0 +1,242 @@
+import time
+from typing import Any, Dict, Optional
+
+from graphql import (
+    ExecutionResult,
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    GraphQLError,
+    GraphQLList,
+    GraphQLNonNull,
+    GraphQLObjectType,
+    InlineFragmentNode,
+    OperationDefinitionNode,
+    SelectionSetNode,
+    get_named_type,
+    get_operation_ast,
+    value_from_ast_untyped,
+)
+from strawberry.extensions import SchemaExtension
+
+from app.api.graphql.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.core.cache import TTLCache
+from app.core.config import settings
+
+# 필드별 기본 가중치 덮어쓰기 ("Type.field" -> cost)
+FIELD_COSTS: Dict[str, int] = {
+    "Query.dashboardStats": 10,
+    "Query.search": 5,
+    "Query.taskTree": 5,
+    "Query.events": 5,
+    "Mutation.register": 20,
+    "Mutation.login": 20,
+    "Mutation.createProject": 10,
+    "Mutation.updateProject": 10,
+    "Mutation.deleteProject": 10,
+    "Mutation.createTask": 10,
+    "Mutation.assignTask": 10,
+    "Mutation.updateTaskStatus": 10,
+    "Mutation.deleteTask": 10,
+    "Mutation.addTaskComment": 10,
+    "Mutation.addProjectComment": 10,
+    "Mutation.createEvent": 10,
+    "Mutation.cancelEventOccurrence": 10,
+    "Mutation.overrideEventOccurrence": 10,
+    "Mutation.createTasks": 50,
+    "Mutation.assignTasks": 50,
+    "Subscription.taskChanged": 10,
+    "Subscription.projectChanged": 10,
+}
+
+OBJECT_FIELD_COST = 1
+SCALAR_FIELD_COST = 0
+
+
+class CostBudget:
+    """사용자별 쿼리 비용 예산 (토큰 버킷)
+
+    `capacity` 만큼 채워져 있고 초당 `capacity / window` 씩 회복된다.
+    워커 프로세스마다 따로 유지되는 근사치다.
+    """
+
+    def __init__(self, capacity: int, window: float, maxsize: int = 10000):
+        self.capacity = capacity
+        self.refill_rate = capacity / window
+        # key -> (tokens, updated_at)
+        self._buckets = TTLCache(maxsize, ttl=window)
+
+    def consume(self, key: str, cost: int) -> Dict[str, Any]:
+        now = time.monotonic()
+        tokens, updated_at = self._buckets.get(key, (float(self.capacity), now))
+        tokens = min(self.capacity, tokens + (now - updated_at) * self.refill_rate)
+
+        allowed = cost <= tokens
+        if allowed:
+            tokens -= cost
+        self._buckets.set(key, (tokens, now))
+
+        return {
+            "allowed": allowed,
+            "remaining": int(tokens),
+            "capacity": self.capacity,
+            "retry_after": (
+                0 if allowed else round((cost - tokens) / self.refill_rate, 1)
+            ),
+        }
+
+
+cost_budget = CostBudget(
+    capacity=settings.GRAPHQL_COST_BUDGET,
+    window=settings.GRAPHQL_COST_BUDGET_WINDOW,
+)
+
+
+def calculate_cost(
+    schema,
+    operation: OperationDefinitionNode,
+    fragments: Dict[str, FragmentDefinitionNode],
+    variables: Optional[Dict[str, Any]] = None,
+) -> int:
+    """선택 집합을 따라가며 필드 가중치 × 목록 크기를 합산
+
+    `first` 인자가 있는 필드는 그 값(없으면 기본 페이지 크기)을, 그 외 목록 필드는
+    기본 페이지 크기를 하위 비용의 배수로 쓴다. Connection의 `edges`는 이미
+    `first`로 곱해졌으므로 다시 곱하지 않는다.
+    """
+    variables = variables or {}
+    root_type = schema.get_root_type(operation.operation)
+
+    def multiplier(node: FieldNode) -> int:
+        for argument in node.arguments:
+            if argument.name.value == "first":
+                value = value_from_ast_untyped(argument.value, variables)
+                if value is None:
+                    break
+                return max(0, min(int(value), MAX_PAGE_SIZE))
+        return DEFAULT_PAGE_SIZE
+
+    def walk(
+        selection_set: Optional[SelectionSetNode], parent: GraphQLObjectType
+    ) -> int:
+        if selection_set is None:
+            return 0
+
+        total = 0
+        for selection in selection_set.selections:
+            if isinstance(selection, FieldNode):
+                name = selection.name.value
+                if name.startswith("__"):
+                    continue
+                field = parent.fields.get(name)
+                if field is None:
+                    continue
+
+                field_type = field.type
+                if isinstance(field_type, GraphQLNonNull):
+                    field_type = field_type.of_type
+                named_type = get_named_type(field_type)
+
+                if not isinstance(named_type, GraphQLObjectType):
+                    total += FIELD_COSTS.get(f"{parent.name}.{name}", SCALAR_FIELD_COST)
+                    continue
+
+                child_cost = walk(selection.selection_set, named_type)
+                if named_type.name.endswith("Connection"):
+                    child_cost *= multiplier(selection)
+                elif isinstance(field_type, GraphQLList) and not parent.name.endswith(
+                    "Connection"
+                ):
+                    child_cost *= multiplier(selection)
+
+                total += FIELD_COSTS.get(f"{parent.name}.{name}", OBJECT_FIELD_COST)
+                total += child_cost
+
+            elif isinstance(selection, InlineFragmentNode):
+                fragment_type = parent
+                if selection.type_condition is not None:
+                    fragment_type = schema.get_type(selection.type_condition.name.value)
+                total += walk(selection.selection_set, fragment_type)
+
+            elif isinstance(selection, FragmentSpreadNode):
+                fragment = fragments.get(selection.name.value)
+                if fragment is not None:
+                    fragment_type = schema.get_type(fragment.type_condition.name.value)
+                    total += walk(fragment.selection_set, fragment_type)
+
+        return total
+
+    return walk(operation.selection_set, root_type)
+
+
+class QueryCostLimiter(SchemaExtension):
+    """실행 전에 쿼리 비용을 계산해 한도/예산을 넘으면 거절
+
+    계산된 비용과 남은 예산은 응답의 `extensions.cost`로 돌려준다.
+    """
+
+    def __init__(self, *, execution_context=None):
+        super().__init__(execution_context=execution_context)
+        self.max_cost = settings.GRAPHQL_MAX_QUERY_COST
+        self.cost: Optional[Dict[str, Any]] = None
+
+    def on_execute(self):
+        execution_context = self.execution_context
+        document = execution_context.graphql_document
+        operation = get_operation_ast(document, execution_context.operation_name)
+
+        if operation is not None:
+            fragments = {
+                definition.name.value: definition
+                for definition in document.definitions
+                if isinstance(definition, FragmentDefinitionNode)
+            }
+            cost = calculate_cost(
+                execution_context.schema._schema,
+                operation,
+                fragments,
+                execution_context.variables,
+            )
+            self.cost = {"requested": cost, "maximum": self.max_cost}
+
+            if cost > self.max_cost:
+                execution_context.result = self._reject(
+                    f"Query cost {cost} exceeds maximum allowed cost {self.max_cost}",
+                    "QUERY_TOO_EXPENSIVE",
+                )
+            else:
+                budget = cost_budget.consume(self._budget_key(), cost)
+                self.cost["budget"] = {
+                    "remaining": budget["remaining"],
+                    "capacity": budget["capacity"],
+                }
+                if not budget["allowed"]:
+                    self.cost["budget"]["retryAfter"] = budget["retry_after"]
+                    execution_context.result = self._reject(
+                        "Query cost budget exceeded, retry after "
+                        f"{budget['retry_after']} seconds",
+                        "QUERY_BUDGET_EXCEEDED",
+                    )
+
+        yield
+
+    def get_results(self) -> Dict[str, Any]:
+        if self.cost is None:
+            return {}
+        return {"cost": self.cost}
+
+    def _budget_key(self) -> str:
+        context = self.execution_context.context or {}
+        current_user = context.get("current_user")
+        if current_user is not None:
+            return f"user:{current_user.id}"
+
+        request = context.get("request")
+        client = getattr(request, "client", None)
+        return f"anonymous:{client.host if client else 'unknown'}"
+
+    def _reject(self, message: str, code: str) -> ExecutionResult:
+        return ExecutionResult(
+            data=None,
+            errors=[GraphQLError(message, extensions={"code": code})],
+        )
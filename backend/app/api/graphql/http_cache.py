@@ -0,0 +1,220 @@
+import hashlib
+import json
+from enum import Enum
+from typing import Dict, Optional, Tuple
+
+import strawberry
+from fastapi import Response, status
+from graphql import (
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    GraphQLObjectType,
+    InlineFragmentNode,
+    OperationDefinitionNode,
+    OperationType,
+    SelectionSetNode,
+    get_named_type,
+    get_operation_ast,
+)
+from strawberry.extensions import SchemaExtension
+from strawberry.fastapi import GraphQLRouter
+from strawberry.schema.schema_converter import GraphQLCoreConverter
+from strawberry.schema_directive import Location
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+
+
+@strawberry.enum
+class CacheScope(Enum):
+    PUBLIC = "public"
+    PRIVATE = "private"
+
+
+@strawberry.schema_directive(name="cacheControl", locations=[Location.FIELD_DEFINITION])
+class CacheControl:
+    """필드 결과를 HTTP 캐시에 둘 수 있는 시간(초)과 범위
+
+    PUBLIC은 인증된 사용자 누구에게나 같은 결과(응답은 Authorization 별로
+    캐시된다), PRIVATE는 사용자마다 다른 결과다.
+    """
+
+    max_age: int
+    scope: CacheScope = CacheScope.PUBLIC
+
+
+# (max_age, scope); max_age 0이면 캐시 불가
+CachePolicy = Tuple[int, CacheScope]
+
+# 같은 문서의 정책은 변수와 무관하므로 (문서, 연산 이름)별로 한 번만 계산
+_policy_cache = TTLCache(maxsize=settings.GRAPHQL_DOCUMENT_CACHE_SIZE)
+
+
+def _field_hint(field) -> Optional[CacheControl]:
+    definition = field.extensions.get(GraphQLCoreConverter.DEFINITION_BACKREF)
+    for directive in getattr(definition, "directives", None) or ():
+        if isinstance(directive, CacheControl):
+            return directive
+    return None
+
+
+def calculate_cache_policy(
+    schema,
+    operation: OperationDefinitionNode,
+    fragments: Dict[str, FragmentDefinitionNode],
+) -> CachePolicy:
+    """선택된 필드의 힌트를 합쳐 응답 전체의 정책을 계산
+
+    max_age는 가장 짧은 힌트, 범위는 PRIVATE가 하나라도 있으면 PRIVATE다.
+    힌트가 없는 루트 필드는 캐시 불가(0)이고, 힌트가 없는 하위 필드는 상위
+    필드의 정책을 그대로 따른다.
+    """
+    root_type = schema.get_root_type(operation.operation)
+    max_age: Optional[int] = None
+    scope = CacheScope.PUBLIC
+
+    def walk(
+        selection_set: Optional[SelectionSetNode],
+        parent: GraphQLObjectType,
+        is_root: bool,
+    ) -> None:
+        nonlocal max_age, scope
+        if selection_set is None:
+            return
+
+        for selection in selection_set.selections:
+            if isinstance(selection, FieldNode):
+                name = selection.name.value
+                if name.startswith("__"):
+                    continue
+                field = parent.fields.get(name)
+                if field is None:
+                    continue
+
+                hint = _field_hint(field)
+                if hint is not None:
+                    max_age = (
+                        hint.max_age if max_age is None else min(max_age, hint.max_age)
+                    )
+                    if hint.scope == CacheScope.PRIVATE:
+                        scope = CacheScope.PRIVATE
+                elif is_root:
+                    max_age = 0
+
+                named_type = get_named_type(field.type)
+                if isinstance(named_type, GraphQLObjectType):
+                    walk(selection.selection_set, named_type, False)
+
+            elif isinstance(selection, InlineFragmentNode):
+                fragment_type = parent
+                if selection.type_condition is not None:
+                    fragment_type = schema.get_type(selection.type_condition.name.value)
+                walk(selection.selection_set, fragment_type, is_root)
+
+            elif isinstance(selection, FragmentSpreadNode):
+                fragment = fragments.get(selection.name.value)
+                if fragment is not None:
+                    fragment_type = schema.get_type(fragment.type_condition.name.value)
+                    walk(fragment.selection_set, fragment_type, is_root)
+
+    walk(operation.selection_set, root_type, True)
+    return (max_age or 0, scope)
+
+
+def compute_etag(data) -> str:
+    """결과 데이터의 강한 ETag (extensions의 예산 등 요청마다 바뀌는 값은 제외)"""
+    raw = json.dumps(data, separators=(",", ":"), default=str)
+    return '"{}"'.format(hashlib.sha256(raw.encode()).hexdigest()[:32])
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    # If-None-Match는 약한 비교를 쓴다
+    candidates = {
+        value.strip().removeprefix("W/") for value in if_none_match.split(",")
+    }
+    return "*" in candidates or etag in candidates
+
+
+class HTTPCaching(SchemaExtension):
+    """GET 쿼리 응답에 Cache-Control/ETag를 붙이고 조건부 요청이면 304로 표시
+
+    헤더는 FastAPI 하위 응답에 쓰고, 본문 생략은 CachingGraphQLRouter가 한다.
+    오류가 있는 응답은 저장하지 못하게 한다. 힌트가 없는 응답도 ETag로
+    재검증은 할 수 있도록 `no-cache`를 쓴다.
+    """
+
+    def on_execute(self):
+        yield
+
+        execution_context = self.execution_context
+        context = execution_context.context
+        if not isinstance(context, dict):
+            return
+        request = context.get("request")
+        response = context.get("response")
+        if request is None or response is None or request.method != "GET":
+            return
+
+        result = execution_context.result
+        if result is None or result.errors or result.data is None:
+            response.headers["Cache-Control"] = "no-store"
+            return
+
+        max_age, scope = self._policy()
+        response.headers["Cache-Control"] = (
+            f"{scope.value}, max-age={max_age}" if max_age > 0 else "private, no-cache"
+        )
+        # 모든 쿼리는 인증 사용자 기준으로 실행되므로 토큰별로 따로 캐시
+        response.headers["Vary"] = "Authorization"
+
+        etag = compute_etag(result.data)
+        response.headers["ETag"] = etag
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            response.status_code = status.HTTP_304_NOT_MODIFIED
+
+    def _policy(self) -> CachePolicy:
+        execution_context = self.execution_context
+        key = (execution_context.query, execution_context.operation_name)
+        policy = _policy_cache.get(key)
+        if policy is not None:
+            return policy
+
+        document = execution_context.graphql_document
+        operation = get_operation_ast(document, execution_context.operation_name)
+        if operation is None or operation.operation != OperationType.QUERY:
+            policy = (0, CacheScope.PRIVATE)
+        else:
+            fragments = {
+                definition.name.value: definition
+                for definition in document.definitions
+                if isinstance(definition, FragmentDefinitionNode)
+            }
+            policy = calculate_cache_policy(
+                execution_context.schema._schema, operation, fragments
+            )
+        _policy_cache.set(key, policy)
+        return policy
+
+
+class CachingGraphQLRouter(GraphQLRouter):
+    """HTTPCaching이 304로 표시한 응답은 본문을 직렬화하지 않고 돌려준다
+
+    `query` 없이 `extensions`에 persistedQuery만 실은 GET(APQ 해시 조회)은
+    GraphiQL 화면이 아니라 실행 요청으로 처리한다.
+    """
+
+    def should_render_graphql_ide(self, request) -> bool:
+        extensions = request.query_params.get("extensions")
+        if extensions and "persistedQuery" in extensions:
+            return False
+        return super().should_render_graphql_ide(request)
+
+    def create_response(self, response_data, sub_response: Response) -> Response:
+        if sub_response.status_code == status.HTTP_304_NOT_MODIFIED:
+            response = Response(status_code=status.HTTP_304_NOT_MODIFIED)
+            response.headers.raw.extend(sub_response.headers.raw)
+            return response
+        return super().create_response(response_data, sub_response)
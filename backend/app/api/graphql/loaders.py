@@ -0,0 +1,96 @@
+import asyncio
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from strawberry.dataloader import DataLoader
+
+from app.models.calendar import Calendar
+from app.models.project import Project, ProjectMember
+from app.models.task import Task, TaskAssignment
+from app.models.user import User
+
+
+class Loaders:
+    """요청 단위 DataLoader 모음
+
+    같은 이벤트 루프 틱에서 요청된 키를 모아 `IN (...)` 쿼리 한 번으로 조회한다.
+    요청마다 새로 생성되므로 캐시는 요청이 끝나면 함께 사라진다.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        # AsyncSession은 동시 실행을 허용하지 않으므로 배치 쿼리를 직렬화
+        self._lock = asyncio.Lock()
+
+        self.user_by_id: DataLoader[int, Optional[User]] = DataLoader(
+            load_fn=self._load_users
+        )
+        self.project_by_id: DataLoader[int, Optional[Project]] = DataLoader(
+            load_fn=self._load_projects
+        )
+        self.task_by_id: DataLoader[int, Optional[Task]] = DataLoader(
+            load_fn=self._load_tasks
+        )
+        self.calendar_by_id: DataLoader[int, Optional[Calendar]] = DataLoader(
+            load_fn=self._load_calendars
+        )
+        self.members_by_project_id: DataLoader[int, List[User]] = DataLoader(
+            load_fn=self._load_project_members
+        )
+        self.assignees_by_task_id: DataLoader[int, List[User]] = DataLoader(
+            load_fn=self._load_task_assignees
+        )
+
+    async def _load_users(self, keys: List[int]) -> List[Optional[User]]:
+        async with self._lock:
+            result = await self.db.execute(select(User).where(User.id.in_(keys)))
+        users = {user.id: user for user in result.scalars()}
+        return [users.get(key) for key in keys]
+
+    async def _load_projects(self, keys: List[int]) -> List[Optional[Project]]:
+        async with self._lock:
+            result = await self.db.execute(select(Project).where(Project.id.in_(keys)))
+        projects = {project.id: project for project in result.scalars()}
+        return [projects.get(key) for key in keys]
+
+    async def _load_tasks(self, keys: List[int]) -> List[Optional[Task]]:
+        async with self._lock:
+            result = await self.db.execute(select(Task).where(Task.id.in_(keys)))
+        tasks = {task.id: task for task in result.scalars()}
+        return [tasks.get(key) for key in keys]
+
+    async def _load_calendars(self, keys: List[int]) -> List[Optional[Calendar]]:
+        async with self._lock:
+            result = await self.db.execute(
+                select(Calendar).where(Calendar.id.in_(keys))
+            )
+        calendars = {calendar.id: calendar for calendar in result.scalars()}
+        return [calendars.get(key) for key in keys]
+
+    async def _load_project_members(self, keys: List[int]) -> List[List[User]]:
+        async with self._lock:
+            result = await self.db.execute(
+                select(ProjectMember.project_id, User)
+                .join(User, User.id == ProjectMember.user_id)
+                .where(ProjectMember.project_id.in_(keys))
+            )
+        return self._group_users(result.all(), keys)
+
+    async def _load_task_assignees(self, keys: List[int]) -> List[List[User]]:
+        async with self._lock:
+            result = await self.db.execute(
+                select(TaskAssignment.task_id, User)
+                .join(User, User.id == TaskAssignment.user_id)
+                .where(TaskAssignment.task_id.in_(keys))
+            )
+        return self._group_users(result.all(), keys)
+
+    def _group_users(self, rows, keys: List[int]) -> List[List[User]]:
+        grouped: Dict[int, List[User]] = defaultdict(list)
+        for key, user in rows:
+            grouped[key].append(user)
+            # 이후 creator 등 단건 조회가 추가 쿼리 없이 끝나도록 캐시에 적재
+            self.user_by_id.prime(user.id, user)
+        return [grouped.get(key, []) for key in keys]
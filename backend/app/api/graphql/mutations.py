@@ -1,27 +1,44 @@
-from typing import Optional
+from datetime import datetime
+from typing import List, Optional
 
 import strawberry
 from app.api.graphql.types import (
+    AssignTasksPayload,
+    BatchError,
     Comment,
+    CreateTasksPayload,
     CommentInput,
     Event,
     EventInput,
+    EventOccurrenceInput,
     Project,
     ProjectInput,
     Task,
+    TaskAssignment,
+    TaskAssignmentInput,
     TaskInput,
+    TaskStatusEnum,
     User,
     UserInput,
 )
-from app.core.dependencies import get_current_active_user, get_db
-from app.core.security import create_access_token, get_password_hash, verify_password
+from app.api.graphql.context import get_context_user
+from app.api.graphql.response_cache import project_tag, response_cache, user_tag
+from app.core.change_hub import publish_project_change, publish_task_change
+from app.core.config import settings
+from app.core.hashing import password_hasher
+from app.core.security import create_access_token
 from app.models import calendar as calendar_models
 from app.models import project as project_models
 from app.models import task as task_models
 from app.models import user as user_models
-from fastapi import Depends, HTTPException
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from app.services.calendar_service import CalendarService
+from app.services.comment_service import CommentModel, CommentService
+from app.services.project_service import ProjectService
+from app.services.stats_service import StatsService
+from app.services.task_service import TaskService
+from fastapi import HTTPException
+from sqlalchemy import func, select
+from strawberry.types import Info
 
 # from app.utils.logger import log_user_activity
 try:
@@ -42,9 +59,9 @@ class AuthResponse:
 @strawberry.type
 class Mutation:
     @strawberry.field
-    async def register(
-        self, info, user_input: UserInput, db: AsyncSession = Depends(get_db)
-    ) -> AuthResponse:
+    async def register(self, info: Info, user_input: UserInput) -> AuthResponse:
+        db = info.context["db"]
+
         # 이메일 중복 확인
         existing_user = await db.execute(
             select(user_models.User).where(user_models.User.email == user_input.email)
@@ -62,21 +79,24 @@ class Mutation:
             raise HTTPException(status_code=400, detail="Username already taken")
 
         # 새 사용자 생성
-        hashed_password = get_password_hash(user_input.password)
+        hashed_password = await password_hasher.hash(user_input.password)
         new_user = user_models.User(
             email=user_input.email,
             username=user_input.username,
             full_name=user_input.full_name,
             hashed_password=hashed_password,
-            role=user_input.role,
+            role=user_models.UserRole(user_input.role.value),
             phone=user_input.phone,
             department=user_input.department,
             position=user_input.position,
         )
 
         db.add(new_user)
+        # id/created_at은 INSERT ... RETURNING으로 채워진다
+        await db.flush()
+        await StatsService.user_created(db, new_user.id)
         await db.commit()
-        await db.refresh(new_user)
+        await response_cache.invalidate(["users"])
 
         # JWT 토큰 생성
         access_token = create_access_token(subject=new_user.id)
@@ -89,31 +109,19 @@ class Mutation:
         )
 
         return AuthResponse(
-            user=User(
-                id=new_user.id,
-                email=new_user.email,
-                username=new_user.username,
-                full_name=new_user.full_name,
-                role=new_user.role,
-                avatar_url=new_user.avatar_url,
-                phone=new_user.phone,
-                department=new_user.department,
-                position=new_user.position,
-                is_active=new_user.is_active,
-                created_at=new_user.created_at,
-                updated_at=new_user.updated_at,
-            ),
+            user=User.from_model(new_user),
             access_token=access_token,
         )
 
     @strawberry.field
     async def login(
         self,
-        info,
+        info: Info,
         username_or_email: str,
         password: str,
-        db: AsyncSession = Depends(get_db),
     ) -> AuthResponse:
+        db = info.context["db"]
+
         # 사용자 찾기 (이메일 또는 사용자명으로)
         user_result = await db.execute(
             select(user_models.User).where(
@@ -123,7 +131,9 @@ class Mutation:
         )
         user = user_result.scalar_one_or_none()
 
-        if not user or not verify_password(password, user.hashed_password):
+        if not user or not await password_hasher.verify(
+            password, user.hashed_password
+        ):
             raise HTTPException(
                 status_code=400, detail="Incorrect email/username or password"
             )
@@ -146,35 +156,23 @@ class Mutation:
         )
 
         return AuthResponse(
-            user=User(
-                id=user.id,
-                email=user.email,
-                username=user.username,
-                full_name=user.full_name,
-                role=user.role,
-                avatar_url=user.avatar_url,
-                phone=user.phone,
-                department=user.department,
-                position=user.position,
-                is_active=user.is_active,
-                created_at=user.created_at,
-                updated_at=user.updated_at,
-            ),
+            user=User.from_model(user),
             access_token=access_token,
         )
 
     @strawberry.field
     async def create_project(
         self,
-        info,
+        info: Info,
         project_input: ProjectInput,
-        db: AsyncSession = Depends(get_db),
-        current_user: user_models.User = Depends(get_current_active_user),
     ) -> Project:
+        db = info.context["db"]
+        current_user = get_context_user(info)
+
         new_project = project_models.Project(
             name=project_input.name,
             description=project_input.description,
-            status=project_input.status,
+            status=project_models.ProjectStatus(project_input.status.value),
             priority=project_input.priority,
             start_date=project_input.start_date,
             end_date=project_input.end_date,
@@ -183,15 +181,19 @@ class Mutation:
         )
 
         db.add(new_project)
-        await db.commit()
-        await db.refresh(new_project)
+        # 멤버 행에 쓸 id만 먼저 받는다 (커밋은 마지막에 한 번)
+        await db.flush()
 
         # 프로젝트 생성자를 멤버로 추가
         project_member = project_models.ProjectMember(
             project_id=new_project.id, user_id=current_user.id, role="lead"
         )
         db.add(project_member)
+        await StatsService.project_created(db, new_project, [current_user.id])
         await db.commit()
+        # 구독자 알림은 커밋된 변경만 (롤백된 변경이 나가지 않도록)
+        await publish_project_change("created", new_project, user_id=current_user.id)
+        await response_cache.invalidate([user_tag(current_user.id)])
 
         # 활동 로그
         log_user_activity(
@@ -202,59 +204,19 @@ class Mutation:
             description=f"Created project: {new_project.name}",
         )
 
-        return Project(
-            id=new_project.id,
-            name=new_project.name,
-            description=new_project.description,
-            status=new_project.status,
-            priority=new_project.priority,
-            start_date=new_project.start_date,
-            end_date=new_project.end_date,
-            progress=new_project.progress,
-            budget=new_project.budget,
-            created_at=new_project.created_at,
-            updated_at=new_project.updated_at,
-            creator=User(
-                id=current_user.id,
-                email=current_user.email,
-                username=current_user.username,
-                full_name=current_user.full_name,
-                role=current_user.role,
-                avatar_url=current_user.avatar_url,
-                phone=current_user.phone,
-                department=current_user.department,
-                position=current_user.position,
-                is_active=current_user.is_active,
-                created_at=current_user.created_at,
-                updated_at=current_user.updated_at,
-            ),
-            members=[
-                User(
-                    id=current_user.id,
-                    email=current_user.email,
-                    username=current_user.username,
-                    full_name=current_user.full_name,
-                    role=current_user.role,
-                    avatar_url=current_user.avatar_url,
-                    phone=current_user.phone,
-                    department=current_user.department,
-                    position=current_user.position,
-                    is_active=current_user.is_active,
-                    created_at=current_user.created_at,
-                    updated_at=current_user.updated_at,
-                )
-            ],
-        )
+        # Creator/Members는 DataLoader로 조회
+        return Project.from_model(new_project)
 
     @strawberry.field
     async def update_project(
         self,
-        info,
+        info: Info,
         project_id: int,
         project_input: ProjectInput,
-        db: AsyncSession = Depends(get_db),
-        current_user: user_models.User = Depends(get_current_active_user),
     ) -> Optional[Project]:
+        db = info.context["db"]
+        current_user = get_context_user(info)
+
         project_result = await db.execute(
             select(project_models.Project).where(
                 project_models.Project.id == project_id
@@ -269,12 +231,13 @@ class Mutation:
         # 권한 로직 구현 필요...
 
         # 프로젝트 업데이트
+        old_status = project.status
         if project_input.name:
             project.name = project_input.name
         if project_input.description is not None:
             project.description = project_input.description
         if project_input.status:
-            project.status = project_input.status
+            project.status = project_models.ProjectStatus(project_input.status.value)
         if project_input.priority:
             project.priority = project_input.priority
         if project_input.start_date:
@@ -284,8 +247,20 @@ class Mutation:
         if project_input.budget is not None:
             project.budget = project_input.budget
 
+        await StatsService.project_status_changed(
+            db, project.id, old_status, project.status
+        )
+        # 상태가 바뀌면 멤버들의 대시보드 카운터도 바뀐다
+        member_ids = (
+            await ProjectService.get_project_member_ids(db, project.id)
+            if project.status != old_status
+            else []
+        )
         await db.commit()
-        await db.refresh(project)
+        await publish_project_change("updated", project)
+        await response_cache.invalidate(
+            [project_tag(project.id), *map(user_tag, member_ids)]
+        )
 
         # 활동 로그
         log_user_activity(
@@ -296,19 +271,17 @@ class Mutation:
             description=f"Updated project: {project.name}",
         )
 
-        # Creator와 Members 로드하여 반환 (구현 필요)
-        # ...
-
-        return None  # 임시 반환
+        return Project.from_model(project)
 
     @strawberry.field
     async def delete_project(
         self,
-        info,
+        info: Info,
         project_id: int,
-        db: AsyncSession = Depends(get_db),
-        current_user: user_models.User = Depends(get_current_active_user),
     ) -> bool:
+        db = info.context["db"]
+        current_user = get_context_user(info)
+
         project_result = await db.execute(
             select(project_models.Project).where(
                 project_models.Project.id == project_id
@@ -323,8 +296,14 @@ class Mutation:
         if project.creator_id != current_user.id:
             raise HTTPException(status_code=403, detail="Not enough permissions")
 
+        # 멤버와 담당자의 대시보드 카운터가 바뀐다
+        affected_user_ids = await StatsService.project_deleted(db, project)
         await db.delete(project)
         await db.commit()
+        await publish_project_change("deleted", project)
+        await response_cache.invalidate(
+            [project_tag(project.id), *map(user_tag, affected_user_ids)]
+        )
 
         # 활동 로그
         log_user_activity(
@@ -340,11 +319,12 @@ class Mutation:
     @strawberry.field
     async def create_task(
         self,
-        info,
+        info: Info,
         task_input: TaskInput,
-        db: AsyncSession = Depends(get_db),
-        current_user: user_models.User = Depends(get_current_active_user),
     ) -> Task:
+        db = info.context["db"]
+        current_user = get_context_user(info)
+
         # 프로젝트 존재 확인
         project_result = await db.execute(
             select(project_models.Project).where(
@@ -359,7 +339,7 @@ class Mutation:
         new_task = task_models.Task(
             title=task_input.title,
             description=task_input.description,
-            status=task_input.status,
+            status=task_models.TaskStatus(task_input.status.value),
             priority=task_input.priority,
             project_id=task_input.project_id,
             estimated_hours=task_input.estimated_hours,
@@ -369,8 +349,11 @@ class Mutation:
         )
 
         db.add(new_task)
+        await StatsService.task_created(db, new_task)
         await db.commit()
-        await db.refresh(new_task)
+        await publish_task_change("created", new_task)
+        # 프로젝트 목록의 진행률/작업 수
+        await response_cache.invalidate([project_tag(new_task.project_id)])
 
         # 활동 로그
         log_user_activity(
@@ -381,20 +364,19 @@ class Mutation:
             description=f"Created task: {new_task.title}",
         )
 
-        # Task 반환 (Project, Assignees 포함) - 구현 필요
-        # ...
-
-        return None  # 임시 반환
+        # Project/Assignees는 DataLoader로 조회
+        return Task.from_model(new_task)
 
     @strawberry.field
     async def assign_task(
         self,
-        info,
+        info: Info,
         task_id: int,
         user_id: int,
-        db: AsyncSession = Depends(get_db),
-        current_user: user_models.User = Depends(get_current_active_user),
     ) -> bool:
+        db = info.context["db"]
+        current_user = get_context_user(info)
+
         # Task 존재 확인
         task_result = await db.execute(
             select(task_models.Task).where(task_models.Task.id == task_id)
@@ -432,7 +414,11 @@ class Mutation:
         )
 
         db.add(assignment)
+        await StatsService.task_assigned(db, task, user_id)
         await db.commit()
+        await publish_task_change("updated", task)
+        # 담당자의 대시보드 작업 카운터
+        await response_cache.invalidate([user_tag(user_id)])
 
         # 활동 로그
         log_user_activity(
@@ -444,3 +430,421 @@ class Mutation:
         )
 
         return True
+
+    @strawberry.field
+    async def create_tasks(
+        self,
+        info: Info,
+        inputs: List[TaskInput],
+    ) -> CreateTasksPayload:
+        db = info.context["db"]
+        current_user = get_context_user(info)
+        _check_batch_size(inputs)
+
+        # 프로젝트 확인 1회 + 다중 행 INSERT 1회 + 커밋 1회
+        created, errors = await TaskService.create_tasks(
+            db,
+            [
+                {
+                    "title": task_input.title,
+                    "description": task_input.description,
+                    "status": task_models.TaskStatus(task_input.status.value),
+                    "priority": task_input.priority,
+                    "project_id": task_input.project_id,
+                    "estimated_hours": task_input.estimated_hours,
+                    "start_date": task_input.start_date,
+                    "due_date": task_input.due_date,
+                }
+                for task_input in inputs
+            ],
+            created_by=current_user.id,
+        )
+        await db.commit()
+
+        await response_cache.invalidate(
+            [project_tag(task.project_id) for _, task in created]
+        )
+        for _, task in created:
+            await publish_task_change("created", task)
+            log_user_activity(
+                user_id=current_user.id,
+                action="task_created",
+                resource_type="task",
+                resource_id=task.id,
+                description=f"Created task: {task.title}",
+            )
+
+        return CreateTasksPayload(
+            tasks=[Task.from_model(task) for _, task in created],
+            errors=_batch_errors(errors),
+        )
+
+    @strawberry.field
+    async def assign_tasks(
+        self,
+        info: Info,
+        pairs: List[TaskAssignmentInput],
+    ) -> AssignTasksPayload:
+        db = info.context["db"]
+        current_user = get_context_user(info)
+        _check_batch_size(pairs)
+
+        created, errors = await TaskService.assign_tasks(
+            db,
+            [(pair.task_id, pair.user_id) for pair in pairs],
+            assigned_by=current_user.id,
+        )
+        await db.commit()
+
+        # 작업은 서비스에서 이미 읽어 세션에 있으므로 추가 조회 없음
+        for task_id in sorted({assignment.task_id for _, assignment in created}):
+            await publish_task_change("updated", await db.get(task_models.Task, task_id))
+        await response_cache.invalidate(
+            [user_tag(assignment.user_id) for _, assignment in created]
+        )
+
+        for _, assignment in created:
+            log_user_activity(
+                user_id=current_user.id,
+                action="task_assigned",
+                resource_type="task",
+                resource_id=assignment.task_id,
+                description=f"Assigned task to user {assignment.user_id}",
+            )
+
+        return AssignTasksPayload(
+            assignments=[
+                TaskAssignment.from_model(assignment) for _, assignment in created
+            ],
+            errors=_batch_errors(errors),
+        )
+
+    @strawberry.field
+    async def update_task_status(
+        self,
+        info: Info,
+        task_id: int,
+        status: TaskStatusEnum,
+    ) -> Task:
+        db = info.context["db"]
+        current_user = get_context_user(info)
+
+        # 프로젝트 생성자/멤버만 상태를 바꿀 수 있다 (다른 프로젝트의 작업은 404)
+        task = await TaskService.get_task_by_id(db, task_id, user_id=current_user.id)
+        if not task:
+            raise HTTPException(status_code=404, detail="Task not found")
+
+        # 프로젝트 진행률/상태별 작업 수도 같은 트랜잭션에서 갱신
+        await TaskService.update_task_status(
+            db, task, task_models.TaskStatus(status.value)
+        )
+        assignee_ids = await TaskService.get_task_assignee_ids(db, task.id)
+        await db.commit()
+        await publish_task_change("updated", task)
+        await response_cache.invalidate(
+            [project_tag(task.project_id), *map(user_tag, assignee_ids)]
+        )
+
+        # 활동 로그
+        log_user_activity(
+            user_id=current_user.id,
+            action="task_status_changed",
+            resource_type="task",
+            resource_id=task.id,
+            description=f"Changed task status: {task.title} -> {status.value}",
+        )
+
+        return Task.from_model(task)
+
+    @strawberry.field
+    async def delete_task(
+        self,
+        info: Info,
+        task_id: int,
+    ) -> bool:
+        db = info.context["db"]
+        current_user = get_context_user(info)
+
+        task = await TaskService.get_task_by_id(db, task_id)
+        if not task:
+            raise HTTPException(status_code=404, detail="Task not found")
+
+        # 권한 확인 (작업 생성자 또는 프로젝트 생성자만 삭제 가능)
+        if task.created_by != current_user.id:
+            project = await ProjectService.get_project_by_id(db, task.project_id)
+            if project.creator_id != current_user.id:
+                raise HTTPException(status_code=403, detail="Not enough permissions")
+
+        assignee_ids = await TaskService.get_task_assignee_ids(db, task.id)
+        await TaskService.delete_task(db, task)
+        await db.commit()
+        await publish_task_change("deleted", task)
+        await response_cache.invalidate(
+            [project_tag(task.project_id), *map(user_tag, assignee_ids)]
+        )
+
+        # 활동 로그
+        log_user_activity(
+            user_id=current_user.id,
+            action="task_deleted",
+            resource_type="task",
+            resource_id=task_id,
+            description=f"Deleted task: {task.title}",
+        )
+
+        return True
+
+    @strawberry.field
+    async def add_task_comment(
+        self,
+        info: Info,
+        task_id: int,
+        comment_input: CommentInput,
+    ) -> Comment:
+        db = info.context["db"]
+        current_user = get_context_user(info)
+
+        if not comment_input.content.strip():
+            raise HTTPException(status_code=400, detail="Content is required")
+
+        # 접근할 수 없는 프로젝트의 작업은 없는 것으로 본다
+        task = await TaskService.get_task_by_id(db, task_id, user_id=current_user.id)
+        if not task:
+            raise HTTPException(status_code=404, detail="Task not found")
+
+        await _check_parent_comment(
+            db,
+            task_models.TaskComment,
+            comment_input.parent_id,
+            lambda parent: parent.task_id == task_id,
+        )
+
+        # 답글이면 상위 댓글 체인의 reply_count도 같은 트랜잭션에서 갱신
+        comment = await CommentService.add_comment(
+            db,
+            task_models.TaskComment(
+                task_id=task_id,
+                author_id=current_user.id,
+                content=comment_input.content,
+                parent_id=comment_input.parent_id,
+            ),
+        )
+        await db.commit()
+
+        # 활동 로그
+        log_user_activity(
+            user_id=current_user.id,
+            action="comment_created",
+            resource_type="task",
+            resource_id=task_id,
+            description=f"Commented on task: {task.title}",
+        )
+
+        return Comment.from_model(comment)
+
+    @strawberry.field
+    async def add_project_comment(
+        self,
+        info: Info,
+        project_id: int,
+        comment_input: CommentInput,
+    ) -> Comment:
+        db = info.context["db"]
+        current_user = get_context_user(info)
+
+        if not comment_input.content.strip():
+            raise HTTPException(status_code=400, detail="Content is required")
+
+        project = await ProjectService.get_project_by_id(
+            db, project_id, user_id=current_user.id
+        )
+        if not project:
+            raise HTTPException(status_code=404, detail="Project not found")
+
+        await _check_parent_comment(
+            db,
+            project_models.ProjectComment,
+            comment_input.parent_id,
+            lambda parent: parent.project_id == project_id,
+        )
+
+        comment = await CommentService.add_comment(
+            db,
+            project_models.ProjectComment(
+                project_id=project_id,
+                author_id=current_user.id,
+                content=comment_input.content,
+                parent_id=comment_input.parent_id,
+            ),
+        )
+        await db.commit()
+
+        # 활동 로그
+        log_user_activity(
+            user_id=current_user.id,
+            action="comment_created",
+            resource_type="project",
+            resource_id=project_id,
+            description=f"Commented on project: {project.name}",
+        )
+
+        return Comment.from_model(comment)
+
+    @strawberry.field
+    async def create_event(self, info: Info, event_input: EventInput) -> Event:
+        db = info.context["db"]
+        current_user = get_context_user(info)
+
+        if event_input.end_time < event_input.start_time:
+            raise HTTPException(
+                status_code=400, detail="`endTime` must not be before `startTime`"
+            )
+        calendar = await CalendarService.get_owned_calendar(
+            db, current_user.id, event_input.calendar_id
+        )
+        if not calendar:
+            raise HTTPException(status_code=404, detail="Calendar not found")
+
+        try:
+            event = await CalendarService.create_event(
+                db,
+                title=event_input.title,
+                description=event_input.description,
+                start_time=event_input.start_time,
+                end_time=event_input.end_time,
+                is_all_day=event_input.is_all_day,
+                location=event_input.location,
+                calendar_id=event_input.calendar_id,
+                project_id=event_input.project_id,
+                task_id=event_input.task_id,
+                rrule=event_input.rrule,
+                timezone=event_input.timezone or "UTC",
+                created_by=current_user.id,
+            )
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc))
+        await db.commit()
+
+        # 활동 로그
+        log_user_activity(
+            user_id=current_user.id,
+            action="event_created",
+            resource_type="event",
+            resource_id=event.id,
+            description=f"Created event: {event.title}",
+        )
+
+        return Event.from_model(event)
+
+    @strawberry.field
+    async def cancel_event_occurrence(
+        self, info: Info, event_id: int, recurrence_id: datetime
+    ) -> bool:
+        db = info.context["db"]
+        current_user = get_context_user(info)
+
+        event = await _get_owned_event(db, current_user.id, event_id)
+        try:
+            await CalendarService.set_occurrence_exception(
+                db, event, recurrence_id, is_cancelled=True
+            )
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc))
+        await db.commit()
+
+        # 활동 로그
+        log_user_activity(
+            user_id=current_user.id,
+            action="event_occurrence_cancelled",
+            resource_type="event",
+            resource_id=event_id,
+            description=f"Cancelled occurrence of event: {event.title}",
+        )
+
+        return True
+
+    @strawberry.field
+    async def override_event_occurrence(
+        self,
+        info: Info,
+        event_id: int,
+        recurrence_id: datetime,
+        occurrence_input: EventOccurrenceInput,
+    ) -> bool:
+        db = info.context["db"]
+        current_user = get_context_user(info)
+
+        # 시각을 옮길 때는 시작/종료를 함께 지정
+        if (occurrence_input.start_time is None) != (occurrence_input.end_time is None):
+            raise HTTPException(
+                status_code=400,
+                detail="`startTime` and `endTime` must be given together",
+            )
+        if (
+            occurrence_input.start_time is not None
+            and occurrence_input.end_time < occurrence_input.start_time
+        ):
+            raise HTTPException(
+                status_code=400, detail="`endTime` must not be before `startTime`"
+            )
+
+        event = await _get_owned_event(db, current_user.id, event_id)
+        try:
+            await CalendarService.set_occurrence_exception(
+                db,
+                event,
+                recurrence_id,
+                is_cancelled=False,
+                title=occurrence_input.title,
+                description=occurrence_input.description,
+                start_time=occurrence_input.start_time,
+                end_time=occurrence_input.end_time,
+                location=occurrence_input.location,
+            )
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc))
+        await db.commit()
+
+        # 활동 로그
+        log_user_activity(
+            user_id=current_user.id,
+            action="event_occurrence_updated",
+            resource_type="event",
+            resource_id=event_id,
+            description=f"Updated occurrence of event: {event.title}",
+        )
+
+        return True
+
+
+async def _get_owned_event(db, owner_id: int, event_id: int):
+    event = await CalendarService.get_owned_event(db, owner_id, event_id)
+    if event is None:
+        raise HTTPException(status_code=404, detail="Event not found")
+    return event
+
+
+async def _check_parent_comment(
+    db, model: CommentModel, parent_id: Optional[int], scope
+) -> None:
+    """답글 대상이 같은 작업/프로젝트의 댓글인지 확인"""
+    if parent_id is None:
+        return
+    parent = await CommentService.get_comment(db, model, parent_id)
+    if parent is None or not scope(parent):
+        raise HTTPException(status_code=404, detail="Parent comment not found")
+
+
+def _check_batch_size(items: list) -> None:
+    if len(items) > settings.BATCH_MUTATION_MAX_SIZE:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Batch size exceeds {settings.BATCH_MUTATION_MAX_SIZE} items",
+        )
+
+
+def _batch_errors(errors: dict) -> List[BatchError]:
+    return [
+        BatchError(index=index, message=message)
+        for index, message in sorted(errors.items())
+    ]
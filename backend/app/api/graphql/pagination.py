@@ -0,0 +1,104 @@
+import base64
+import binascii
+from datetime import datetime
+from typing import Any, Callable, Generic, List, Optional, Tuple, TypeVar
+
+import strawberry
+from fastapi import HTTPException
+from sqlalchemy import Select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+NodeType = TypeVar("NodeType")
+
+
+@strawberry.type
+class PageInfo:
+    has_next_page: bool
+    end_cursor: Optional[str] = None
+
+
+@strawberry.type
+class Edge(Generic[NodeType]):
+    cursor: str
+    node: NodeType
+
+
+@strawberry.type
+class Connection(Generic[NodeType]):
+    edges: List[Edge[NodeType]]
+    page_info: PageInfo
+
+
+def encode_cursor(created_at: datetime, id: int) -> str:
+    """(created_at, id) 정렬 키를 불투명 커서로 인코딩"""
+    raw = f"{created_at.isoformat()}|{id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        created_at, id = raw.rsplit("|", 1)
+        return datetime.fromisoformat(created_at), int(id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def encode_search_cursor(rank: float, kind: str, id: int) -> str:
+    """검색 결과 (rank, kind, id) 정렬 키를 커서로 인코딩"""
+    raw = f"{rank!r}|{kind}|{id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_search_cursor(cursor: str) -> Tuple[float, str, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        rank, kind, id = raw.split("|")
+        return float(rank), kind, int(id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+async def paginate(
+    db: AsyncSession,
+    query: Select,
+    model: Any,
+    to_node: Callable[[Any], NodeType],
+    first: int = DEFAULT_PAGE_SIZE,
+    after: Optional[str] = None,
+) -> Connection[NodeType]:
+    """(created_at, id) 키셋 페이지네이션
+
+    OFFSET 대신 마지막 커서 이후 행만 인덱스로 탐색하므로
+    몇 번째 페이지든 비용이 같고, 메모리는 페이지 크기에 비례한다.
+    """
+    if first < 1:
+        raise HTTPException(status_code=400, detail="`first` must be positive")
+    first = min(first, MAX_PAGE_SIZE)
+
+    sort_key = tuple_(model.created_at, model.id)
+    if after is not None:
+        query = query.where(sort_key < tuple_(*decode_cursor(after)))
+
+    # 다음 페이지 존재 여부 확인을 위해 한 행 더 조회
+    query = query.order_by(model.created_at.desc(), model.id.desc()).limit(first + 1)
+    result = await db.execute(query)
+    rows = result.scalars().all()
+
+    has_next_page = len(rows) > first
+    rows = rows[:first]
+
+    edges = [
+        Edge(cursor=encode_cursor(row.created_at, row.id), node=to_node(row))
+        for row in rows
+    ]
+    return Connection(
+        edges=edges,
+        page_info=PageInfo(
+            has_next_page=has_next_page,
+            end_cursor=edges[-1].cursor if edges else None,
+        ),
+    )
@@ -0,0 +1,103 @@
+import hashlib
+from typing import Any, Dict, Optional
+
+from graphql import GraphQLError
+from redis.exceptions import RedisError
+from strawberry.extensions import SchemaExtension
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.redis import get_redis
+from app.utils.logger import logger
+
+PERSISTED_QUERY_KEY = "pms:persisted_queries:{}"
+
+
+def query_hash(query: str) -> str:
+    return hashlib.sha256(query.encode()).hexdigest()
+
+
+class PersistedQueryRegistry:
+    """SHA-256 해시 → 쿼리 문서 저장소
+
+    워커 메모리의 LRU를 먼저 보고, 없으면 Redis에서 찾는다. Redis에 등록해
+    두면 다른 워커가 처음 받은 해시도 클라이언트 재전송 없이 처리된다.
+    """
+
+    def __init__(self, maxsize: int, ttl: Optional[int] = None):
+        self.ttl = ttl
+        self._local = TTLCache(maxsize)
+
+    async def get(self, sha256: str) -> Optional[str]:
+        query = self._local.get(sha256)
+        if query is not None:
+            return query
+
+        try:
+            query = await get_redis().get(PERSISTED_QUERY_KEY.format(sha256))
+        except RedisError as e:
+            logger.warning("Persisted query lookup failed", error=str(e))
+            return None
+
+        if query is not None:
+            self._local.set(sha256, query)
+        return query
+
+    async def register(self, sha256: str, query: str) -> None:
+        self._local.set(sha256, query)
+        try:
+            await get_redis().set(
+                PERSISTED_QUERY_KEY.format(sha256), query, ex=self.ttl
+            )
+        except RedisError as e:
+            logger.warning("Persisted query registration failed", error=str(e))
+
+    def stats(self) -> Dict[str, Any]:
+        return self._local.stats()
+
+
+persisted_query_registry = PersistedQueryRegistry(
+    maxsize=settings.PERSISTED_QUERY_CACHE_SIZE,
+    ttl=settings.PERSISTED_QUERY_TTL,
+)
+
+
+class PersistedQueries(SchemaExtension):
+    """자동 persisted query (Apollo APQ 프로토콜)
+
+    요청의 `extensions.persistedQuery.sha256Hash`만 오면 등록된 문서로 채워
+    실행하고, 모르는 해시면 `PERSISTED_QUERY_NOT_FOUND`를 돌려 클라이언트가
+    쿼리 본문과 함께 다시 보내게 한다. 본문이 함께 오면 해시를 검증해 등록한다.
+    """
+
+    async def on_operation(self):
+        execution_context = self.execution_context
+        persisted_query = (execution_context.operation_extensions or {}).get(
+            "persistedQuery"
+        )
+
+        if persisted_query:
+            if persisted_query.get("version") != 1:
+                raise GraphQLError(
+                    "Unsupported persisted query version",
+                    extensions={"code": "PERSISTED_QUERY_NOT_SUPPORTED"},
+                )
+
+            sha256 = persisted_query.get("sha256Hash")
+            if execution_context.query:
+                if query_hash(execution_context.query) != sha256:
+                    raise GraphQLError(
+                        "provided sha does not match query",
+                        extensions={"code": "PERSISTED_QUERY_HASH_MISMATCH"},
+                    )
+                await persisted_query_registry.register(sha256, execution_context.query)
+            else:
+                query = await persisted_query_registry.get(sha256) if sha256 else None
+                if query is None:
+                    raise GraphQLError(
+                        "PersistedQueryNotFound",
+                        extensions={"code": "PERSISTED_QUERY_NOT_FOUND"},
+                    )
+                execution_context.query = query
+
+        yield
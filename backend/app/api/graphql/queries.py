@@ -1,216 +1,329 @@
 import strawberry
+from datetime import datetime, timedelta
 from typing import List, Optional
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import HTTPException
 from sqlalchemy import select
-from fastapi import Depends
-from app.core.dependencies import get_current_active_user, get_db
+from strawberry.types import Info
+from app.api.graphql.context import get_context_user
+from app.api.graphql.http_cache import CacheControl, CacheScope
+from app.api.graphql.response_cache import add_cache_tags, project_tag, user_tag
+from app.api.graphql.pagination import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    Connection,
+    Edge,
+    PageInfo,
+    decode_search_cursor,
+    encode_search_cursor,
+    paginate,
+)
 from app.models import user as user_models
 from app.models import project as project_models
 from app.models import task as task_models
 from app.models import calendar as calendar_models
-from app.api.graphql.types import User, Project, Task, Comment, Event, DashboardStats
+from app.api.graphql.types import (
+    User,
+    Project,
+    Task,
+    Comment,
+    Event,
+    DashboardStats,
+    SearchResult,
+    SearchTypeEnum,
+    TaskStatusCount,
+    TaskStatusEnum,
+    TaskTreeNode,
+)
+from app.core.config import settings
+from app.services.calendar_service import CalendarService
+from app.services.comment_service import CommentModel, CommentService
+from app.services.project_service import ProjectService
+from app.services.search_service import SearchService
+from app.services.stats_service import StatsService
+from app.services.task_service import TaskService
 
 @strawberry.type
 class Query:
-    @strawberry.field
-    async def me(
-        self,
-        info,
-        current_user: user_models.User = Depends(get_current_active_user)
-    ) -> User:
-        return User(
-            id=current_user.id,
-            email=current_user.email,
-            username=current_user.username,
-            full_name=current_user.full_name,
-            role=current_user.role,
-            avatar_url=current_user.avatar_url,
-            phone=current_user.phone,
-            department=current_user.department,
-            position=current_user.position,
-            is_active=current_user.is_active,
-            created_at=current_user.created_at,
-            updated_at=current_user.updated_at
-        )
-    
-    @strawberry.field
+    @strawberry.field(directives=[CacheControl(max_age=60, scope=CacheScope.PRIVATE)])
+    async def me(self, info: Info) -> User:
+        current_user = get_context_user(info)
+        return User.from_model(current_user)
+
+    @strawberry.field(directives=[CacheControl(max_age=60)])
     async def users(
         self,
-        info,
-        db: AsyncSession = Depends(get_db),
-        current_user: user_models.User = Depends(get_current_active_user)
-    ) -> List[User]:
-        result = await db.execute(select(user_models.User))
-        users = result.scalars().all()
-        return [
-            User(
-                id=user.id,
-                email=user.email,
-                username=user.username,
-                full_name=user.full_name,
-                role=user.role,
-                avatar_url=user.avatar_url,
-                phone=user.phone,
-                department=user.department,
-                position=user.position,
-                is_active=user.is_active,
-                created_at=user.created_at,
-                updated_at=user.updated_at
-            ) for user in users
-        ]
-    
+        info: Info,
+        first: int = DEFAULT_PAGE_SIZE,
+        after: Optional[str] = None,
+    ) -> Connection[User]:
+        db = info.context["db"]
+        get_context_user(info)
+
+        connection = await paginate(
+            db,
+            select(user_models.User),
+            user_models.User,
+            User.from_model,
+            first=first,
+            after=after,
+        )
+        # 가입 시 목록 전체, 사용자 변경 시 그 사용자가 포함된 페이지 무효화
+        add_cache_tags(
+            info, ["users", *(user_tag(edge.node.id) for edge in connection.edges)]
+        )
+        return connection
+
     @strawberry.field
     async def projects(
         self,
-        info,
-        db: AsyncSession = Depends(get_db),
-        current_user: user_models.User = Depends(get_current_active_user)
-    ) -> List[Project]:
+        info: Info,
+        first: int = DEFAULT_PAGE_SIZE,
+        after: Optional[str] = None,
+    ) -> Connection[Project]:
+        db = info.context["db"]
+        current_user = get_context_user(info)
+
         # 사용자가 생성했거나 멤버로 참여하는 프로젝트만 조회
-        query = select(project_models.Project).join(
-            project_models.ProjectMember,
-            project_models.Project.id == project_models.ProjectMember.project_id
-        ).where(
-            (project_models.Project.creator_id == current_user.id) |
-            (project_models.ProjectMember.user_id == current_user.id)
-        ).distinct()
-        
-        result = await db.execute(query)
-        projects = result.scalars().all()
-        
-        project_list = []
-        for project in projects:
-            # Creator 정보 로드
-            creator_result = await db.execute(
-                select(user_models.User).where(user_models.User.id == project.creator_id)
+        # (JOIN + DISTINCT 대신 서브쿼리를 써서 (created_at, id) 인덱스 순서를 유지)
+        query = select(project_models.Project).where(
+            project_models.Project.id.in_(
+                ProjectService.accessible_project_ids(current_user.id)
             )
-            creator = creator_result.scalar_one()
-            
-            # Members 정보 로드
-            members_result = await db.execute(
-                select(user_models.User).join(
-                    project_models.ProjectMember,
-                    user_models.User.id == project_models.ProjectMember.user_id
-                ).where(project_models.ProjectMember.project_id == project.id)
-            )
-            members = members_result.scalars().all()
-            
-            project_list.append(Project(
-                id=project.id,
-                name=project.name,
-                description=project.description,
-                status=project.status,
-                priority=project.priority,
-                start_date=project.start_date,
-                end_date=project.end_date,
-                progress=project.progress,
-                budget=project.budget,
-                created_at=project.created_at,
-                updated_at=project.updated_at,
-                creator=User(
-                    id=creator.id,
-                    email=creator.email,
-                    username=creator.username,
-                    full_name=creator.full_name,
-                    role=creator.role,
-                    avatar_url=creator.avatar_url,
-                    phone=creator.phone,
-                    department=creator.department,
-                    position=creator.position,
-                    is_active=creator.is_active,
-                    created_at=creator.created_at,
-                    updated_at=creator.updated_at
-                ),
-                members=[
-                    User(
-                        id=member.id,
-                        email=member.email,
-                        username=member.username,
-                        full_name=member.full_name,
-                        role=member.role,
-                        avatar_url=member.avatar_url,
-                        phone=member.phone,
-                        department=member.department,
-                        position=member.position,
-                        is_active=member.is_active,
-                        created_at=member.created_at,
-                        updated_at=member.updated_at
-                    ) for member in members
-                ]
-            ))
-        
-        return project_list
-    
-    @strawberry.field
-    async def project(
-        self,
-        info,
-        project_id: int,
-        db: AsyncSession = Depends(get_db),
-        current_user: user_models.User = Depends(get_current_active_user)
-    ) -> Optional[Project]:
-        result = await db.execute(
-            select(project_models.Project).where(project_models.Project.id == project_id)
         )
-        project = result.scalar_one_or_none()
-        
+
+        # Creator/Members는 Project 필드 리졸버가 DataLoader로 일괄 조회
+        connection = await paginate(
+            db,
+            query,
+            project_models.Project,
+            Project.from_model,
+            first=first,
+            after=after,
+        )
+        add_cache_tags(info, [project_tag(edge.node.id) for edge in connection.edges])
+        return connection
+
+    @strawberry.field
+    async def project(self, info: Info, project_id: int) -> Optional[Project]:
+        get_context_user(info)
+
+        project = await info.context["loaders"].project_by_id.load(project_id)
+
         if not project:
             return None
-        
-        # Creator와 Members 로드 (이전과 동일)
-        # ... (생략, 위 코드와 동일)
-        
-        return project
-    
+
+        return Project.from_model(project)
+
     @strawberry.field
     async def tasks(
         self,
-        info,
+        info: Info,
         project_id: Optional[int] = None,
-        db: AsyncSession = Depends(get_db),
-        current_user: user_models.User = Depends(get_current_active_user)
-    ) -> List[Task]:
+        first: int = DEFAULT_PAGE_SIZE,
+        after: Optional[str] = None,
+    ) -> Connection[Task]:
+        db = info.context["db"]
+        get_context_user(info)
+
         query = select(task_models.Task)
-        
+
         if project_id:
             query = query.where(task_models.Task.project_id == project_id)
-        
-        result = await db.execute(query)
-        tasks = result.scalars().all()
-        
-        # Task 변환 로직 (Project, Assignees 포함)
-        # ... (구현 필요)
-        
-        return []  # 임시 반환
-    
+
+        # Project/Assignees는 Task 필드 리졸버가 DataLoader로 일괄 조회
+        return await paginate(
+            db,
+            query,
+            task_models.Task,
+            Task.from_model,
+            first=first,
+            after=after,
+        )
+
+    @strawberry.field
+    async def task_tree(
+        self,
+        info: Info,
+        root_id: int,
+        max_depth: Optional[int] = None,
+    ) -> List[TaskTreeNode]:
+        db = info.context["db"]
+        current_user = get_context_user(info)
+
+        if max_depth is None:
+            max_depth = settings.TASK_TREE_MAX_DEPTH
+        if max_depth < 0:
+            raise HTTPException(status_code=400, detail="`maxDepth` must not be negative")
+
+        # 하위 트리 + 노드별 롤업을 재귀 CTE 한 번으로 조회 (깊이, id 순)
+        rows = await TaskService.get_task_tree(
+            db,
+            current_user.id,
+            root_id,
+            min(max_depth, settings.TASK_TREE_MAX_DEPTH),
+        )
+        return [TaskTreeNode.from_row(row) for row in rows]
+
     @strawberry.field
-    async def dashboard_stats(
+    async def ancestors(self, info: Info, task_id: int) -> List[Task]:
+        db = info.context["db"]
+        current_user = get_context_user(info)
+
+        # 루트부터 직속 상위 작업까지
+        tasks = await TaskService.get_task_ancestors(db, current_user.id, task_id)
+        return [Task.from_model(task) for task in tasks]
+
+    @strawberry.field
+    async def events(
+        self,
+        info: Info,
+        range_start: datetime,
+        range_end: datetime,
+        calendar_ids: Optional[List[int]] = None,
+    ) -> List[Event]:
+        db = info.context["db"]
+        current_user = get_context_user(info)
+
+        if range_end <= range_start:
+            raise HTTPException(
+                status_code=400, detail="`rangeEnd` must be after `rangeStart`"
+            )
+        if range_end - range_start > timedelta(days=settings.EVENT_RANGE_MAX_DAYS):
+            raise HTTPException(
+                status_code=400,
+                detail=f"Range must not exceed {settings.EVENT_RANGE_MAX_DAYS} days",
+            )
+
+        # 내 캘린더(지정 시 그 중 일부)에서 기간과 겹치는 일정 (반복 일정은 회차별)
+        events = await CalendarService.get_events(
+            db, current_user.id, range_start, range_end, calendar_ids
+        )
+        return [Event.from_occurrence(event) for event in events]
+
+    @strawberry.field
+    async def task_comments(
+        self,
+        info: Info,
+        task_id: int,
+        first: int = DEFAULT_PAGE_SIZE,
+        after: Optional[str] = None,
+    ) -> Connection[Comment]:
+        return await _comment_threads(
+            info, task_models.TaskComment, task_id, first, after
+        )
+
+    @strawberry.field
+    async def project_comments(
+        self,
+        info: Info,
+        project_id: int,
+        first: int = DEFAULT_PAGE_SIZE,
+        after: Optional[str] = None,
+    ) -> Connection[Comment]:
+        return await _comment_threads(
+            info, project_models.ProjectComment, project_id, first, after
+        )
+
+    @strawberry.field
+    async def search(
         self,
-        info,
-        db: AsyncSession = Depends(get_db),
-        current_user: user_models.User = Depends(get_current_active_user)
-    ) -> DashboardStats:
-        # 프로젝트 통계
-        total_projects_result = await db.execute(
-            select(func.count(project_models.Project.id))
+        info: Info,
+        query: str,
+        types: Optional[List[SearchTypeEnum]] = None,
+        first: int = DEFAULT_PAGE_SIZE,
+        after: Optional[str] = None,
+    ) -> Connection[SearchResult]:
+        db = info.context["db"]
+        current_user = get_context_user(info)
+
+        if first < 1:
+            raise HTTPException(status_code=400, detail="`first` must be positive")
+        first = min(first, MAX_PAGE_SIZE)
+
+        # 접근 가능한 프로젝트 범위 안에서 관련도 순으로 조회
+        rows = await SearchService.search(
+            db,
+            current_user.id,
+            query,
+            kinds=[search_type.value for search_type in types] if types else None,
+            limit=first + 1,
+            after=decode_search_cursor(after) if after else None,
         )
-        total_projects = total_projects_result.scalar()
-        
-        active_projects_result = await db.execute(
-            select(func.count(project_models.Project.id)).where(
-                project_models.Project.status == project_models.ProjectStatus.IN_PROGRESS
+
+        edges = [
+            Edge(
+                cursor=encode_search_cursor(row.rank, row.kind, row.id),
+                node=SearchResult.from_row(row),
             )
+            for row in rows[:first]
+        ]
+        return Connection(
+            edges=edges,
+            page_info=PageInfo(
+                has_next_page=len(rows) > first,
+                end_cursor=edges[-1].cursor if edges else None,
+            ),
         )
-        active_projects = active_projects_result.scalar()
-        
-        # Task 통계 등 추가 구현...
-        
+
+    @strawberry.field(directives=[CacheControl(max_age=30, scope=CacheScope.PRIVATE)])
+    async def dashboard_stats(self, info: Info) -> DashboardStats:
+        db = info.context["db"]
+        current_user = get_context_user(info)
+
+        # 사전 집계된 사용자 카운터 조회
+        stats = await StatsService.get_dashboard_stats(db, current_user.id)
+
         return DashboardStats(
-            total_projects=total_projects,
-            active_projects=active_projects,
-            completed_projects=0,  # 구현 필요
-            total_tasks=0,  # 구현 필요
-            completed_tasks=0,  # 구현 필요
-            overdue_tasks=0,  # 구현 필요
-            tasks_by_status=[]  # 구현 필요
-        )
\ No newline at end of file
+            total_projects=stats.get("projects_total", 0),
+            active_projects=stats.get("projects_in_progress", 0),
+            completed_projects=stats.get("projects_completed", 0),
+            total_tasks=stats.get("tasks_total", 0),
+            completed_tasks=stats.get("tasks_done", 0),
+            overdue_tasks=stats.get("tasks_overdue", 0),
+            tasks_by_status=[
+                TaskStatusCount(
+                    status=status, count=stats.get(f"tasks_{status.value}", 0)
+                )
+                for status in TaskStatusEnum
+            ],
+        )
+
+
+async def _comment_threads(
+    info: Info,
+    model: CommentModel,
+    scope_id: int,
+    first: int,
+    after: Optional[str],
+) -> Connection[Comment]:
+    """최상위 댓글 한 페이지 + 각 스레드의 답글 트리
+
+    최상위 댓글 1회, 답글 하위 트리(재귀 CTE) 1회, 작성자(DataLoader) 1회로
+    스레드 깊이나 답글 수와 상관없이 쿼리 수가 고정된다.
+    """
+    db = info.context["db"]
+    current_user = get_context_user(info)
+
+    connection = await paginate(
+        db,
+        CommentService.thread_query(model, scope_id, current_user.id),
+        model,
+        Comment.from_model,
+        first=first,
+        after=after,
+    )
+    threads = {edge.node.id: edge.node for edge in connection.edges}
+    if not threads:
+        return connection
+
+    replies = await CommentService.get_replies(db, model, list(threads))
+    root_of = {root_id: root_id for root_id in threads}
+    for reply in replies:
+        # 작성 순이므로 상위 댓글이 항상 먼저 나온다
+        root_id = root_of.get(reply.parent_id)
+        if root_id is None:
+            continue
+        root_of[reply.id] = root_id
+        threads[root_id].replies.append(Comment.from_model(reply))
+
+    return connection
@@ -0,0 +1,246 @@
+import hashlib
+import json
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from graphql import ExecutionResult, FieldNode, OperationType, get_operation_ast
+from redis.exceptions import RedisError
+from strawberry.extensions import SchemaExtension
+from strawberry.types import Info
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.redis import get_redis
+from app.utils.logger import logger
+
+RESPONSE_CACHE_KEY = "pms:response_cache:{}"
+RESPONSE_CACHE_TAG_KEY = "pms:response_cache:tag:{}"
+RESPONSE_CACHE_EPOCH_KEY = "pms:response_cache:epoch"
+
+# 캐시하는 루트 필드 -> 가시성 범위
+# "user": 요청 사용자마다 결과가 다름, "shared": 인증된 사용자 모두 같은 결과
+CACHED_QUERY_FIELDS = {
+    "projects": "user",
+    "dashboardStats": "user",
+    "users": "shared",
+}
+
+
+def project_tag(project_id: int) -> str:
+    return f"project:{project_id}"
+
+
+def user_tag(user_id: int) -> str:
+    return f"user:{user_id}"
+
+
+def add_cache_tags(info: Info, tags: Iterable[str]) -> None:
+    """리졸버가 결과에 포함된 엔티티를 태그로 남긴다 (캐시 대상 요청에서만 수집)"""
+    collected = (info.context or {}).get("cache_tags")
+    if collected is not None:
+        collected.update(tags)
+
+
+class ResponseCache:
+    """읽기 쿼리 결과 캐시 (워커 메모리 LRU + Redis)
+
+    항목은 저장 시점의 태그 버전과 함께 저장되고, 읽을 때 현재 태그 버전과
+    다르면 버린다. 무효화는 태그 버전을 올리는 것뿐이라 어떤 항목이 그 태그를
+    가졌는지 찾을 필요가 없고, 다른 워커의 메모리 항목도 다음 읽기에서 걸러진다.
+
+    실행 도중 무효화가 일어나면 읽은 데이터가 이미 낡았을 수 있으므로, 실행
+    전후의 전역 epoch가 다르면 저장하지 않는다.
+    """
+
+    def __init__(self, backend: str, maxsize: int, ttl: int):
+        self.backend = backend
+        self.ttl = ttl
+        self._local = TTLCache(maxsize, ttl=ttl)
+        # memory 백엔드의 태그 버전/epoch (redis 백엔드는 Redis에 둔다)
+        self._tag_versions: Dict[str, int] = {}
+        self._epoch = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.backend in ("memory", "redis")
+
+    async def epoch(self) -> Optional[int]:
+        if self.backend == "memory":
+            return self._epoch
+        try:
+            return int(await get_redis().get(RESPONSE_CACHE_EPOCH_KEY) or 0)
+        except RedisError as e:
+            logger.warning("Response cache epoch lookup failed", error=str(e))
+            return None
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        entry = self._local.get(key)
+        if entry is None and self.backend == "redis":
+            try:
+                raw = await get_redis().get(RESPONSE_CACHE_KEY.format(key))
+            except RedisError as e:
+                logger.warning("Response cache lookup failed", error=str(e))
+                return None
+            if raw is not None:
+                entry = json.loads(raw)
+                self._local.set(key, entry)
+        if entry is None:
+            return None
+
+        versions = await self._current_versions(entry["tags"])
+        if versions != entry["tags"]:
+            self._local.delete(key)
+            return None
+        return entry["data"]
+
+    async def set(
+        self, key: str, data: Dict[str, Any], tags: Set[str], epoch: int
+    ) -> None:
+        versions = await self._current_versions(sorted(tags))
+        if versions is None or await self.epoch() != epoch:
+            return
+
+        entry = {"data": data, "tags": versions}
+        self._local.set(key, entry)
+        if self.backend == "redis":
+            try:
+                await get_redis().set(
+                    RESPONSE_CACHE_KEY.format(key),
+                    json.dumps(entry, separators=(",", ":")),
+                    ex=self.ttl,
+                )
+            except RedisError as e:
+                logger.warning("Response cache store failed", error=str(e))
+
+    async def invalidate(self, tags: Iterable[str]) -> None:
+        """태그가 붙은 항목을 모두 무효화 (뮤테이션 커밋 후 호출)"""
+        tags = sorted(set(tags))
+        if not tags or not self.enabled:
+            return
+
+        if self.backend == "memory":
+            for tag in tags:
+                self._tag_versions[tag] = self._tag_versions.get(tag, 0) + 1
+            self._epoch += 1
+            return
+
+        try:
+            async with get_redis().pipeline(transaction=False) as pipe:
+                for tag in tags:
+                    pipe.incr(RESPONSE_CACHE_TAG_KEY.format(tag))
+                pipe.incr(RESPONSE_CACHE_EPOCH_KEY)
+                await pipe.execute()
+        except RedisError as e:
+            # 무효화를 못 하면 최대 RESPONSE_CACHE_TTL 동안 이전 결과가 보일 수 있다
+            logger.warning(
+                "Response cache invalidation failed", error=str(e), tags=tags
+            )
+
+    def stats(self) -> Dict[str, Any]:
+        return {"backend": self.backend, **self._local.stats()}
+
+    async def _current_versions(self, tags: List[str]) -> Optional[Dict[str, int]]:
+        if self.backend == "memory":
+            return {tag: self._tag_versions.get(tag, 0) for tag in tags}
+        if not tags:
+            return {}
+        try:
+            values = await get_redis().mget(
+                [RESPONSE_CACHE_TAG_KEY.format(tag) for tag in tags]
+            )
+        except RedisError as e:
+            logger.warning("Response cache tag lookup failed", error=str(e))
+            return None
+        return {tag: int(value or 0) for tag, value in zip(tags, values)}
+
+
+response_cache = ResponseCache(
+    backend=settings.RESPONSE_CACHE_BACKEND,
+    maxsize=settings.RESPONSE_CACHE_SIZE,
+    ttl=settings.RESPONSE_CACHE_TTL,
+)
+
+
+class ResponseCaching(SchemaExtension):
+    """CACHED_QUERY_FIELDS만 선택한 query 연산의 결과를 캐시
+
+    키는 (문서 해시, 연산 이름, 변수, 가시성 범위)이고, 적중하면 실행을 건너뛰고
+    저장된 결과를 돌려준다. 오류가 있는 결과는 저장하지 않는다.
+    """
+
+    async def on_execute(self):
+        execution_context = self.execution_context
+        # 앞선 확장(비용 제한 등)이 이미 결과를 정했으면 건드리지 않는다
+        if execution_context.result is not None or not response_cache.enabled:
+            yield
+            return
+
+        key = self._cache_key()
+        if key is None:
+            yield
+            return
+
+        data = await response_cache.get(key)
+        if data is not None:
+            execution_context.result = ExecutionResult(data=data)
+            yield
+            return
+
+        epoch = await response_cache.epoch()
+        tags: Set[str] = set()
+        if self._scope != "shared":
+            tags.add(self._scope)
+        execution_context.context["cache_tags"] = tags
+        yield
+
+        result = execution_context.result
+        if (
+            epoch is not None
+            and result is not None
+            and result.data
+            and not result.errors
+        ):
+            await response_cache.set(key, result.data, tags, epoch)
+
+    def _cache_key(self) -> Optional[str]:
+        execution_context = self.execution_context
+        document = execution_context.graphql_document
+        context = execution_context.context
+        if document is None or not isinstance(context, dict):
+            return None
+
+        operation = get_operation_ast(document, execution_context.operation_name)
+        if operation is None or operation.operation != OperationType.QUERY:
+            return None
+
+        selections = operation.selection_set.selections
+        if not all(
+            isinstance(selection, FieldNode)
+            and selection.name.value in CACHED_QUERY_FIELDS
+            for selection in selections
+        ):
+            return None
+
+        # 인증 실패/비활성 사용자는 리졸버에서 거절되도록 캐시를 거치지 않는다
+        current_user = context.get("current_user")
+        if current_user is None or not current_user.is_active:
+            return None
+        if any(
+            CACHED_QUERY_FIELDS[selection.name.value] == "user"
+            for selection in selections
+        ):
+            self._scope = user_tag(current_user.id)
+        else:
+            self._scope = "shared"
+
+        raw = json.dumps(
+            [
+                execution_context.query,
+                execution_context.operation_name,
+                execution_context.variables or {},
+                self._scope,
+            ],
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str,
+        )
+        return hashlib.sha256(raw.encode()).hexdigest()
@@ -0,0 +1,136 @@
+import asyncio
+import time
+from typing import Any, AsyncGenerator, AsyncIterator, Callable, Dict, Optional, Set
+
+import strawberry
+from fastapi import HTTPException
+from sqlalchemy import select
+from strawberry.types import Info
+
+from app.api.graphql.context import get_subscription_user
+from app.api.graphql.types import ProjectChange, TaskChange
+from app.core.change_hub import (
+    ChangeSubscription,
+    change_hub,
+    project_channel,
+    task_channel,
+    user_projects_channel,
+)
+from app.core.config import settings
+from app.core.database import async_session_maker
+from app.models.project import Project
+from app.services.project_service import ProjectService
+
+
+@strawberry.type
+class Subscription:
+    """보드 화면용 변경 알림 (WebSocket: graphql-transport-ws / graphql-ws)
+
+    권한은 구독 시작 시 확인하고, 구독 중에는 SUBSCRIPTION_ACCESS_RECHECK_SECONDS
+    마다 다시 확인한다 (멤버에서 빠지면 그 뒤 이벤트는 받지 않는다). 이벤트는
+    커밋 후 발행되며 재연결 사이의 이벤트는 보장하지 않으므로 클라이언트는
+    재구독 시 목록을 다시 읽는다.
+    """
+
+    @strawberry.subscription
+    async def task_changed(
+        self, info: Info, project_id: int
+    ) -> AsyncGenerator[TaskChange, None]:
+        """프로젝트의 작업 변경 (프로젝트 접근 권한을 잃으면 구독이 끝난다)"""
+        current_user = await get_subscription_user(info)
+
+        allowed = await _accessible_project_ids(current_user.id, project_id)
+        if not allowed:
+            raise HTTPException(status_code=404, detail="Project not found")
+
+        async with change_hub.subscribe([task_channel(project_id)]) as subscription:
+            async for message in _access_checked(
+                subscription, current_user.id, project_id, allowed, task_channel
+            ):
+                yield TaskChange.from_message(message)
+
+    @strawberry.subscription
+    async def project_changed(
+        self, info: Info, project_id: Optional[int] = None
+    ) -> AsyncGenerator[ProjectChange, None]:
+        """지정한 프로젝트, 생략하면 접근 가능한 모든 프로젝트의 변경
+
+        생략한 경우 구독 중에 새로 만들거나 멤버로 추가된 프로젝트도 받고,
+        멤버에서 빠진 프로젝트는 더 받지 않는다 (권한 재확인 주기 이내에 반영).
+        """
+        current_user = await get_subscription_user(info)
+
+        allowed = await _accessible_project_ids(current_user.id, project_id)
+        if project_id is not None and not allowed:
+            raise HTTPException(status_code=404, detail="Project not found")
+
+        channels = [project_channel(id) for id in allowed]
+        if project_id is None:
+            # 구독 중에 새로 생긴 내 프로젝트도 받는다
+            channels.append(user_projects_channel(current_user.id))
+
+        async with change_hub.subscribe(channels) as subscription:
+            async for message in _access_checked(
+                subscription, current_user.id, project_id, allowed, project_channel
+            ):
+                yield ProjectChange.from_message(message)
+
+
+async def _accessible_project_ids(
+    user_id: int, project_id: Optional[int] = None
+) -> Set[int]:
+    """접근 가능한 프로젝트 id (project_id를 주면 그 프로젝트만 확인)
+
+    구독은 오래 열려 있으므로 짧은 세션으로 조회해 커넥션을 바로 반납한다.
+    """
+    query = select(Project.id).where(
+        Project.id.in_(ProjectService.accessible_project_ids(user_id))
+    )
+    if project_id is not None:
+        query = query.where(Project.id == project_id)
+    async with async_session_maker() as session:
+        return set((await session.execute(query)).scalars())
+
+
+async def _access_checked(
+    subscription: ChangeSubscription,
+    user_id: int,
+    project_id: Optional[int],
+    allowed: Set[int],
+    channel_of: Callable[[int], str],
+) -> AsyncIterator[Dict[str, Any]]:
+    """지금도 접근 가능한 프로젝트의 이벤트만 내보낸다
+
+    권한은 이벤트가 없어도 재확인 주기마다 다시 읽어 프로젝트 채널을 더하거나
+    뺀다. 아직 모르는 프로젝트의 이벤트(새로 만든 프로젝트)가 오면 바로 다시
+    읽는다. 지정한 프로젝트에 대한 접근을 잃으면 끝난다.
+    """
+    interval = settings.SUBSCRIPTION_ACCESS_RECHECK_SECONDS
+    checked_at = time.monotonic()
+
+    async def recheck() -> bool:
+        nonlocal allowed, checked_at
+        current = await _accessible_project_ids(user_id, project_id)
+        checked_at = time.monotonic()
+        for id in allowed - current:
+            subscription.discard(channel_of(id))
+        for id in current - allowed:
+            subscription.add(channel_of(id))
+        allowed = current
+        return project_id is None or project_id in allowed
+
+    while True:
+        timeout = max(0.0, checked_at + interval - time.monotonic())
+        try:
+            message = await asyncio.wait_for(anext(subscription), timeout)
+        except asyncio.TimeoutError:
+            message = None
+        except StopAsyncIteration:
+            return
+
+        stale = time.monotonic() - checked_at >= interval
+        unknown = message is not None and message["project_id"] not in allowed
+        if (stale or unknown) and not await recheck():
+            return
+        if message is not None and message["project_id"] in allowed:
+            yield message
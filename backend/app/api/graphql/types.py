@@ -2,6 +2,7 @@ import strawberry
 from typing import List, Optional
 from datetime import datetime
 from enum import Enum
+from strawberry.types import Info
 
 @strawberry.enum
 class UserRoleEnum(Enum):
@@ -26,6 +27,19 @@ class TaskStatusEnum(Enum):
     DONE = "done"
     BLOCKED = "blocked"
 
+@strawberry.enum
+class SearchTypeEnum(Enum):
+    PROJECT = "project"
+    TASK = "task"
+    TASK_COMMENT = "task_comment"
+    PROJECT_COMMENT = "project_comment"
+
+@strawberry.enum
+class ChangeOpEnum(Enum):
+    CREATED = "created"
+    UPDATED = "updated"
+    DELETED = "deleted"
+
 @strawberry.type
 class User:
     id: int
@@ -41,6 +55,28 @@ class User:
     created_at: datetime
     updated_at: Optional[datetime] = None
 
+    @classmethod
+    def from_model(cls, user) -> "User":
+        return cls(
+            id=user.id,
+            email=user.email,
+            username=user.username,
+            full_name=user.full_name,
+            role=UserRoleEnum(user.role),
+            avatar_url=user.avatar_url,
+            phone=user.phone,
+            department=user.department,
+            position=user.position,
+            is_active=user.is_active,
+            created_at=user.created_at,
+            updated_at=user.updated_at,
+        )
+
+@strawberry.type
+class TaskStatusCount:
+    status: TaskStatusEnum
+    count: int
+
 @strawberry.type
 class Project:
     id: int
@@ -51,11 +87,47 @@ class Project:
     start_date: Optional[datetime] = None
     end_date: Optional[datetime] = None
     progress: int
+    # 프로젝트 행에 유지되는 롤업 (작업 집계 쿼리 없음)
+    task_count: int
+    task_status_counts: List[TaskStatusCount]
     budget: Optional[int] = None
     created_at: datetime
     updated_at: Optional[datetime] = None
-    creator: User
-    members: List[User]
+    creator_id: strawberry.Private[int]
+
+    @classmethod
+    def from_model(cls, project) -> "Project":
+        return cls(
+            id=project.id,
+            name=project.name,
+            description=project.description,
+            status=ProjectStatusEnum(project.status),
+            priority=project.priority,
+            start_date=project.start_date,
+            end_date=project.end_date,
+            progress=project.progress,
+            task_count=project.tasks_total,
+            task_status_counts=[
+                TaskStatusCount(
+                    status=status, count=getattr(project, f"tasks_{status.value}")
+                )
+                for status in TaskStatusEnum
+            ],
+            budget=project.budget,
+            created_at=project.created_at,
+            updated_at=project.updated_at,
+            creator_id=project.creator_id,
+        )
+
+    @strawberry.field
+    async def creator(self, info: Info) -> User:
+        creator = await info.context["loaders"].user_by_id.load(self.creator_id)
+        return User.from_model(creator)
+
+    @strawberry.field
+    async def members(self, info: Info) -> List[User]:
+        members = await info.context["loaders"].members_by_project_id.load(self.id)
+        return [User.from_model(member) for member in members]
 
 @strawberry.type
 class Task:
@@ -64,7 +136,6 @@ class Task:
     description: Optional[str] = None
     status: TaskStatusEnum
     priority: str
-    project: Project
     estimated_hours: Optional[int] = None
     actual_hours: Optional[int] = None
     start_date: Optional[datetime] = None
@@ -72,15 +143,98 @@ class Task:
     completed_at: Optional[datetime] = None
     created_at: datetime
     updated_at: Optional[datetime] = None
-    assignees: List[User]
+    parent_task_id: Optional[int] = None
+    project_id: strawberry.Private[int]
+
+    @classmethod
+    def from_model(cls, task) -> "Task":
+        return cls(
+            id=task.id,
+            title=task.title,
+            description=task.description,
+            status=TaskStatusEnum(task.status),
+            priority=task.priority,
+            estimated_hours=task.estimated_hours,
+            actual_hours=task.actual_hours,
+            start_date=task.start_date,
+            due_date=task.due_date,
+            completed_at=task.completed_at,
+            created_at=task.created_at,
+            updated_at=task.updated_at,
+            parent_task_id=task.parent_task_id,
+            project_id=task.project_id,
+        )
+
+    @strawberry.field
+    async def project(self, info: Info) -> Project:
+        project = await info.context["loaders"].project_by_id.load(self.project_id)
+        return Project.from_model(project)
+
+    @strawberry.field
+    async def assignees(self, info: Info) -> List[User]:
+        assignees = await info.context["loaders"].assignees_by_task_id.load(self.id)
+        return [User.from_model(assignee) for assignee in assignees]
+
+@strawberry.type
+class TaskRollup:
+    """자신을 포함한 하위 트리 전체의 집계"""
+
+    task_count: int
+    done_count: int
+    estimated_hours: int
+    actual_hours: int
+
+    @strawberry.field
+    def done_ratio(self) -> float:
+        return self.done_count / self.task_count if self.task_count else 0.0
+
+@strawberry.type
+class TaskTreeNode:
+    task: Task
+    depth: int  # 루트 = 0
+    rollup: TaskRollup
+
+    @classmethod
+    def from_row(cls, row) -> "TaskTreeNode":
+        return cls(
+            task=Task.from_model(row.Task),
+            depth=row.depth,
+            rollup=TaskRollup(
+                task_count=row.task_count,
+                done_count=row.done_count,
+                estimated_hours=row.estimated_hours,
+                actual_hours=row.actual_hours,
+            ),
+        )
 
 @strawberry.type
 class Comment:
     id: int
     content: str
-    author: User
     created_at: datetime
     updated_at: Optional[datetime] = None
+    parent_id: Optional[int] = None
+    reply_count: int = 0  # 하위 답글 전체 수 (접힌 스레드 표시용)
+    # 최상위 댓글에만 채워지는 답글 하위 트리 전체 (작성 순, parentId로 트리 구성)
+    replies: List["Comment"] = strawberry.field(default_factory=list)
+    author_id: strawberry.Private[int]
+
+    @classmethod
+    def from_model(cls, comment) -> "Comment":
+        return cls(
+            id=comment.id,
+            content=comment.content,
+            created_at=comment.created_at,
+            updated_at=comment.updated_at,
+            parent_id=comment.parent_id,
+            reply_count=comment.reply_count,
+            author_id=comment.author_id,
+        )
+
+    @strawberry.field
+    async def author(self, info: Info) -> User:
+        author = await info.context["loaders"].user_by_id.load(self.author_id)
+        return User.from_model(author)
 
 @strawberry.type
 class Calendar:
@@ -91,6 +245,17 @@ class Calendar:
     is_default: bool
     created_at: datetime
 
+    @classmethod
+    def from_model(cls, calendar) -> "Calendar":
+        return cls(
+            id=calendar.id,
+            name=calendar.name,
+            description=calendar.description,
+            color=calendar.color,
+            is_default=calendar.is_default,
+            created_at=calendar.created_at,
+        )
+
 @strawberry.type
 class Event:
     id: int
@@ -100,9 +265,130 @@ class Event:
     end_time: datetime
     is_all_day: bool
     location: Optional[str] = None
-    calendar: Calendar
-    project: Optional[Project] = None
-    task: Optional[Task] = None
+    rrule: Optional[str] = None
+    timezone: str = "UTC"
+    # 반복 일정 회차의 규칙상 시작 시각 (회차 취소/변경 시 이 값으로 지정)
+    recurrence_id: Optional[datetime] = None
+    calendar_id: strawberry.Private[int]
+    project_id: strawberry.Private[Optional[int]]
+    task_id: strawberry.Private[Optional[int]]
+
+    @classmethod
+    def from_model(cls, event) -> "Event":
+        return cls(
+            id=event.id,
+            title=event.title,
+            description=event.description,
+            start_time=event.start_time,
+            end_time=event.end_time,
+            is_all_day=event.is_all_day,
+            location=event.location,
+            rrule=event.rrule,
+            timezone=event.timezone,
+            calendar_id=event.calendar_id,
+            project_id=event.project_id,
+            task_id=event.task_id,
+        )
+
+    @classmethod
+    def from_occurrence(cls, occurrence) -> "Event":
+        return cls(
+            id=occurrence.id,
+            title=occurrence.title,
+            description=occurrence.description,
+            start_time=occurrence.start_time,
+            end_time=occurrence.end_time,
+            is_all_day=occurrence.is_all_day,
+            location=occurrence.location,
+            rrule=occurrence.rrule,
+            timezone=occurrence.timezone,
+            recurrence_id=occurrence.recurrence_id,
+            calendar_id=occurrence.calendar_id,
+            project_id=occurrence.project_id,
+            task_id=occurrence.task_id,
+        )
+
+    @strawberry.field
+    async def calendar(self, info: Info) -> Calendar:
+        calendar = await info.context["loaders"].calendar_by_id.load(self.calendar_id)
+        return Calendar.from_model(calendar)
+
+    @strawberry.field
+    async def project(self, info: Info) -> Optional[Project]:
+        if self.project_id is None:
+            return None
+        project = await info.context["loaders"].project_by_id.load(self.project_id)
+        return Project.from_model(project)
+
+    @strawberry.field
+    async def task(self, info: Info) -> Optional[Task]:
+        if self.task_id is None:
+            return None
+        task = await info.context["loaders"].task_by_id.load(self.task_id)
+        return Task.from_model(task)
+
+@strawberry.type
+class SearchResult:
+    type: SearchTypeEnum
+    id: int
+    rank: float
+    title: str  # 프로젝트명/작업 제목/댓글 본문
+    project_id: strawberry.Private[int]
+    task_id: strawberry.Private[Optional[int]]
+
+    @classmethod
+    def from_row(cls, row) -> "SearchResult":
+        return cls(
+            type=SearchTypeEnum(row.kind),
+            id=row.id,
+            rank=row.rank,
+            title=row.title,
+            project_id=row.project_id,
+            task_id=row.task_id,
+        )
+
+    @strawberry.field
+    async def project(self, info: Info) -> Project:
+        project = await info.context["loaders"].project_by_id.load(self.project_id)
+        return Project.from_model(project)
+
+    @strawberry.field
+    async def task(self, info: Info) -> Optional[Task]:
+        if self.task_id is None:
+            return None
+        task = await info.context["loaders"].task_by_id.load(self.task_id)
+        return Task.from_model(task)
+
+@strawberry.type
+class TaskAssignment:
+    task_id: int
+    user_id: int
+    assigned_by: int
+    assigned_at: Optional[datetime] = None
+
+    @classmethod
+    def from_model(cls, assignment) -> "TaskAssignment":
+        return cls(
+            task_id=assignment.task_id,
+            user_id=assignment.user_id,
+            assigned_by=assignment.assigned_by,
+            assigned_at=assignment.assigned_at,
+        )
+
+@strawberry.type
+class BatchError:
+    index: int  # 입력 목록에서의 위치
+    message: str
+
+@strawberry.type
+class CreateTasksPayload:
+    tasks: List[Task]
+    errors: List[BatchError]
+
+@strawberry.type
+class AssignTasksPayload:
+    assignments: List[TaskAssignment]
+    errors: List[BatchError]
 
 @strawberry.type
 class DashboardStats:
@@ -112,7 +398,41 @@ class DashboardStats:
     total_tasks: int
     completed_tasks: int
     overdue_tasks: int
-    tasks_by_status: List[str]
+    tasks_by_status: List[TaskStatusCount]
+
+@strawberry.type
+class TaskChange:
+    """작업 변경 알림 (상세는 클라이언트가 필요할 때 다시 조회)"""
+    op: ChangeOpEnum
+    task_id: int
+    project_id: int
+    status: TaskStatusEnum
+
+    @classmethod
+    def from_message(cls, message) -> "TaskChange":
+        return cls(
+            op=ChangeOpEnum(message["op"]),
+            task_id=message["task_id"],
+            project_id=message["project_id"],
+            status=TaskStatusEnum(message["status"]),
+        )
+
+@strawberry.type
+class ProjectChange:
+    """프로젝트 변경 알림"""
+    op: ChangeOpEnum
+    project_id: int
+    status: ProjectStatusEnum
+    progress: int
+
+    @classmethod
+    def from_message(cls, message) -> "ProjectChange":
+        return cls(
+            op=ChangeOpEnum(message["op"]),
+            project_id=message["project_id"],
+            status=ProjectStatusEnum(message["status"]),
+            progress=message["progress"] or 0,
+        )
 
 @strawberry.input
 class UserInput:
@@ -161,4 +481,20 @@ class EventInput:
     location: Optional[str] = None
     calendar_id: int
     project_id: Optional[int] = None
-    task_id: Optional[int] = None
\ No newline at end of file
+    task_id: Optional[int] = None
+    rrule: Optional[str] = None  # 예: "FREQ=WEEKLY;BYDAY=MO,WE;COUNT=10"
+    timezone: Optional[str] = None  # 반복 규칙을 펼치는 IANA 시간대, 기본 UTC
+
+@strawberry.input
+class EventOccurrenceInput:
+    """반복 일정 한 회차의 변경 값 (비운 필드는 시리즈 값 유지)"""
+    title: Optional[str] = None
+    description: Optional[str] = None
+    start_time: Optional[datetime] = None
+    end_time: Optional[datetime] = None
+    location: Optional[str] = None
+
+@strawberry.input
+class TaskAssignmentInput:
+    task_id: int
+    user_id: int
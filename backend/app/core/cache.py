@@ -0,0 +1,64 @@
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+_MISSING = object()
+
+
+class TTLCache:
+    """프로세스 내 LRU + TTL 캐시
+
+    asyncio 단일 스레드에서 사용하는 것을 전제로 하며 별도 락을 두지 않는다.
+    """
+
+    def __init__(self, maxsize: int, ttl: Optional[float] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._data.get(key, _MISSING)
+        if entry is _MISSING:
+            self.misses += 1
+            return default
+
+        expires_at, value = entry
+        if expires_at and expires_at < time.monotonic():
+            del self._data[key]
+            self.misses += 1
+            return default
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl else 0.0
+
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
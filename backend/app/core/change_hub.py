@@ -0,0 +1,245 @@
+import asyncio
+import json
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Iterable, Optional, Set
+
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+from app.core.redis import get_redis
+from app.utils.logger import logger
+
+CHANGE_CHANNEL_PREFIX = "pms:changes:"
+
+
+def task_channel(project_id: int) -> str:
+    return f"tasks:{project_id}"
+
+
+def project_channel(project_id: int) -> str:
+    return f"projects:{project_id}"
+
+
+def user_projects_channel(user_id: int) -> str:
+    """사용자가 새로 접근하게 된 프로젝트 (생성 등)"""
+    return f"user_projects:{user_id}"
+
+
+class ChangeSubscription:
+    """구독자 한 명의 이벤트 큐
+
+    큐가 가득 찰 만큼 느린 구독자는 이벤트를 빠뜨리는 대신 구독을 끝낸다
+    (클라이언트는 다시 구독하고 목록을 새로 읽는다).
+    """
+
+    def __init__(self, hub: "ChangeHub", maxsize: int):
+        self.channels: Set[str] = set()
+        self.overflowed = False
+        self._hub = hub
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+
+    def add(self, channel: str) -> None:
+        if channel not in self.channels:
+            self.channels.add(channel)
+            self._hub._channels.setdefault(channel, set()).add(self)
+
+    def discard(self, channel: str) -> None:
+        if channel in self.channels:
+            self.channels.discard(channel)
+            self._hub._unsubscribe(channel, self)
+
+    def put(self, message: Dict[str, Any]) -> None:
+        if self.overflowed:
+            return
+        try:
+            self._queue.put_nowait(message)
+        except asyncio.QueueFull:
+            self.overflowed = True
+            self._hub.overflowed += 1
+            self._hub._detach(self)
+
+    def __aiter__(self) -> "ChangeSubscription":
+        return self
+
+    async def __anext__(self) -> Dict[str, Any]:
+        # 넘친 시점에는 큐가 가득 차 있으므로 get()에서 기다리는 소비자는 없다
+        if self.overflowed:
+            raise StopAsyncIteration
+        return await self._queue.get()
+
+
+class MemoryBroker:
+    """프로세스 내 브로커 (단일 워커/테스트용)"""
+
+    async def start(self, dispatch) -> None:
+        self._dispatch = dispatch
+
+    async def stop(self) -> None:
+        pass
+
+    async def publish(self, channel: str, message: Dict[str, Any]) -> None:
+        self._dispatch(channel, message)
+
+
+class RedisBroker:
+    """Redis pub/sub 브로커
+
+    워커마다 `pms:changes:*` 패턴을 한 번만 구독하고 받은 메시지를 로컬
+    구독자에게 나눠 준다. 연결이 끊기면 잠시 뒤 다시 구독한다 (그 사이의
+    이벤트는 유실되므로 클라이언트는 재연결 시 목록을 다시 읽어야 한다).
+    """
+
+    RECONNECT_DELAY = 1.0  # seconds
+
+    def __init__(self):
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self, dispatch) -> None:
+        self._dispatch = dispatch
+        self._task = asyncio.create_task(self._listen(), name="change-hub-listener")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def publish(self, channel: str, message: Dict[str, Any]) -> None:
+        await get_redis().publish(
+            CHANGE_CHANNEL_PREFIX + channel, json.dumps(message, separators=(",", ":"))
+        )
+
+    async def _listen(self) -> None:
+        while True:
+            pubsub = get_redis().pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.psubscribe(CHANGE_CHANNEL_PREFIX + "*")
+                async for item in pubsub.listen():
+                    channel = item["channel"][len(CHANGE_CHANNEL_PREFIX) :]
+                    self._dispatch(channel, json.loads(item["data"]))
+            except RedisError as e:
+                logger.warning("Change hub subscription lost", error=str(e))
+            finally:
+                await pubsub.aclose()
+            await asyncio.sleep(self.RECONNECT_DELAY)
+
+
+class ChangeHub:
+    """작업/프로젝트 변경 이벤트 팬아웃
+
+    브로커 구독은 워커당 하나이고, 브로커에서 받은 메시지는 채널별 로컬
+    구독자 집합에 큐 적재만 하므로 구독자가 수천이어도 브로커 연결이나 DB
+    커넥션은 늘지 않는다. 발행은 커밋 후에 하며, 실패해도 뮤테이션을 실패시키지
+    않는다.
+    """
+
+    def __init__(self, broker, subscriber_queue_size: int):
+        self.broker = broker
+        self.subscriber_queue_size = subscriber_queue_size
+        self._channels: Dict[str, Set[ChangeSubscription]] = {}
+        self._started = False
+
+        self.published = 0
+        self.delivered = 0
+        self.overflowed = 0
+        self.failed = 0
+
+    async def start(self) -> None:
+        if not self._started:
+            await self.broker.start(self._dispatch)
+            self._started = True
+
+    async def stop(self) -> None:
+        if self._started:
+            await self.broker.stop()
+            self._started = False
+
+    @asynccontextmanager
+    async def subscribe(
+        self, channels: Iterable[str]
+    ) -> AsyncIterator[ChangeSubscription]:
+        await self.start()
+        subscription = ChangeSubscription(self, self.subscriber_queue_size)
+        for channel in channels:
+            subscription.add(channel)
+        try:
+            yield subscription
+        finally:
+            self._detach(subscription)
+
+    async def publish(self, channel: str, message: Dict[str, Any]) -> None:
+        try:
+            await self.start()
+            await self.broker.publish(channel, message)
+            self.published += 1
+        except Exception as e:
+            self.failed += 1
+            logger.warning("Change event publish failed", channel=channel, error=str(e))
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "channels": len(self._channels),
+            "subscribers": len(
+                {sub for subs in self._channels.values() for sub in subs}
+            ),
+            "published": self.published,
+            "delivered": self.delivered,
+            "overflowed": self.overflowed,
+            "failed": self.failed,
+        }
+
+    def _dispatch(self, channel: str, message: Dict[str, Any]) -> None:
+        for subscription in list(self._channels.get(channel, ())):
+            subscription.put(message)
+            self.delivered += 1
+
+    def _detach(self, subscription: ChangeSubscription) -> None:
+        for channel in subscription.channels:
+            self._unsubscribe(channel, subscription)
+
+    def _unsubscribe(self, channel: str, subscription: ChangeSubscription) -> None:
+        subscribers = self._channels.get(channel)
+        if subscribers is not None:
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self._channels[channel]
+
+
+change_hub = ChangeHub(
+    broker=MemoryBroker() if settings.CHANGE_HUB_BROKER == "memory" else RedisBroker(),
+    subscriber_queue_size=settings.CHANGE_HUB_SUBSCRIBER_QUEUE,
+)
+
+
+# ----- 뮤테이션에서 커밋 후 호출하는 발행 헬퍼 -----
+
+
+async def publish_task_change(op: str, task) -> None:
+    await change_hub.publish(
+        task_channel(task.project_id),
+        {
+            "op": op,
+            "task_id": task.id,
+            "project_id": task.project_id,
+            "status": getattr(task.status, "value", task.status),
+        },
+    )
+
+
+async def publish_project_change(
+    op: str, project, user_id: Optional[int] = None
+) -> None:
+    """프로젝트 변경 발행 (user_id가 있으면 그 사용자의 새 프로젝트로도 알린다)"""
+    message = {
+        "op": op,
+        "project_id": project.id,
+        "status": getattr(project.status, "value", project.status),
+        "progress": project.progress,
+    }
+    await change_hub.publish(project_channel(project.id), message)
+    if user_id is not None:
+        await change_hub.publish(user_projects_channel(user_id), message)
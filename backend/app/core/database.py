@@ -1,16 +1,141 @@
+import time
+from collections import deque
+from typing import Any, Dict
+from uuid import uuid4
+
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from app.core.config import settings
+from app.utils.logger import logger
+
+
+class PoolStats:
+    """커넥션 풀 대기/획득 지연 통계"""
+
+    def __init__(self, samples: int = 1000):
+        self.waiting = 0
+        self.acquired = 0
+        self.total_acquire_seconds = 0.0
+        self.max_acquire_seconds = 0.0
+        self._recent = deque(maxlen=samples)
+
+    def record_acquire(self, seconds: float) -> None:
+        self.acquired += 1
+        self.total_acquire_seconds += seconds
+        self.max_acquire_seconds = max(self.max_acquire_seconds, seconds)
+        self._recent.append(seconds)
+
+        if seconds * 1000 >= settings.DB_POOL_SLOW_ACQUIRE_MS:
+            logger.warning(
+                "Slow database connection acquire",
+                acquire_ms=round(seconds * 1000, 2),
+                waiting=self.waiting,
+                **pool_status(),
+            )
+
+    def snapshot(self) -> Dict[str, Any]:
+        recent = sorted(self._recent)
+        p99 = recent[min(len(recent) - 1, int(len(recent) * 0.99))] if recent else 0.0
+        return {
+            "waiting": self.waiting,
+            "acquired": self.acquired,
+            "acquire_avg_ms": (
+                self.total_acquire_seconds / self.acquired * 1000 if self.acquired else 0.0
+            ),
+            "acquire_p99_ms": p99 * 1000,
+            "acquire_max_ms": self.max_acquire_seconds * 1000,
+        }
+
+
+pool_stats = PoolStats()
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """커넥션을 기다리는 요청 수와 획득 지연을 기록하는 풀"""
+
+    def _do_get(self):
+        pool_stats.waiting += 1
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            pool_stats.waiting -= 1
+            pool_stats.record_acquire(time.perf_counter() - started)
 
-engine = create_async_engine(settings.DATABASE_URL, echo=True)
+
+def _engine_options() -> Dict[str, Any]:
+    url = make_url(settings.DATABASE_URL)
+    # SQL 로그는 디버그용으로만 켠다 (운영 부하에서는 쿼리보다 비싸다)
+    options: Dict[str, Any] = {"echo": settings.SQL_ECHO}
+
+    if url.get_backend_name() == "sqlite":
+        return {"url": url, **options}
+
+    options.update(
+        poolclass=InstrumentedQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+    )
+
+    if url.get_driver_name() == "asyncpg":
+        if settings.DB_PGBOUNCER_TRANSACTION_MODE:
+            # PgBouncer 트랜잭션 모드에서는 서버 커넥션이 바뀌므로 prepared statement를 쓰지 않는다
+            url = url.update_query_dict({"prepared_statement_cache_size": "0"})
+            options["connect_args"] = {
+                "statement_cache_size": 0,
+                "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+            }
+        else:
+            url = url.update_query_dict(
+                {"prepared_statement_cache_size": str(settings.DB_STATEMENT_CACHE_SIZE)}
+            )
+            options["connect_args"] = {
+                "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE
+            }
+
+    return {"url": url, **options}
+
+
+engine = create_async_engine(**_engine_options())
 async_session_maker = async_sessionmaker(
     engine, class_=AsyncSession, expire_on_commit=False
 )
 
-Base = declarative_base()
+
+class _ModelBase:
+    # 서버 기본값(created_at, onupdate updated_at 등)을 INSERT/UPDATE ... RETURNING
+    # 으로 함께 받아 커밋 후 refresh() SELECT가 필요 없게 한다
+    __mapper_args__ = {"eager_defaults": True}
+
+
+Base = declarative_base(cls=_ModelBase)
+
+
+def pool_status() -> Dict[str, Any]:
+    pool = engine.sync_engine.pool
+    if not isinstance(pool, AsyncAdaptedQueuePool):
+        return {"pool": type(pool).__name__}
+    return {
+        "pool": type(pool).__name__,
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+    }
 
 
 async def get_db():
+    """요청 단위 세션 (unit of work)
+
+    서비스는 변경을 `flush()`까지만 하고, 커밋은 요청을 처리하는 쪽(뮤테이션,
+    엔드포인트)이 마지막에 한 번 한다. 도중에 예외가 나면 커밋되지 않은 변경은
+    세션을 닫을 때 모두 롤백된다.
+    """
     async with async_session_maker() as session:
         try:
             yield session
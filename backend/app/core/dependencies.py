@@ -1,20 +1,34 @@
 from typing import Optional
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
+from fastapi.requests import HTTPConnection
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from app.core.database import get_db
+from app.core.permissions import permission_engine
 from app.core.security import decode_token
+from app.core.user_cache import cache_user, get_cached_user
 from app.models.user import User
-from app.models.permission import UserRole, Role, RolePermission, Permission
 
 security = HTTPBearer()
+optional_security = HTTPBearer(auto_error=False)
 
 async def get_current_user(
+    request: Request,
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: AsyncSession = Depends(get_db)
 ) -> User:
-    token = credentials.credentials
+    # 같은 요청 안에서는 토큰 해석/조회를 한 번만 수행
+    current_user = getattr(request.state, "current_user", None)
+    if current_user is not None:
+        return current_user
+
+    user = await get_token_user(db, credentials.credentials)
+    request.state.current_user = user
+    return user
+
+async def get_token_user(db: AsyncSession, token: str) -> User:
+    """액세스 토큰의 사용자 (캐시 적중 시 DB 조회 없음)"""
     payload = decode_token(token)
     user_id = payload.get("sub")
     
@@ -24,15 +38,20 @@ async def get_current_user(
             detail="Could not validate credentials"
         )
     
-    result = await db.execute(select(User).where(User.id == int(user_id)))
-    user = result.scalar_one_or_none()
-    
+    user = await get_cached_user(int(user_id))
+
     if user is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found"
-        )
-    
+        result = await db.execute(select(User).where(User.id == int(user_id)))
+        user = result.scalar_one_or_none()
+
+        if user is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="User not found"
+            )
+
+        user = cache_user(user)
+
     return user
 
 async def get_current_active_user(
@@ -45,21 +64,44 @@ async def get_current_active_user(
         )
     return current_user
 
+async def get_current_user_optional(
+    request: HTTPConnection,
+    db: AsyncSession = Depends(get_db)
+) -> Optional[User]:
+    # 로그인/회원가입처럼 토큰 없이 호출되는 요청을 위한 선택적 인증
+    # (HTTPBearer는 Request만 주입받으므로 WebSocket에서도 쓰도록 직접 호출)
+    credentials = await optional_security(request)
+    if credentials is None:
+        return None
+    return await get_current_user(request, credentials, db)
+
+async def get_graphql_user(
+    connection: HTTPConnection,
+    db: AsyncSession = Depends(get_db)
+) -> Optional[User]:
+    """GraphQL 라우터 인증
+
+    HTTP 요청은 get_current_active_user와 같이 토큰이 필수다. WebSocket은
+    브라우저가 헤더를 붙일 수 없으므로 구독 시점에 connection_init 페이로드의
+    토큰으로 인증한다 (get_subscription_user).
+    """
+    if connection.scope["type"] == "websocket":
+        return None
+    credentials = await security(connection)
+    user = await get_current_user(connection, credentials, db)
+    return await get_current_active_user(user)
+
 def require_permission(resource: str, action: str):
     async def permission_checker(
         current_user: User = Depends(get_current_active_user),
         db: AsyncSession = Depends(get_db)
     ):
-        # Check if user has required permission
-        query = select(Permission).join(RolePermission).join(Role).join(UserRole).where(
-            UserRole.user_id == current_user.id,
-            Permission.resource == resource,
-            Permission.action == action
+        # 컴파일된 권한 비트셋으로 확인 (캐시 적중 시 DB 조회 없음)
+        allowed = await permission_engine.has_permission(
+            db, current_user.id, resource, action
         )
-        result = await db.execute(query)
-        permission = result.scalar_one_or_none()
         
-        if not permission:
+        if not allowed:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Not enough permissions"
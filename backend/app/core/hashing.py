@@ -0,0 +1,117 @@
+import asyncio
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from fastapi import HTTPException, status
+
+from app.core.config import settings
+from app.core.security import get_password_hash, verify_password
+
+
+class PasswordHasher:
+    """bcrypt 해시/검증을 이벤트 루프 밖의 풀에서 실행
+
+    bcrypt 한 번에 100~300ms가 걸리므로 리졸버에서 직접 호출하면 그동안
+    다른 요청이 모두 멈춘다. 동시 실행 수는 세마포어로 제한하고, 대기열이
+    `max_queue`를 넘으면 503으로 거절해 로그인 폭주가 워커를 잠식하지 않게 한다.
+    """
+
+    def __init__(
+        self,
+        executor_type: str = "thread",
+        max_workers: int = 4,
+        max_concurrency: int = 4,
+        max_queue: int = 0,
+    ):
+        if executor_type not in ("thread", "process"):
+            raise ValueError(f"Unknown executor type: {executor_type}")
+
+        self.executor_type = executor_type
+        self.max_workers = max_workers
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+
+        self._executor: Optional[Executor] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+        # 메트릭
+        self.in_flight = 0
+        self.waiting = 0
+        self.max_waiting = 0
+        self.completed = 0
+        self.rejected = 0
+        self.total_seconds = 0.0
+
+    async def hash(self, password: str) -> str:
+        return await self._run(get_password_hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._run(verify_password, plain_password, hashed_password)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "executor": self.executor_type,
+            "max_workers": self.max_workers,
+            "max_concurrency": self.max_concurrency,
+            "in_flight": self.in_flight,
+            "queue_depth": self.waiting,
+            "max_queue_depth": self.max_waiting,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "avg_seconds": (
+                self.total_seconds / self.completed if self.completed else 0.0
+            ),
+        }
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.executor_type == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="password-hash"
+                )
+        return self._executor
+
+    async def _run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        if self.max_queue and self.waiting >= self.max_queue:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Too many authentication requests, please retry",
+            )
+
+        self.waiting += 1
+        self.max_waiting = max(self.max_waiting, self.waiting)
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self.waiting -= 1
+
+        self.in_flight += 1
+        started = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), fn, *args)
+        finally:
+            self.in_flight -= 1
+            self.completed += 1
+            self.total_seconds += time.perf_counter() - started
+            self._semaphore.release()
+
+
+password_hasher = PasswordHasher(
+    executor_type=settings.PASSWORD_HASH_EXECUTOR,
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_concurrency=settings.PASSWORD_HASH_MAX_CONCURRENCY,
+    max_queue=settings.PASSWORD_HASH_MAX_QUEUE,
+)
@@ -0,0 +1,217 @@
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+from redis.exceptions import RedisError
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, object_session
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.redis import get_redis
+from app.models.permission import Permission, Role, RolePermission, UserRole
+from app.utils.logger import logger
+
+PERMISSION_VERSION_KEY = "pms:permissions:version"
+
+# 세션에 쌓아 두는 커밋 대기 중인 변경 (사용자 id 집합, None이면 전체)
+_PENDING_KEY = "permission_changes"
+
+
+@dataclass
+class EffectivePermissions:
+    """사용자별로 컴파일된 권한 비트셋 (비트 위치 = Permission.id)"""
+
+    global_bits: int = 0
+    any_bits: int = 0
+    project_bits: Dict[int, int] = field(default_factory=dict)
+
+    def allows(self, bit: int, project_id: Optional[int] = None) -> bool:
+        mask = 1 << bit
+        if project_id is None:
+            # 프로젝트 미지정 시 어느 역할이든 권한이 있으면 허용 (기존 동작 유지)
+            return bool(self.any_bits & mask)
+        return bool((self.global_bits | self.project_bits.get(project_id, 0)) & mask)
+
+
+class PermissionEngine:
+    """유효 권한 매트릭스 컴파일/캐시
+
+    사용자별 권한을 한 번의 조인으로 비트셋에 컴파일해 프로세스 메모리에 캐시한다.
+    역할/권한 행 변경이 커밋되면 (아래 세션 이벤트) Redis의 버전 키를 올리고, 각
+    워커는 `PERMISSION_VERSION_CHECK_INTERVAL`마다 버전을 확인해 오래된 항목을
+    버린다. 권한 목록은 버전과 별개로 `PERMISSION_CATALOG_TTL`마다 다시 읽는다.
+    """
+
+    def __init__(self):
+        self._cache = TTLCache(
+            maxsize=settings.PERMISSION_CACHE_SIZE, ttl=settings.PERMISSION_CACHE_TTL
+        )
+        # (resource, action) -> Permission.id
+        self._catalog: Optional[Dict[Tuple[str, str], int]] = None
+        self._catalog_version: Optional[int] = None
+        self._catalog_loaded_at = 0.0
+        self._version = 0
+        self._version_checked_at = 0.0
+        self._pending: Set[asyncio.Task] = set()
+
+    async def has_permission(
+        self,
+        db: AsyncSession,
+        user_id: int,
+        resource: str,
+        action: str,
+        project_id: Optional[int] = None,
+    ) -> bool:
+        version = await self._current_version()
+
+        catalog = await self._get_catalog(db, version)
+        bit = catalog.get((resource, action))
+        if bit is None:
+            return False
+
+        cached = self._cache.get(user_id)
+        if cached is None or cached[0] != version:
+            permissions = await self._compile(db, user_id)
+            self._cache.set(user_id, (version, permissions))
+        else:
+            permissions = cached[1]
+
+        return permissions.allows(bit, project_id)
+
+    async def invalidate(self, user_id: Optional[int] = None) -> None:
+        """역할/권한 변경 후 호출 (user_id 생략 시 전체 무효화)"""
+        self._forget(None if user_id is None else [user_id])
+        await self._bump_version()
+
+    def invalidate_soon(self, user_ids: Optional[Iterable[int]] = None) -> None:
+        """동기 코드(세션 이벤트)용: 로컬 캐시는 바로 비우고 버전은 백그라운드로 올린다"""
+        self._forget(user_ids)
+        try:
+            task = asyncio.get_running_loop().create_task(self._bump_version())
+        except RuntimeError:
+            # 이벤트 루프 밖(스크립트 등)이면 다른 워커는 TTL 안에 반영
+            return
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    def _forget(self, user_ids: Optional[Iterable[int]]) -> None:
+        if user_ids is None:
+            self._cache.clear()
+            self._catalog = None
+        else:
+            for user_id in user_ids:
+                self._cache.delete(user_id)
+
+    async def _bump_version(self) -> None:
+        # 다른 워커에도 전파
+        try:
+            self._version = await get_redis().incr(PERMISSION_VERSION_KEY)
+        except RedisError as e:
+            logger.warning("Permission version bump failed", error=str(e))
+        self._version_checked_at = time.monotonic()
+
+    def stats(self) -> Dict[str, object]:
+        return {"version": self._version, **self._cache.stats()}
+
+    async def _current_version(self) -> int:
+        now = time.monotonic()
+        if now - self._version_checked_at < settings.PERMISSION_VERSION_CHECK_INTERVAL:
+            return self._version
+
+        try:
+            value = await get_redis().get(PERMISSION_VERSION_KEY)
+            self._version = int(value or 0)
+        except RedisError as e:
+            # Redis 장애 시 로컬 캐시(TTL)로만 동작
+            logger.warning("Permission version check failed", error=str(e))
+        self._version_checked_at = now
+        return self._version
+
+    async def _get_catalog(
+        self, db: AsyncSession, version: int
+    ) -> Dict[Tuple[str, str], int]:
+        now = time.monotonic()
+        if (
+            self._catalog is None
+            or self._catalog_version != version
+            or now - self._catalog_loaded_at >= settings.PERMISSION_CATALOG_TTL
+        ):
+            result = await db.execute(
+                select(Permission.id, Permission.resource, Permission.action)
+            )
+            self._catalog = {
+                (resource, action): id for id, resource, action in result.all()
+            }
+            self._catalog_version = version
+            self._catalog_loaded_at = now
+        return self._catalog
+
+    async def _compile(self, db: AsyncSession, user_id: int) -> EffectivePermissions:
+        result = await db.execute(
+            select(UserRole.project_id, RolePermission.permission_id)
+            .join(Role, Role.id == UserRole.role_id)
+            .join(RolePermission, RolePermission.role_id == Role.id)
+            .where(UserRole.user_id == user_id, Role.is_active.isnot(False))
+        )
+
+        permissions = EffectivePermissions()
+        for project_id, permission_id in result.all():
+            mask = 1 << permission_id
+            permissions.any_bits |= mask
+            if project_id is None:
+                permissions.global_bits |= mask
+            else:
+                permissions.project_bits[project_id] = (
+                    permissions.project_bits.get(project_id, 0) | mask
+                )
+        return permissions
+
+
+permission_engine = PermissionEngine()
+
+
+def _session_info(target) -> Optional[dict]:
+    session = object_session(target)
+    return None if session is None else session.info
+
+
+@event.listens_for(UserRole, "after_insert")
+@event.listens_for(UserRole, "after_delete")
+def _user_role_changed(mapper, connection, target: UserRole) -> None:
+    info = _session_info(target)
+    if info is None:
+        return
+    pending = info.setdefault(_PENDING_KEY, set())
+    if pending is not None:
+        pending.add(target.user_id)
+
+
+# 역할 재지정(user_id 변경 포함), 역할/권한 정의 변경은 영향 범위가 넓으므로 전체 무효화
+@event.listens_for(UserRole, "after_update")
+@event.listens_for(Role, "after_update")
+@event.listens_for(Role, "after_delete")
+@event.listens_for(RolePermission, "after_insert")
+@event.listens_for(RolePermission, "after_update")
+@event.listens_for(RolePermission, "after_delete")
+@event.listens_for(Permission, "after_insert")
+@event.listens_for(Permission, "after_update")
+@event.listens_for(Permission, "after_delete")
+def _permissions_changed(mapper, connection, target) -> None:
+    info = _session_info(target)
+    if info is not None:
+        info[_PENDING_KEY] = None
+
+
+# flush 시점이 아니라 커밋된 뒤에 무효화해야 다른 요청이 이전 값을 다시 캐시하지 않는다
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session: Session) -> None:
+    if _PENDING_KEY in session.info:
+        permission_engine.invalidate_soon(session.info.pop(_PENDING_KEY))
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
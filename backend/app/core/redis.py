@@ -0,0 +1,22 @@
+from typing import Optional
+
+from redis.asyncio import Redis
+
+from app.core.config import settings
+
+_redis: Optional[Redis] = None
+
+
+def get_redis() -> Redis:
+    """프로세스 공용 Redis 클라이언트 (최초 호출 시 생성)"""
+    global _redis
+    if _redis is None:
+        _redis = Redis.from_url(settings.REDIS_URL, decode_responses=True)
+    return _redis
+
+
+async def close_redis() -> None:
+    global _redis
+    if _redis is not None:
+        await _redis.aclose()
+        _redis = None
@@ -0,0 +1,135 @@
+import asyncio
+import time
+from typing import Optional, Set
+
+from redis.exceptions import RedisError
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, object_session
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.redis import get_redis
+from app.models.user import User
+from app.utils.logger import logger
+
+USER_CACHE_VERSION_KEY = "pms:user_cache:version"
+
+# 세션에 쌓아 두는 커밋 대기 중인 변경: (무효화할 user_id 집합, 다른 워커 전파 여부)
+_PENDING_KEY = "user_cache_changes"
+
+# 로그인 시각처럼 인증/권한과 무관한 컬럼만 바뀌면 다른 워커에 전파하지 않는다
+_LOCAL_ONLY_COLUMNS = {"last_login", "updated_at"}
+
+# 인증된 사용자 스냅샷 캐시 (user_id -> User)
+user_cache = TTLCache(maxsize=settings.USER_CACHE_SIZE, ttl=settings.USER_CACHE_TTL)
+
+_version = 0
+_version_checked_at = 0.0
+_pending_bumps: Set[asyncio.Task] = set()
+
+
+def _snapshot(user: User) -> User:
+    """세션과 분리된 읽기 전용 복사본 (다른 요청의 세션에 묶이지 않도록)"""
+    values = {attr.key: getattr(user, attr.key) for attr in inspect(User).column_attrs}
+    return User(**values)
+
+
+async def get_cached_user(user_id: int) -> Optional[User]:
+    await _check_version()
+    return user_cache.get(user_id)
+
+
+def cache_user(user: User) -> User:
+    snapshot = _snapshot(user)
+    user_cache.set(user.id, snapshot)
+    return snapshot
+
+
+def invalidate_user(user_id: int) -> None:
+    user_cache.delete(user_id)
+
+
+async def _check_version() -> None:
+    """다른 워커가 사용자를 변경했으면 (버전 키 증가) 로컬 캐시를 모두 버린다"""
+    global _version, _version_checked_at
+    now = time.monotonic()
+    if now - _version_checked_at < settings.USER_CACHE_VERSION_CHECK_INTERVAL:
+        return
+    _version_checked_at = now
+
+    try:
+        value = int(await get_redis().get(USER_CACHE_VERSION_KEY) or 0)
+    except RedisError as e:
+        # Redis 장애 시 USER_CACHE_TTL로만 만료
+        logger.warning("User cache version check failed", error=str(e))
+        return
+    if value != _version:
+        user_cache.clear()
+        _version = value
+
+
+async def _bump_version() -> None:
+    global _version, _version_checked_at
+    try:
+        value = await get_redis().incr(USER_CACHE_VERSION_KEY)
+    except RedisError as e:
+        logger.warning("User cache version bump failed", error=str(e))
+        return
+    # 그 사이 다른 워커도 올렸다면 그 변경은 아직 반영하지 못했다
+    if value != _version + 1:
+        user_cache.clear()
+    _version = value
+    _version_checked_at = time.monotonic()
+
+
+def _record_change(target: User, broadcast: bool) -> None:
+    session = object_session(target)
+    if session is None:
+        return
+    user_ids, pending_broadcast = session.info.get(_PENDING_KEY, (set(), False))
+    user_ids.add(target.id)
+    session.info[_PENDING_KEY] = (user_ids, pending_broadcast or broadcast)
+
+
+@event.listens_for(User, "after_update")
+def _user_updated(mapper, connection, target: User) -> None:
+    state = inspect(target)
+    _record_change(
+        target,
+        any(
+            state.attrs[attr.key].history.has_changes()
+            for attr in mapper.column_attrs
+            if attr.key not in _LOCAL_ONLY_COLUMNS
+        ),
+    )
+
+
+@event.listens_for(User, "after_delete")
+def _user_deleted(mapper, connection, target: User) -> None:
+    _record_change(target, True)
+
+
+# flush 시점에 지우면 커밋 전에 다른 요청이 이전 값을 다시 캐시할 수 있으므로
+# 커밋된 뒤에 이 워커의 항목을 지우고, 다른 워커에는 버전 키로 알린다
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session: Session) -> None:
+    pending = session.info.pop(_PENDING_KEY, None)
+    if pending is None:
+        return
+    user_ids, broadcast = pending
+    for user_id in user_ids:
+        invalidate_user(user_id)
+    if not broadcast:
+        return
+
+    try:
+        task = asyncio.get_running_loop().create_task(_bump_version())
+    except RuntimeError:
+        return
+    _pending_bumps.add(task)
+    task.add_done_callback(_pending_bumps.discard)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
@@ -1,34 +1,79 @@
 from fastapi import FastAPI, Depends
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
-from strawberry.fastapi import GraphQLRouter
 import strawberry
+from strawberry.extensions import ParserCache, QueryDepthLimiter, ValidationCache
 from app.core.config import settings
 from app.api.graphql.queries import Query
 from app.api.graphql.mutations import Mutation
-from app.core.dependencies import get_current_active_user
+from app.api.graphql.subscriptions import Subscription
+from app.api import attachments, exports
+from app.api.graphql.context import get_context
+from app.api.graphql.extensions import QueryCostLimiter
+from app.api.graphql.http_cache import CachingGraphQLRouter, HTTPCaching
+from app.api.graphql.persisted_queries import PersistedQueries
+from app.api.graphql.response_cache import ResponseCaching, response_cache
+from app.core.database import pool_stats, pool_status
+from app.core.change_hub import change_hub
+from app.core.dependencies import get_graphql_user
+from app.core.hashing import password_hasher
+from app.core.redis import close_redis
+from app.core.user_cache import user_cache
+from app.services.activity_log_writer import activity_log_writer
+from app.services.project_count_reconciler import project_count_reconciler
+from contextlib import asynccontextmanager
 import os
 
 # GraphQL 스키마 생성
-schema = strawberry.Schema(query=Query, mutation=Mutation)
+schema = strawberry.Schema(
+    query=Query,
+    mutation=Mutation,
+    subscription=Subscription,
+    extensions=[
+        PersistedQueries,
+        # 같은 문서는 한 번만 파싱/검증
+        ParserCache(maxsize=settings.GRAPHQL_DOCUMENT_CACHE_SIZE),
+        ValidationCache(maxsize=settings.GRAPHQL_DOCUMENT_CACHE_SIZE),
+        QueryDepthLimiter(max_depth=settings.GRAPHQL_MAX_DEPTH),
+        QueryCostLimiter,
+        # 비용 검사를 통과한 읽기 쿼리만 캐시 조회/저장
+        ResponseCaching,
+        # GET 쿼리의 Cache-Control/ETag (If-None-Match 일치 시 304)
+        HTTPCaching,
+    ],
+)
 
 # GraphQL 라우터 생성 (인증 의존성 추가)
-graphql_app = GraphQLRouter(
+graphql_app = CachingGraphQLRouter(
     schema,
+    context_getter=get_context,
     dependencies=(
-        [Depends(get_current_active_user)]
+        [Depends(get_graphql_user)]
         if os.getenv("REQUIRE_AUTH", "true") == "true"
         else []
     ),
 )
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    activity_log_writer.start()
+    project_count_reconciler.start()
+    await change_hub.start()
+    yield
+    # 종료 시 공용 리소스 정리 (활동 로그는 큐를 비운 뒤 종료)
+    await change_hub.stop()
+    await project_count_reconciler.stop()
+    await activity_log_writer.stop()
+    await close_redis()
+    password_hasher.shutdown()
+
 # FastAPI 앱 생성
 app = FastAPI(
     title="PMS API",
     description="Project Management System API",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan,
 )
 
 # CORS 설정
@@ -43,15 +88,11 @@ app.add_middleware(
 # GraphQL 라우터 추가
 app.include_router(graphql_app, prefix="/graphql")
 
-# 정적 파일 서빙 (업로드된 파일용)
-if not os.path.exists(settings.UPLOAD_DIR):
-    os.makedirs(settings.UPLOAD_DIR)
+# 대용량 내보내기 (스트리밍)
+app.include_router(exports.router)
 
-app.mount(
-    "/uploads",
-    StaticFiles(directory=settings.UPLOAD_DIR),
-    name="uploads"
-)
+# 첨부 파일 업로드 (스트리밍, 이어 올리기)와 권한 확인 후 다운로드
+app.include_router(attachments.router)
 
 @app.get("/")
 async def root():
@@ -65,6 +106,31 @@ async def root():
 async def health_check():
     return {"status": "healthy"}
 
+@app.get("/health/db")
+async def database_health_check():
+    # 커넥션 풀 사용량 및 획득 대기/지연
+    return {**pool_status(), **pool_stats.snapshot()}
+
+@app.get("/health/activity-log")
+async def activity_log_health_check():
+    return activity_log_writer.stats()
+
+@app.get("/health/project-counts")
+async def project_count_health_check():
+    return project_count_reconciler.stats()
+
+@app.get("/health/response-cache")
+async def response_cache_health_check():
+    return response_cache.stats()
+
+@app.get("/health/user-cache")
+async def user_cache_health_check():
+    return user_cache.stats()
+
+@app.get("/health/subscriptions")
+async def subscription_health_check():
+    return change_hub.stats()
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8001)
\ No newline at end of file
@@ -1,8 +1,29 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, ForeignKey
+import math
+
+from sqlalchemy import (
+    DDL,
+    Column,
+    Integer,
+    String,
+    DateTime,
+    Boolean,
+    Text,
+    ForeignKey,
+    Index,
+    CheckConstraint,
+    UniqueConstraint,
+    event,
+    text,
+    update,
+)
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, null
 from app.core.database import Base
 
+# 일정 구간 표현식 (GiST 인덱스와 조회 쿼리가 글자 그대로 같아야 인덱스를 쓴다)
+# 끝을 포함해 길이 0인 일정도 빈 구간이 되지 않게 한다
+EVENT_RANGE_BOUNDS = "[]"
+
 
 class Calendar(Base):
     __tablename__ = "calendars"
@@ -11,8 +32,10 @@ class Calendar(Base):
     name = Column(String(100), nullable=False)
     description = Column(Text)
     color = Column(String(7), default="#3B82F6")
-    owner_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    owner_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     is_default = Column(Boolean, default=False)
+    # 가장 긴 일정 길이(초). B-tree 대체 경로에서 start_time 스캔 하한을 정한다
+    max_event_seconds = Column(Integer, nullable=False, default=0, server_default="0")
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     events = relationship("Event", back_populates="calendar")
@@ -20,6 +43,18 @@ class Calendar(Base):
 
 class Event(Base):
     __tablename__ = "events"
+    __table_args__ = (
+        Index("ix_events_calendar_id_start_time", "calendar_id", "start_time"),
+        CheckConstraint("end_time >= start_time", name="ck_events_end_after_start"),
+        # 반복 일정(시리즈)만 담는 부분 인덱스 - 기간 조회 시 시리즈 후보를 따로 찾는다
+        Index(
+            "ix_events_calendar_id_recurring",
+            "calendar_id",
+            "start_time",
+            postgresql_where=text("rrule IS NOT NULL"),
+            sqlite_where=text("rrule IS NOT NULL"),
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(200), nullable=False)
@@ -31,8 +66,76 @@ class Event(Base):
     calendar_id = Column(Integer, ForeignKey("calendars.id"), nullable=False)
     project_id = Column(Integer, ForeignKey("projects.id"))
     task_id = Column(Integer, ForeignKey("tasks.id"))
+    # RFC 5545 RRULE (예: "FREQ=WEEKLY;BYDAY=MO,WE"). NULL이면 단일 일정이고,
+    # 값이 있으면 start_time/end_time은 첫 회차이며 회차는 조회 시점에 펼친다
+    rrule = Column(String(500))
+    recurrence_end = Column(DateTime(timezone=True))  # 마지막 회차 종료 시각, NULL이면 무기한
+    # 반복 규칙을 펼치는 IANA 시간대 (RFC 5545 TZID, 예: "Asia/Seoul")
+    timezone = Column(String(64), nullable=False, default="UTC", server_default="UTC")
     created_by = Column(Integer, ForeignKey("users.id"), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), default=null(), onupdate=func.now())
 
     calendar = relationship("Calendar", back_populates="events")
+    exceptions = relationship(
+        "EventException", back_populates="event", cascade="all, delete-orphan"
+    )
+
+
+class EventException(Base):
+    """반복 일정의 특정 회차 취소/변경 (바뀐 회차만 저장)"""
+
+    __tablename__ = "event_exceptions"
+    __table_args__ = (
+        UniqueConstraint(
+            "event_id",
+            "original_start",
+            name="uq_event_exceptions_event_id_original_start",
+        ),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    event_id = Column(
+        Integer, ForeignKey("events.id", ondelete="CASCADE"), nullable=False
+    )
+    original_start = Column(DateTime(timezone=True), nullable=False)  # 규칙상 회차 시작
+    is_cancelled = Column(Boolean, nullable=False, default=False, server_default=text("false"))
+    # 변경된 값만 채운다 (NULL이면 시리즈 값 사용)
+    title = Column(String(200))
+    description = Column(Text)
+    start_time = Column(DateTime(timezone=True))
+    end_time = Column(DateTime(timezone=True))
+    location = Column(String(200))
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), default=null(), onupdate=func.now())
+
+    event = relationship("Event", back_populates="exceptions")
+
+
+# PostgreSQL: (calendar_id, tstzrange) GiST 인덱스로 구간 겹침(&&)을 찾는다
+# (마이그레이션 008과 동일, 스칼라 컬럼을 GiST에 넣으려면 btree_gist 필요)
+for _statement in (
+    "CREATE EXTENSION IF NOT EXISTS btree_gist",
+    "CREATE INDEX ix_events_calendar_id_time_range ON events USING gist "
+    f"(calendar_id, tstzrange(start_time, end_time, '{EVENT_RANGE_BOUNDS}'))",
+):
+    event.listen(
+        Event.__table__,
+        "after_create",
+        DDL(_statement).execute_if(dialect="postgresql"),
+    )
+
+
+@event.listens_for(Event, "after_insert")
+@event.listens_for(Event, "after_update")
+def _track_max_event_seconds(mapper, connection, target: Event) -> None:
+    """캘린더의 최장 일정 길이를 늘리기만 한다 (줄지 않아도 결과는 정확)"""
+    seconds = math.ceil((target.end_time - target.start_time).total_seconds())
+    connection.execute(
+        update(Calendar.__table__)
+        .where(
+            Calendar.id == target.calendar_id,
+            Calendar.max_event_seconds < seconds,
+        )
+        .values(max_event_seconds=seconds)
+    )
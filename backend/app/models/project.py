@@ -6,10 +6,11 @@ from sqlalchemy import (
     Boolean,
     Text,
     Enum as SQLEnum,
-    ForeignKey
+    ForeignKey,
+    Index
 )
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, null
 from enum import Enum
 from app.core.database import Base
 
@@ -28,6 +29,10 @@ class ProjectPriority(str, Enum):
 
 class Project(Base):
     __tablename__ = "projects"
+    __table_args__ = (
+        # 키셋 페이지네이션 (created_at, id) 정렬용
+        Index("ix_projects_created_at_id", "created_at", "id"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(200), nullable=False, index=True)
@@ -36,12 +41,20 @@ class Project(Base):
     priority = Column(SQLEnum(ProjectPriority), default=ProjectPriority.MEDIUM)
     start_date = Column(DateTime(timezone=True))
     end_date = Column(DateTime(timezone=True))
-    creator_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    creator_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     is_active = Column(Boolean, default=True)
     budget = Column(Integer)  # 예산 (원 단위)
-    progress = Column(Integer, default=0)  # 진행률 (0-100)
+    progress = Column(Integer, default=0)  # 진행률 (0-100, 완료 작업 비율)
+    # 상태별 작업 수 롤업: 작업 생성/상태 변경/삭제 시 StatsService가 델타를 반영하고
+    # ProjectCountReconciler가 주기적으로 실제 값과 맞춘다
+    tasks_total = Column(Integer, nullable=False, default=0, server_default="0")
+    tasks_todo = Column(Integer, nullable=False, default=0, server_default="0")
+    tasks_in_progress = Column(Integer, nullable=False, default=0, server_default="0")
+    tasks_in_review = Column(Integer, nullable=False, default=0, server_default="0")
+    tasks_done = Column(Integer, nullable=False, default=0, server_default="0")
+    tasks_blocked = Column(Integer, nullable=False, default=0, server_default="0")
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), default=null(), onupdate=func.now())
     
     # Relationships
     creator = relationship("User", back_populates="created_projects")
@@ -52,6 +65,10 @@ class Project(Base):
 
 class ProjectMember(Base):
     __tablename__ = "project_members"
+    __table_args__ = (
+        Index("ix_project_members_user_id_project_id", "user_id", "project_id"),
+        Index("ix_project_members_project_id_user_id", "project_id", "user_id"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     project_id = Column(Integer, ForeignKey("projects.id"), nullable=False)
@@ -64,18 +81,30 @@ class ProjectMember(Base):
 
 class ProjectComment(Base):
     __tablename__ = "project_comments"
+    __table_args__ = (
+        # 프로젝트별 최상위 댓글 키셋 페이지네이션 (parent_id IS NULL)
+        Index(
+            "ix_project_comments_project_id_parent_id_created_at_id",
+            "project_id",
+            "parent_id",
+            "created_at",
+            "id",
+        ),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     project_id = Column(Integer, ForeignKey("projects.id"), nullable=False)
     author_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     content = Column(Text, nullable=False)
-    parent_id = Column(Integer, ForeignKey("project_comments.id"))  # 대댓글용
+    parent_id = Column(Integer, ForeignKey("project_comments.id"), index=True)  # 대댓글용
+    reply_count = Column(Integer, nullable=False, default=0, server_default="0")  # 하위 답글 전체 수
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), default=null(), onupdate=func.now())
     
     project = relationship("Project", back_populates="comments")
     author = relationship("User", back_populates="project_comments")
-    replies = relationship("ProjectComment", remote_side=[id])
+    parent = relationship("ProjectComment", remote_side=[id], back_populates="replies")
+    replies = relationship("ProjectComment", back_populates="parent")
 
 class ProjectAttachment(Base):
     __tablename__ = "project_attachments"
@@ -86,6 +115,8 @@ class ProjectAttachment(Base):
     file_path = Column(String(500), nullable=False)
     file_size = Column(Integer)
     mime_type = Column(String(100))
+    # 내용 SHA-256 (같은 내용은 blobs/ 아래 파일 하나를 공유한다)
+    content_hash = Column(String(64), index=True)
     uploaded_by = Column(Integer, ForeignKey("users.id"), nullable=False)
     uploaded_at = Column(DateTime(timezone=True), server_default=func.now())
     
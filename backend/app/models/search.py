@@ -0,0 +1,84 @@
+from typing import Dict, List, Tuple
+
+from sqlalchemy import DDL, event
+
+from app.models.project import Project, ProjectComment
+from app.models.task import Task, TaskComment
+
+# 한국어/영어가 섞여 있어 형태소 분석 없이 토큰 단위로 색인
+SEARCH_CONFIG = "simple"
+
+# 모델 -> [(컬럼, 가중치)]
+SEARCH_DOCUMENTS: Dict[type, List[Tuple[str, str]]] = {
+    Project: [("name", "A"), ("description", "B")],
+    Task: [("title", "A"), ("description", "B")],
+    TaskComment: [("content", "B")],
+    ProjectComment: [("content", "B")],
+}
+
+# bm25() 컬럼 가중치 (PostgreSQL setweight A/B에 대응)
+FTS5_WEIGHTS = {"A": 10.0, "B": 1.0}
+
+
+def search_vector_sql(columns: List[Tuple[str, str]]) -> str:
+    return " || ".join(
+        f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce({column}, '')), '{weight}')"
+        for column, weight in columns
+    )
+
+
+def fts_table(tablename: str) -> str:
+    return f"{tablename}_fts"
+
+
+def _register(model: type, columns: List[Tuple[str, str]]) -> None:
+    """create_all/drop_all 시 검색 색인도 함께 생성/삭제
+
+    PostgreSQL은 저장 생성 컬럼 + GIN 인덱스(마이그레이션 005와 동일),
+    SQLite는 외부 콘텐츠 FTS5 테이블과 동기화 트리거를 쓴다.
+    """
+    table = model.__table__
+    tablename = table.name
+    names = [column for column, _ in columns]
+    fts = fts_table(tablename)
+    new_values = ", ".join(f"new.{name}" for name in names)
+    old_values = ", ".join(f"old.{name}" for name in names)
+    column_list = ", ".join(names)
+
+    postgresql = [
+        f"ALTER TABLE {tablename} ADD COLUMN search_vector tsvector "
+        f"GENERATED ALWAYS AS ({search_vector_sql(columns)}) STORED",
+        f"CREATE INDEX ix_{tablename}_search_vector ON {tablename} "
+        f"USING gin (search_vector)",
+    ]
+    sqlite = [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5("
+        f"{column_list}, content='{tablename}', content_rowid='id')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {tablename} BEGIN "
+        f"INSERT INTO {fts}(rowid, {column_list}) VALUES (new.id, {new_values}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {tablename} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {column_list}) "
+        f"VALUES ('delete', old.id, {old_values}); END",
+        # 색인 컬럼이 바뀔 때만 (reply_count 같은 카운터 갱신은 재색인하지 않음)
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {column_list} "
+        f"ON {tablename} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {column_list}) "
+        f"VALUES ('delete', old.id, {old_values}); "
+        f"INSERT INTO {fts}(rowid, {column_list}) VALUES (new.id, {new_values}); END",
+    ]
+
+    for statement in postgresql:
+        event.listen(
+            table, "after_create", DDL(statement).execute_if(dialect="postgresql")
+        )
+    for statement in sqlite:
+        event.listen(table, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+    event.listen(
+        table,
+        "before_drop",
+        DDL(f"DROP TABLE IF EXISTS {fts}").execute_if(dialect="sqlite"),
+    )
+
+
+for _model, _columns in SEARCH_DOCUMENTS.items():
+    _register(_model, _columns)
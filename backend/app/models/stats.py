@@ -0,0 +1,23 @@
+from sqlalchemy import Column, Integer, String, DateTime, UniqueConstraint
+from sqlalchemy.sql import func
+from app.core.database import Base
+
+
+class StatsCounter(Base):
+    """대시보드용 사전 집계 카운터 (scope: user, 프로젝트 작업 수는 projects 행에 있다)"""
+
+    __tablename__ = "stats_counters"
+    __table_args__ = (
+        UniqueConstraint(
+            "scope", "scope_id", "metric", name="uq_stats_counters_scope_metric"
+        ),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    scope = Column(String(20), nullable=False)
+    scope_id = Column(Integer, nullable=False)
+    metric = Column(String(50), nullable=False)  # projects_total, tasks_done, ...
+    value = Column(Integer, nullable=False, default=0)
+    updated_at = Column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
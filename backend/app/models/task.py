@@ -1,6 +1,6 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, Enum as SQLEnum, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, Enum as SQLEnum, ForeignKey, Index
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, null
 from enum import Enum
 from app.core.database import Base
 
@@ -19,6 +19,12 @@ class TaskPriority(str, Enum):
 
 class Task(Base):
     __tablename__ = "tasks"
+    __table_args__ = (
+        # 키셋 페이지네이션 (created_at, id) 정렬용
+        Index("ix_tasks_created_at_id", "created_at", "id"),
+        Index("ix_tasks_project_id_created_at_id", "project_id", "created_at", "id"),
+        Index("ix_tasks_project_id_status_due_date", "project_id", "status", "due_date"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(200), nullable=False, index=True)
@@ -26,7 +32,7 @@ class Task(Base):
     status = Column(SQLEnum(TaskStatus), default=TaskStatus.TODO)
     priority = Column(SQLEnum(TaskPriority), default=TaskPriority.MEDIUM)
     project_id = Column(Integer, ForeignKey("projects.id"), nullable=False)
-    parent_task_id = Column(Integer, ForeignKey("tasks.id"))  # 하위 작업용
+    parent_task_id = Column(Integer, ForeignKey("tasks.id"), index=True)  # 하위 작업용
     estimated_hours = Column(Integer)
     actual_hours = Column(Integer)
     start_date = Column(DateTime(timezone=True))
@@ -34,12 +40,12 @@ class Task(Base):
     completed_at = Column(DateTime(timezone=True))
     created_by = Column(Integer, ForeignKey("users.id"), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), default=null(), onupdate=func.now())
     
     # Relationships
     project = relationship("Project", back_populates="tasks")
-    parent_task = relationship("Task", remote_side=[id])
-    subtasks = relationship("Task", remote_side=[parent_task_id])
+    parent_task = relationship("Task", remote_side=[id], back_populates="subtasks")
+    subtasks = relationship("Task", back_populates="parent_task")
     assignments = relationship("TaskAssignment", back_populates="task")
     comments = relationship("TaskComment", back_populates="task")
     attachments = relationship("TaskAttachment", back_populates="task")
@@ -47,6 +53,10 @@ class Task(Base):
 
 class TaskAssignment(Base):
     __tablename__ = "task_assignments"
+    __table_args__ = (
+        Index("ix_task_assignments_user_id_task_id", "user_id", "task_id"),
+        Index("ix_task_assignments_task_id_user_id", "task_id", "user_id"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     task_id = Column(Integer, ForeignKey("tasks.id"), nullable=False)
@@ -55,22 +65,34 @@ class TaskAssignment(Base):
     assigned_at = Column(DateTime(timezone=True), server_default=func.now())
     
     task = relationship("Task", back_populates="assignments")
-    user = relationship("User", back_populates="assigned_tasks")
+    user = relationship("User", back_populates="assigned_tasks", foreign_keys=[user_id])
 
 class TaskComment(Base):
     __tablename__ = "task_comments"
+    __table_args__ = (
+        # 작업별 최상위 댓글 키셋 페이지네이션 (parent_id IS NULL)
+        Index(
+            "ix_task_comments_task_id_parent_id_created_at_id",
+            "task_id",
+            "parent_id",
+            "created_at",
+            "id",
+        ),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     task_id = Column(Integer, ForeignKey("tasks.id"), nullable=False)
     author_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     content = Column(Text, nullable=False)
-    parent_id = Column(Integer, ForeignKey("task_comments.id"))
+    parent_id = Column(Integer, ForeignKey("task_comments.id"), index=True)
+    reply_count = Column(Integer, nullable=False, default=0, server_default="0")  # 하위 답글 전체 수
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), default=null(), onupdate=func.now())
     
     task = relationship("Task", back_populates="comments")
     author = relationship("User", back_populates="task_comments")
-    replies = relationship("TaskComment", remote_side=[id])
+    parent = relationship("TaskComment", remote_side=[id], back_populates="replies")
+    replies = relationship("TaskComment", back_populates="parent")
 
 class TaskAttachment(Base):
     __tablename__ = "task_attachments"
@@ -81,6 +103,8 @@ class TaskAttachment(Base):
     file_path = Column(String(500), nullable=False)
     file_size = Column(Integer)
     mime_type = Column(String(100))
+    # 내용 SHA-256 (같은 내용은 blobs/ 아래 파일 하나를 공유한다)
+    content_hash = Column(String(64), index=True)
     uploaded_by = Column(Integer, ForeignKey("users.id"), nullable=False)
     uploaded_at = Column(DateTime(timezone=True), server_default=func.now())
     
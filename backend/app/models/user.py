@@ -1,6 +1,6 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, Enum as SQLEnum
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, Enum as SQLEnum, ForeignKey, Index
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, null
 from enum import Enum
 from app.core.database import Base
 
@@ -12,6 +12,10 @@ class UserRole(str, Enum):
 
 class User(Base):
     __tablename__ = "users"
+    __table_args__ = (
+        # 키셋 페이지네이션 (created_at, id) 정렬용
+        Index("ix_users_created_at_id", "created_at", "id"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     email = Column(String(255), unique=True, index=True, nullable=False)
@@ -27,18 +31,23 @@ class User(Base):
     position = Column(String(100))
     last_login = Column(DateTime(timezone=True))
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), default=null(), onupdate=func.now())
     
     # Relationships
     created_projects = relationship("Project", back_populates="creator")
     project_memberships = relationship("ProjectMember", back_populates="user")
-    assigned_tasks = relationship("TaskAssignment", back_populates="user")
+    assigned_tasks = relationship(
+        "TaskAssignment", back_populates="user", foreign_keys="TaskAssignment.user_id"
+    )
     task_comments = relationship("TaskComment", back_populates="author")
     project_comments = relationship("ProjectComment", back_populates="author")
     activity_logs = relationship("UserActivityLog", back_populates="user")
 
 class UserActivityLog(Base):
     __tablename__ = "user_activity_logs"
+    __table_args__ = (
+        Index("ix_user_activity_logs_user_id_created_at", "user_id", "created_at"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"))
@@ -0,0 +1,174 @@
+import asyncio
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import insert
+
+from app.core.config import settings
+from app.core.database import async_session_maker
+from app.models.user import UserActivityLog
+from app.utils.logger import logger
+
+# UserActivityLog 테이블에 저장되는 필드 (나머지는 구조화 로그에만 남긴다)
+DB_FIELDS = (
+    "user_id",
+    "action",
+    "resource_type",
+    "resource_id",
+    "description",
+    "ip_address",
+    "user_agent",
+    "created_at",
+)
+
+# stop()이 큐에 넣는 종료 표시 (앞선 이벤트를 모두 기록한 뒤 멈춘다)
+_STOP = object()
+
+
+class ActivityLogWriter:
+    """사용자 활동 로그 일괄 기록기
+
+    이벤트를 메모리 큐에 쌓았다가 `batch_size`개가 모이거나 `flush_interval`초가
+    지나면 구조화 로그 출력과 다중 행 INSERT 한 번으로 함께 내보낸다.
+    큐가 가득 차면 `write()`는 자리가 날 때까지 기다린다 (backpressure).
+    """
+
+    def __init__(self, max_queue: int, batch_size: int, flush_interval: float):
+        self.max_queue = max_queue
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_queue)
+        self._task = asyncio.create_task(self._run(), name="activity-log-writer")
+
+    async def stop(self) -> None:
+        """큐에 남은 이벤트를 모두 기록한 뒤 종료
+
+        취소하지 않고 큐에 종료 표시를 넣으므로 진행 중인 기록은 끝까지 마친다.
+        """
+        if self._task is None:
+            return
+        if not self._task.done():
+            await self._queue.put(_STOP)
+        await self._task
+        self._task = None
+
+    async def write(self, event: Dict[str, Any]) -> None:
+        event = self._stamp(event)
+        if not self.running:
+            await self._flush([event])
+            return
+        await self._queue.put(event)
+
+    def record(self, event: Dict[str, Any]) -> None:
+        """동기 코드용 비차단 기록 (큐가 가득 차면 버리고 집계)"""
+        event = self._stamp(event)
+        if not self.running:
+            try:
+                asyncio.get_running_loop().create_task(self._flush([event]))
+            except RuntimeError:
+                self._log(event)
+            return
+
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.dropped += 1
+            logger.warning("Activity log queue full, event dropped", **event)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "queue_depth": self._queue.qsize() if self._queue else 0,
+            "max_queue": self.max_queue,
+            "written": self.written,
+            "dropped": self.dropped,
+            "failed": self.failed,
+        }
+
+    def _stamp(self, event: Dict[str, Any]) -> Dict[str, Any]:
+        # 실제 기록 시점이 아닌 발생 시점을 남긴다
+        event.setdefault("created_at", datetime.now(timezone.utc))
+        return event
+
+    def _log(self, event: Dict[str, Any]) -> None:
+        logger.info(
+            "User activity",
+            **{
+                key: value
+                for key, value in event.items()
+                if key != "created_at" and value is not None
+            },
+        )
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            event = await self._queue.get()
+            if event is _STOP:
+                break
+            batch: List[Dict[str, Any]] = [event]
+            deadline = loop.time() + self.flush_interval
+
+            while len(batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    event = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if event is _STOP:
+                    stopping = True
+                    break
+                batch.append(event)
+
+            await self._flush(batch)
+
+        # 종료 표시 뒤에 들어온 잔량까지 기록
+        batch = []
+        while not self._queue.empty():
+            event = self._queue.get_nowait()
+            if event is not _STOP:
+                batch.append(event)
+        for start in range(0, len(batch), self.batch_size):
+            await self._flush(batch[start : start + self.batch_size])
+
+    async def _flush(self, batch: List[Dict[str, Any]]) -> None:
+        if not batch:
+            return
+
+        for event in batch:
+            self._log(event)
+
+        rows = [{field: event.get(field) for field in DB_FIELDS} for event in batch]
+        try:
+            async with async_session_maker() as session:
+                # executemany → 다중 행 INSERT로 묶여 한 번에 전송
+                await session.execute(insert(UserActivityLog), rows)
+                await session.commit()
+            self.written += len(rows)
+        except Exception as e:
+            self.failed += len(rows)
+            logger.error("Activity log flush failed", error=str(e), count=len(rows))
+
+
+activity_log_writer = ActivityLogWriter(
+    max_queue=settings.ACTIVITY_LOG_QUEUE_SIZE,
+    batch_size=settings.ACTIVITY_LOG_BATCH_SIZE,
+    flush_interval=settings.ACTIVITY_LOG_FLUSH_INTERVAL,
+)
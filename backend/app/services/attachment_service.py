@@ -0,0 +1,382 @@
+import asyncio
+import fcntl
+import hashlib
+import json
+import mimetypes
+import os
+import re
+import secrets
+import time
+from dataclasses import asdict, dataclass
+from typing import AsyncIterator, Optional, Union
+
+import aiofiles
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.models.project import Project, ProjectAttachment
+from app.models.task import Task, TaskAttachment
+from app.services.project_service import ProjectService
+
+# UPLOAD_DIR 아래 하위 디렉터리
+BLOB_DIR = "blobs"  # 내용 해시로 저장된 완성 파일
+PARTIAL_DIR = "partial"  # 업로드 중인 파일과 이어 올리기 세션
+
+HASH_READ_SIZE = 1024 * 1024
+PURGE_INTERVAL = 3600.0  # seconds
+
+ATTACHMENT_MODELS = {"projects": ProjectAttachment, "tasks": TaskAttachment}
+
+_UPLOAD_ID = re.compile(r"[0-9a-f]{32}")
+_last_purge = 0.0
+
+
+class UploadTooLarge(Exception):
+    """MAX_FILE_SIZE 또는 세션에 선언한 길이를 넘는 본문"""
+
+
+class UploadBusy(Exception):
+    """같은 세션에 다른 요청이 쓰는 중"""
+
+
+class UploadOffsetMismatch(Exception):
+    """요청한 오프셋이 서버에 저장된 길이와 다름"""
+
+    def __init__(self, offset: int):
+        super().__init__(f"Upload offset is {offset}")
+        self.offset = offset
+
+
+@dataclass
+class StoredFile:
+    path: str  # UPLOAD_DIR 기준 상대 경로
+    content_hash: str
+    size: int
+    deduplicated: bool
+
+
+@dataclass(frozen=True)
+class AttachmentFile:
+    path: str  # UPLOAD_DIR 기준 상대 경로
+    filename: str
+    mime_type: Optional[str]
+    content_hash: Optional[str]
+
+
+@dataclass
+class UploadSession:
+    id: str
+    user_id: int
+    target: str
+    target_id: int
+    filename: str
+    mime_type: str
+    length: int
+    offset: int = 0
+
+
+# (user_id, target, attachment_id) -> AttachmentFile
+# 영상처럼 Range 요청이 잇따르는 다운로드가 매번 DB를 거치지 않도록 짧게 캐시
+_access_cache = TTLCache(
+    maxsize=settings.ATTACHMENT_ACCESS_CACHE_SIZE,
+    ttl=settings.ATTACHMENT_ACCESS_CACHE_TTL,
+)
+
+
+def _upload_path(*parts: str) -> str:
+    return os.path.join(settings.UPLOAD_DIR, *parts)
+
+
+def resolve_upload_path(path: str) -> Optional[str]:
+    """저장된 상대 경로의 실제 경로 (UPLOAD_DIR 밖을 가리키면 None)"""
+    root = os.path.realpath(settings.UPLOAD_DIR)
+    full_path = os.path.realpath(os.path.join(root, path))
+    return full_path if full_path.startswith(root + os.sep) else None
+
+
+def blob_path(content_hash: str) -> str:
+    return os.path.join(BLOB_DIR, content_hash[:2], content_hash[2:4], content_hash)
+
+
+def clean_filename(filename: str) -> str:
+    name = os.path.basename(filename.replace("\\", "/")).strip()
+    return name[:255] or "file"
+
+
+def guess_mime_type(filename: str, content_type: Optional[str]) -> str:
+    if content_type:
+        content_type = content_type.split(";")[0].strip()
+        if content_type not in (
+            "",
+            "application/octet-stream",
+            "application/offset+octet-stream",
+        ):
+            return content_type[:100]
+    return mimetypes.guess_type(filename)[0] or "application/octet-stream"
+
+
+def _remove(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+async def _append(
+    file,
+    chunks: AsyncIterator[bytes],
+    limit: int,
+    written: int,
+    hasher=None,
+) -> int:
+    """청크를 받는 대로 파일에 쓰고 누적 크기가 limit를 넘는 즉시 중단"""
+    async for chunk in chunks:
+        if not chunk:
+            continue
+        written += len(chunk)
+        if written > limit:
+            raise UploadTooLarge(f"File exceeds {limit} bytes")
+        if hasher is not None:
+            hasher.update(chunk)
+        await file.write(chunk)
+    return written
+
+
+def _hash_file(path: str) -> str:
+    hasher = hashlib.sha256()
+    with open(path, "rb") as file:
+        while block := file.read(HASH_READ_SIZE):
+            hasher.update(block)
+    return hasher.hexdigest()
+
+
+def _commit_blob(temp_path: str, content_hash: str) -> StoredFile:
+    """임시 파일을 내용 주소 위치로 옮긴다 (이미 있으면 임시 파일만 지운다)"""
+    path = blob_path(content_hash)
+    target = _upload_path(path)
+    size = os.path.getsize(temp_path)
+    if os.path.exists(target):
+        _remove(temp_path)
+        return StoredFile(path, content_hash, size, deduplicated=True)
+
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    # 같은 파일시스템 안의 rename이라 원자적이고, 동시에 같은 내용이 올라와도
+    # 마지막 rename이 같은 내용으로 덮어쓸 뿐이다
+    os.replace(temp_path, target)
+    return StoredFile(path, content_hash, size, deduplicated=False)
+
+
+def _purge_stale_uploads() -> None:
+    """UPLOAD_SESSION_TTL 동안 쓰이지 않은 임시 파일/세션 정리"""
+    directory = _upload_path(PARTIAL_DIR)
+    cutoff = time.time() - settings.UPLOAD_SESSION_TTL
+    try:
+        names = os.listdir(directory)
+    except FileNotFoundError:
+        return
+    for name in names:
+        path = os.path.join(directory, name)
+        try:
+            if os.path.getmtime(path) < cutoff:
+                os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+class AttachmentService:
+    """첨부 파일 저장 (스트리밍, 내용 주소 기반 중복 제거, 이어 올리기)와 다운로드 권한 조회
+
+    본문은 받는 청크 그대로 `partial/` 아래 임시 파일에 쓰면서 해시를 계산하고,
+    크기 제한은 누적 바이트로 검사하므로 메모리 사용은 청크 하나 크기다. 완성된
+    파일은 SHA-256 경로(`blobs/ab/cd/<hash>`)로 옮겨지며 같은 내용은 한 번만
+    저장된다.
+
+    이어 올리기 세션은 `partial/<id>.json`(메타데이터)과 `<id>.part`(받은
+    바이트)로 디스크에 두므로 워커가 달라도 이어진다. 현재 오프셋은 항상
+    `.part` 파일 길이다.
+    """
+
+    @staticmethod
+    async def get_target_project_id(
+        db: AsyncSession, user_id: int, target: str, target_id: int
+    ) -> Optional[int]:
+        """사용자가 접근할 수 있는 첨부 대상의 프로젝트 id (없으면 None)"""
+        accessible = ProjectService.accessible_project_ids(user_id)
+        if target == "projects":
+            query = select(Project.id).where(
+                Project.id == target_id, Project.id.in_(accessible)
+            )
+        else:
+            query = select(Task.project_id).where(
+                Task.id == target_id, Task.project_id.in_(accessible)
+            )
+        result = await db.execute(query)
+        return result.scalar_one_or_none()
+
+    @staticmethod
+    async def get_attachment_file(
+        db: AsyncSession, user_id: int, target: str, attachment_id: int
+    ) -> Optional[AttachmentFile]:
+        """사용자가 접근할 수 있는 첨부의 파일 정보 (권한 확인까지 한 번의 조회)
+
+        찾은 결과만 ATTACHMENT_ACCESS_CACHE_TTL 동안 캐시하므로, 멤버에서
+        빠진 사용자는 그 시간까지 이미 열어 본 첨부를 더 받을 수 있다.
+        """
+        key = (user_id, target, attachment_id)
+        cached = _access_cache.get(key)
+        if cached is not None:
+            return cached
+
+        model = ATTACHMENT_MODELS[target]
+        accessible = ProjectService.accessible_project_ids(user_id)
+        query = select(
+            model.file_path, model.filename, model.mime_type, model.content_hash
+        ).where(model.id == attachment_id)
+        if target == "projects":
+            query = query.where(model.project_id.in_(accessible))
+        else:
+            query = query.join(Task, Task.id == model.task_id).where(
+                Task.project_id.in_(accessible)
+            )
+
+        row = (await db.execute(query)).one_or_none()
+        if row is None:
+            return None
+        attachment_file = AttachmentFile(*row)
+        _access_cache.set(key, attachment_file)
+        return attachment_file
+
+    @staticmethod
+    async def create_attachment(
+        db: AsyncSession,
+        target: str,
+        target_id: int,
+        user_id: int,
+        filename: str,
+        mime_type: str,
+        stored: StoredFile,
+    ) -> Union[ProjectAttachment, TaskAttachment]:
+        model = ATTACHMENT_MODELS[target]
+        attachment = model(
+            filename=filename,
+            file_path=stored.path,
+            file_size=stored.size,
+            mime_type=mime_type,
+            content_hash=stored.content_hash,
+            uploaded_by=user_id,
+            **{"project_id" if target == "projects" else "task_id": target_id},
+        )
+        db.add(attachment)
+        await db.flush()
+        return attachment
+
+    @staticmethod
+    async def save_stream(chunks: AsyncIterator[bytes]) -> StoredFile:
+        """한 번에 올리는 본문 저장 (실패하면 임시 파일을 남기지 않는다)"""
+        temp_path = _upload_path(PARTIAL_DIR, f"{secrets.token_hex(16)}.tmp")
+        os.makedirs(os.path.dirname(temp_path), exist_ok=True)
+        hasher = hashlib.sha256()
+        try:
+            async with aiofiles.open(temp_path, "wb") as file:
+                await _append(file, chunks, settings.MAX_FILE_SIZE, 0, hasher)
+            return await asyncio.to_thread(_commit_blob, temp_path, hasher.hexdigest())
+        except BaseException:
+            _remove(temp_path)
+            raise
+
+    @staticmethod
+    async def create_session(
+        user_id: int,
+        target: str,
+        target_id: int,
+        filename: str,
+        mime_type: str,
+        length: int,
+    ) -> UploadSession:
+        global _last_purge
+        if length > settings.MAX_FILE_SIZE:
+            raise UploadTooLarge(f"File exceeds {settings.MAX_FILE_SIZE} bytes")
+
+        if time.monotonic() - _last_purge > PURGE_INTERVAL:
+            _last_purge = time.monotonic()
+            await asyncio.to_thread(_purge_stale_uploads)
+
+        session = UploadSession(
+            id=secrets.token_hex(16),
+            user_id=user_id,
+            target=target,
+            target_id=target_id,
+            filename=filename,
+            mime_type=mime_type,
+            length=length,
+        )
+        os.makedirs(_upload_path(PARTIAL_DIR), exist_ok=True)
+        open(_upload_path(PARTIAL_DIR, f"{session.id}.part"), "xb").close()
+        with open(_upload_path(PARTIAL_DIR, f"{session.id}.json"), "x") as file:
+            json.dump(asdict(session), file)
+        return session
+
+    @staticmethod
+    def get_session(upload_id: str, user_id: int) -> Optional[UploadSession]:
+        if not _UPLOAD_ID.fullmatch(upload_id):
+            return None
+        try:
+            with open(_upload_path(PARTIAL_DIR, f"{upload_id}.json")) as file:
+                session = UploadSession(**json.load(file))
+            session.offset = os.path.getsize(
+                _upload_path(PARTIAL_DIR, f"{upload_id}.part")
+            )
+        except FileNotFoundError:
+            return None
+        return session if session.user_id == user_id else None
+
+    @staticmethod
+    def delete_session(session: UploadSession) -> None:
+        _remove(_upload_path(PARTIAL_DIR, f"{session.id}.json"))
+        _remove(_upload_path(PARTIAL_DIR, f"{session.id}.part"))
+
+    @staticmethod
+    async def append_session(
+        session: UploadSession, chunks: AsyncIterator[bytes], offset: int
+    ) -> Optional[StoredFile]:
+        """`offset`부터 이어 쓰고, 선언한 길이를 다 받으면 저장을 마친다
+
+        중간에 연결이 끊겨도 받은 바이트는 남으므로 클라이언트는 HEAD로 오프셋을
+        확인하고 그 지점부터 다시 보낸다. 세션 파일 잠금으로 같은 세션에 대한
+        동시 요청(다른 워커 포함)을 막는다.
+        """
+        part_path = _upload_path(PARTIAL_DIR, f"{session.id}.part")
+        # 이미 완료/삭제된 세션이면 FileNotFoundError ("ab"는 파일을 새로 만든다)
+        async with aiofiles.open(part_path, "r+b") as file:
+            try:
+                fcntl.flock(file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                raise UploadBusy("Upload is in progress") from None
+
+            current = await file.seek(0, os.SEEK_END)
+            if current != offset:
+                raise UploadOffsetMismatch(current)
+
+            # 처음부터 한 요청에 다 받으면 다시 읽지 않고 스트리밍 해시를 쓴다
+            hasher = hashlib.sha256() if offset == 0 else None
+            try:
+                session.offset = await _append(
+                    file, chunks, session.length, offset, hasher
+                )
+            finally:
+                await file.flush()
+
+            if session.offset < session.length:
+                return None
+
+            content_hash = (
+                hasher.hexdigest()
+                if hasher is not None
+                else await asyncio.to_thread(_hash_file, part_path)
+            )
+            # 잠금을 쥔 채로 옮겨야 동시에 완료 처리되는 요청이 없다
+            stored = await asyncio.to_thread(_commit_blob, part_path, content_hash)
+            _remove(_upload_path(PARTIAL_DIR, f"{session.id}.json"))
+            return stored
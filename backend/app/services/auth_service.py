@@ -2,7 +2,8 @@ from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
 from app.models.user import User
-from app.core.security import verify_password, create_access_token
+from app.core.hashing import password_hasher
+from app.core.security import create_access_token
 from app.services.user_service import UserService
 
 class AuthService:
@@ -18,7 +19,7 @@ class AuthService:
             # 사용자명으로 시도
             user = await UserService.get_user_by_username(db, username_or_email)
         
-        if not user or not verify_password(password, user.hashed_password):
+        if not user or not await password_hasher.verify(password, user.hashed_password):
             return None
         
         return user
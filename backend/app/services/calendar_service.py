@@ -0,0 +1,245 @@
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy import and_, func, literal_column, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.calendar import EVENT_RANGE_BOUNDS, Calendar, Event, EventException
+from app.services.recurrence import (
+    Occurrence,
+    as_utc,
+    cache_epoch,
+    cache_window,
+    expand,
+    get_cached_window,
+    get_zone,
+    is_occurrence,
+    series_end,
+)
+
+
+class CalendarService:
+    @staticmethod
+    async def get_owned_calendar(
+        db: AsyncSession, owner_id: int, calendar_id: int
+    ) -> Optional[Calendar]:
+        result = await db.execute(
+            select(Calendar).where(
+                Calendar.id == calendar_id, Calendar.owner_id == owner_id
+            )
+        )
+        return result.scalar_one_or_none()
+
+    @staticmethod
+    async def get_owned_event(
+        db: AsyncSession, owner_id: int, event_id: int
+    ) -> Optional[Event]:
+        result = await db.execute(
+            select(Event)
+            .join(Calendar, Calendar.id == Event.calendar_id)
+            .where(Event.id == event_id, Calendar.owner_id == owner_id)
+        )
+        return result.scalar_one_or_none()
+
+    @staticmethod
+    async def get_events(
+        db: AsyncSession,
+        owner_id: int,
+        range_start: datetime,
+        range_end: datetime,
+        calendar_ids: Optional[Sequence[int]] = None,
+    ) -> List[Occurrence]:
+        """[range_start, range_end)와 겹치는 일정 회차 (일정은 끝 시각 포함, 시작 시각 순)
+
+        단일 일정은 인덱스로 겹침 조회하고, 반복 일정은 기간 안의 회차만 펼친다.
+        펼친 결과는 캘린더별로 캐시되며 시리즈/예외 변경이 커밋되면 무효화된다.
+        """
+        range_start, range_end = as_utc(range_start), as_utc(range_end)
+
+        query = select(Calendar.id, Calendar.max_event_seconds).where(
+            Calendar.owner_id == owner_id
+        )
+        if calendar_ids is not None:
+            query = query.where(Calendar.id.in_(calendar_ids))
+        calendars = (await db.execute(query)).all()
+        if not calendars:
+            return []
+
+        singles = await CalendarService._single_events(
+            db, calendars, range_start, range_end
+        )
+        occurrences = [Occurrence.from_event(event) for event in singles]
+
+        window = (range_start, range_end)
+        epoch = cache_epoch()
+        missing = []
+        for calendar_id, max_event_seconds in calendars:
+            cached = await get_cached_window(calendar_id, window)
+            if cached is None:
+                missing.append((calendar_id, max_event_seconds))
+            else:
+                occurrences.extend(cached)
+
+        if missing:
+            expanded = await CalendarService._expand_series(
+                db, missing, range_start, range_end
+            )
+            for calendar_id, _ in missing:
+                cache_window(calendar_id, window, expanded[calendar_id], epoch)
+                occurrences.extend(expanded[calendar_id])
+
+        occurrences.sort(key=lambda occurrence: (occurrence.start_time, occurrence.id))
+        return occurrences
+
+    @staticmethod
+    async def _single_events(
+        db: AsyncSession, calendars, range_start: datetime, range_end: datetime
+    ) -> List[Event]:
+        """반복 규칙이 없는 일정의 겹침 조회
+
+        PostgreSQL은 (calendar_id, tstzrange) GiST 인덱스에서 `&&`로 찾는다.
+        그 밖의 DB는 (calendar_id, start_time) B-tree를 쓰되, 캘린더의 최장 일정
+        길이만큼만 range_start 앞을 훑도록 start_time 하한을 건다. 어느 쪽이든
+        범위와 겹치는 일정 수에 비례해 읽고, 테이블 크기에는 로그로만 늘어난다.
+        """
+        if db.get_bind().dialect.name == "postgresql":
+            overlaps = and_(
+                Event.calendar_id.in_([calendar_id for calendar_id, _ in calendars]),
+                func.tstzrange(
+                    Event.start_time,
+                    Event.end_time,
+                    literal_column(f"'{EVENT_RANGE_BOUNDS}'"),
+                ).op("&&")(func.tstzrange(range_start, range_end, "[)")),
+            )
+        else:
+            overlaps = and_(
+                or_(
+                    *(
+                        and_(
+                            Event.calendar_id == calendar_id,
+                            Event.start_time
+                            >= range_start - timedelta(seconds=max_event_seconds),
+                            Event.start_time < range_end,
+                        )
+                        for calendar_id, max_event_seconds in calendars
+                    )
+                ),
+                Event.end_time >= range_start,
+            )
+
+        result = await db.execute(select(Event).where(overlaps, Event.rrule.is_(None)))
+        return result.scalars().all()
+
+    @staticmethod
+    async def _expand_series(
+        db: AsyncSession, calendars, range_start: datetime, range_end: datetime
+    ) -> Dict[int, List[Occurrence]]:
+        """캘린더별로 기간에 걸칠 수 있는 시리즈와 그 예외를 읽어 회차를 펼친다"""
+        calendar_ids = [calendar_id for calendar_id, _ in calendars]
+        result = await db.execute(
+            select(Event).where(
+                Event.calendar_id.in_(calendar_ids),
+                Event.rrule.isnot(None),
+                Event.start_time < range_end,
+                or_(
+                    Event.recurrence_end.is_(None), Event.recurrence_end >= range_start
+                ),
+            )
+        )
+        series = result.scalars().all()
+
+        exceptions: Dict[int, List[EventException]] = defaultdict(list)
+        if series:
+            # 기간 안의 회차를 바꾼 예외 + 다른 회차를 기간 안으로 옮긴 예외
+            longest = timedelta(seconds=max(seconds for _, seconds in calendars))
+            result = await db.execute(
+                select(EventException).where(
+                    EventException.event_id.in_([event.id for event in series]),
+                    or_(
+                        and_(
+                            EventException.original_start >= range_start - longest,
+                            EventException.original_start < range_end,
+                        ),
+                        and_(
+                            EventException.start_time < range_end,
+                            EventException.end_time >= range_start,
+                        ),
+                    ),
+                )
+            )
+            for exception in result.scalars():
+                exceptions[exception.event_id].append(exception)
+
+        expanded: Dict[int, List[Occurrence]] = {
+            calendar_id: [] for calendar_id in calendar_ids
+        }
+        for event in series:
+            expanded[event.calendar_id].extend(
+                expand(event, exceptions[event.id], range_start, range_end)
+            )
+        return expanded
+
+    @staticmethod
+    async def create_event(db: AsyncSession, **fields: Any) -> Event:
+        """일정 생성 (반복 규칙은 일정 시간대로 검증하고 마지막 회차 종료 시각을 저장)
+
+        시각은 UTC로 바꿔 저장한다 (SQLite는 오프셋을 버린다).
+        """
+        event = Event(**_utc_times(fields))
+        get_zone(event.timezone)
+        if event.rrule:
+            event.recurrence_end = series_end(
+                event.rrule, event.start_time, event.end_time, event.timezone
+            )
+        db.add(event)
+        await db.flush()
+        return event
+
+    @staticmethod
+    async def set_occurrence_exception(
+        db: AsyncSession,
+        series: Event,
+        original_start: datetime,
+        **changes: Any,
+    ) -> EventException:
+        """회차 하나를 취소(is_cancelled=True)하거나 변경 값을 저장
+
+        같은 회차에 대한 예외는 한 행으로 유지된다.
+        """
+        if not series.rrule:
+            raise ValueError("Event is not recurring")
+        original_start = as_utc(original_start)
+        changes = _utc_times(changes)
+        if not is_occurrence(series, original_start):
+            raise ValueError("No occurrence starts at the given time")
+
+        result = await db.execute(
+            select(EventException).where(
+                EventException.event_id == series.id,
+                EventException.original_start == original_start,
+            )
+        )
+        exception = result.scalar_one_or_none()
+        if exception is None:
+            exception = EventException(
+                event_id=series.id, original_start=original_start
+            )
+            db.add(exception)
+        for field, value in changes.items():
+            setattr(exception, field, value)
+
+        await db.flush()
+        return exception
+
+
+def _utc_times(fields: Dict[str, Any]) -> Dict[str, Any]:
+    """start_time/end_time 값을 UTC로 바꾼 사본"""
+    return {
+        field: (
+            as_utc(value)
+            if field in ("start_time", "end_time") and value is not None
+            else value
+        )
+        for field, value in fields.items()
+    }
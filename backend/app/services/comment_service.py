@@ -0,0 +1,101 @@
+from typing import List, Optional, Sequence, Type, Union
+
+from sqlalchemy import Integer, Select, literal_column, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.project import ProjectComment
+from app.models.task import Task, TaskComment
+from app.services.project_service import ProjectService
+
+CommentModel = Union[Type[TaskComment], Type[ProjectComment]]
+
+
+class CommentService:
+    """작업/프로젝트 댓글 스레드
+
+    최상위 댓글은 (created_at, id) 키셋으로 페이지를 나누고, 한 페이지의 답글
+    하위 트리는 재귀 CTE 한 번으로 가져온다. 각 댓글의 `reply_count`(하위 답글
+    전체 수)는 답글을 달 때 상위 댓글 체인 전체에 한 번의 UPDATE로 반영한다.
+    """
+
+    @staticmethod
+    def thread_query(model: CommentModel, scope_id: int, user_id: int) -> Select:
+        """접근 가능한 작업/프로젝트의 최상위 댓글"""
+        project_ids = ProjectService.accessible_project_ids(user_id)
+        if model is TaskComment:
+            visible = TaskComment.task_id.in_(
+                select(Task.id).where(
+                    Task.id == scope_id, Task.project_id.in_(project_ids)
+                )
+            )
+            scope = TaskComment.task_id == scope_id
+        else:
+            visible = ProjectComment.project_id.in_(project_ids)
+            scope = ProjectComment.project_id == scope_id
+
+        return select(model).where(scope, model.parent_id.is_(None), visible)
+
+    @staticmethod
+    async def get_replies(
+        db: AsyncSession, model: CommentModel, root_ids: Sequence[int]
+    ) -> List[Union[TaskComment, ProjectComment]]:
+        """root_ids 댓글들의 답글 하위 트리 전체 (작성 순)"""
+        tree = (
+            select(model.id, literal_column("1", Integer).label("depth"))
+            .where(model.parent_id.in_(root_ids))
+            .cte("reply_tree", recursive=True)
+        )
+        tree = tree.union_all(
+            select(model.id, tree.c.depth + 1)
+            .join(tree, model.parent_id == tree.c.id)
+            .where(tree.c.depth < settings.COMMENT_THREAD_MAX_DEPTH)
+        )
+
+        result = await db.execute(
+            select(model)
+            .join(tree, tree.c.id == model.id)
+            .order_by(model.created_at, model.id)
+        )
+        return result.scalars().all()
+
+    @staticmethod
+    async def add_comment(
+        db: AsyncSession,
+        comment: Union[TaskComment, ProjectComment],
+    ) -> Union[TaskComment, ProjectComment]:
+        """댓글 추가, 답글이면 상위 댓글 체인의 reply_count를 1씩 올린다"""
+        model = type(comment)
+        db.add(comment)
+
+        if comment.parent_id is not None:
+            ancestors = (
+                select(
+                    model.id,
+                    model.parent_id,
+                    literal_column("1", Integer).label("depth"),
+                )
+                .where(model.id == comment.parent_id)
+                .cte("ancestors", recursive=True)
+            )
+            ancestors = ancestors.union_all(
+                select(model.id, model.parent_id, ancestors.c.depth + 1)
+                .join(ancestors, model.id == ancestors.c.parent_id)
+                .where(ancestors.c.depth < settings.COMMENT_THREAD_MAX_DEPTH)
+            )
+            await db.execute(
+                update(model)
+                .where(model.id.in_(select(ancestors.c.id)))
+                .values(reply_count=model.reply_count + 1)
+                .execution_options(synchronize_session="fetch")
+            )
+
+        await db.flush()
+        return comment
+
+    @staticmethod
+    async def get_comment(
+        db: AsyncSession, model: CommentModel, comment_id: int
+    ) -> Optional[Union[TaskComment, ProjectComment]]:
+        result = await db.execute(select(model).where(model.id == comment_id))
+        return result.scalar_one_or_none()
@@ -0,0 +1,156 @@
+import csv
+import io
+import json
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, AsyncIterator, List
+
+from sqlalchemy import Select, and_, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import async_session_maker
+from app.models.project import Project
+from app.models.task import Task, TaskAssignment
+from app.models.user import User, UserActivityLog
+from app.services.project_service import ProjectService
+
+EXPORT_FORMATS = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+}
+
+
+def _value(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+class ExportService:
+    """프로젝트 데이터 스트리밍 내보내기
+
+    서버 측 커서(`stream` + `yield_per`)로 `EXPORT_CHUNK_SIZE`행씩 읽어
+    바로 CSV/NDJSON 조각으로 내보내므로, 행 수와 상관없이 메모리는 한 청크
+    크기로 유지되고 첫 바이트는 첫 청크가 읽히는 즉시 나간다.
+    """
+
+    @staticmethod
+    async def can_export(db: AsyncSession, user_id: int, project_id: int) -> bool:
+        result = await db.execute(
+            select(Project.id).where(
+                Project.id == project_id,
+                Project.id.in_(ProjectService.accessible_project_ids(user_id)),
+            )
+        )
+        return result.scalar_one_or_none() is not None
+
+    @staticmethod
+    def tasks_query(project_id: int) -> Select:
+        return (
+            select(
+                Task.id,
+                Task.title,
+                Task.description,
+                Task.status,
+                Task.priority,
+                Task.parent_task_id,
+                Task.estimated_hours,
+                Task.actual_hours,
+                Task.start_date,
+                Task.due_date,
+                Task.completed_at,
+                Task.created_by,
+                Task.created_at,
+                Task.updated_at,
+            )
+            .where(Task.project_id == project_id)
+            .order_by(Task.id)
+        )
+
+    @staticmethod
+    def assignments_query(project_id: int) -> Select:
+        return (
+            select(
+                TaskAssignment.task_id,
+                Task.title.label("task_title"),
+                TaskAssignment.user_id,
+                User.username,
+                TaskAssignment.assigned_by,
+                TaskAssignment.assigned_at,
+            )
+            .join(Task, Task.id == TaskAssignment.task_id)
+            .join(User, User.id == TaskAssignment.user_id)
+            .where(Task.project_id == project_id)
+            .order_by(TaskAssignment.task_id, TaskAssignment.user_id)
+        )
+
+    @staticmethod
+    def activity_query(project_id: int) -> Select:
+        # 프로젝트 자체와 소속 작업에 대한 활동
+        project_task_ids = select(Task.id).where(Task.project_id == project_id)
+        return (
+            select(
+                UserActivityLog.id,
+                UserActivityLog.user_id,
+                UserActivityLog.action,
+                UserActivityLog.resource_type,
+                UserActivityLog.resource_id,
+                UserActivityLog.description,
+                UserActivityLog.created_at,
+            )
+            .where(
+                or_(
+                    and_(
+                        UserActivityLog.resource_type == "project",
+                        UserActivityLog.resource_id == project_id,
+                    ),
+                    and_(
+                        UserActivityLog.resource_type == "task",
+                        UserActivityLog.resource_id.in_(project_task_ids),
+                    ),
+                )
+            )
+            .order_by(UserActivityLog.id)
+        )
+
+    @staticmethod
+    async def stream(query: Select, format: str) -> AsyncIterator[bytes]:
+        """쿼리 결과를 CSV/NDJSON 청크로 생성
+
+        응답 본문을 보내는 동안 요청 의존성(get_db)의 세션은 이미 닫혀 있으므로
+        제너레이터 안에서 세션을 직접 연다.
+        """
+        columns: List[str] = [column.key for column in query.selected_columns]
+
+        if format == "csv":
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(columns)
+
+        async with async_session_maker() as session:
+            result = await session.stream(
+                query.execution_options(yield_per=settings.EXPORT_CHUNK_SIZE)
+            )
+
+            if format == "csv":
+                # 헤더를 먼저 보내 클라이언트가 곧바로 다운로드를 시작하게 한다
+                yield buffer.getvalue().encode()
+
+            async for rows in result.partitions():
+                if format == "csv":
+                    buffer.seek(0)
+                    buffer.truncate()
+                    writer.writerows([_value(value) for value in row] for row in rows)
+                    yield buffer.getvalue().encode()
+                else:
+                    yield "".join(
+                        json.dumps(
+                            {key: _value(value) for key, value in zip(columns, row)},
+                            ensure_ascii=False,
+                        )
+                        + "\n"
+                        for row in rows
+                    ).encode()
@@ -0,0 +1,89 @@
+import asyncio
+from typing import Any, Dict, Optional
+
+from app.core.config import settings
+from app.core.database import async_session_maker
+from app.services.stats_service import StatsService
+from app.utils.logger import logger
+
+
+class ProjectCountReconciler:
+    """프로젝트 작업 수/진행률과 사용자 대시보드 카운터 드리프트 보정 작업
+
+    델타 갱신을 거치지 않은 변경(직접 SQL, 실패한 배포 중의 쓰기 등)으로
+    `projects` 행의 롤업과 `stats_counters`가 어긋날 수 있으므로 `interval`초마다
+    전체 프로젝트와 사용자를 `batch_size`개씩 다시 집계해 맞춘다. 배치마다 따로 커밋해 긴 트랜잭션을
+    피한다. 여러 워커에서 동시에 돌아도 결과는 같다.
+    """
+
+    def __init__(self, interval: float, batch_size: int):
+        self.interval = interval
+        self.batch_size = batch_size
+
+        self._task: Optional[asyncio.Task] = None
+
+        self.runs = 0
+        self.corrected = 0
+        self.failed = 0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        if self.running or self.interval <= 0:
+            return
+        self._task = asyncio.create_task(self._run(), name="project-count-reconciler")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def reconcile(self) -> int:
+        """전체 프로젝트와 사용자를 한 번 보정하고 고친 행(사용자) 수를 반환"""
+        projects = await self._reconcile_batches(StatsService.reconcile_project_counts)
+        if projects:
+            logger.warning("Project task counts drifted", corrected=projects)
+        users = await self._reconcile_batches(StatsService.reconcile_user_counters)
+        if users:
+            logger.warning("User stats counters drifted", corrected=users)
+
+        self.runs += 1
+        self.corrected += projects + users
+        return projects + users
+
+    async def _reconcile_batches(self, reconcile_batch) -> int:
+        corrected = 0
+        after_id: Optional[int] = 0
+        while after_id is not None:
+            async with async_session_maker() as session:
+                after_id, fixed = await reconcile_batch(
+                    session, after_id, self.batch_size
+                )
+                await session.commit()
+            corrected += fixed
+        return corrected
+
+    def stats(self) -> Dict[str, Any]:
+        return {"runs": self.runs, "corrected": self.corrected, "failed": self.failed}
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.reconcile()
+            except Exception as e:
+                self.failed += 1
+                logger.error("Project count reconciliation failed", error=str(e))
+
+
+project_count_reconciler = ProjectCountReconciler(
+    interval=settings.PROJECT_COUNT_RECONCILE_INTERVAL,
+    batch_size=settings.PROJECT_COUNT_RECONCILE_BATCH_SIZE,
+)
@@ -1,23 +1,42 @@
 from typing import Optional, List
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import Select, select, func, union
 from app.models.project import Project, ProjectMember, ProjectComment
 from app.models.user import User
+from app.services.stats_service import StatsService
 
 class ProjectService:
     @staticmethod
-    async def get_project_by_id(db: AsyncSession, project_id: int) -> Optional[Project]:
-        result = await db.execute(select(Project).where(Project.id == project_id))
+    async def get_project_by_id(
+        db: AsyncSession, project_id: int, user_id: Optional[int] = None
+    ) -> Optional[Project]:
+        """프로젝트 조회 (user_id를 주면 그 사용자가 접근할 수 있을 때만)"""
+        query = select(Project).where(Project.id == project_id)
+        if user_id is not None:
+            query = query.where(
+                Project.id.in_(ProjectService.accessible_project_ids(user_id))
+            )
+        result = await db.execute(query)
         return result.scalar_one_or_none()
     
+    @staticmethod
+    def accessible_project_ids(user_id: int) -> Select:
+        """사용자가 생성했거나 멤버로 참여하는 프로젝트 id
+
+        OR 조건은 인덱스를 쓰지 못하고 projects 전체를 훑으므로, 양쪽을 각각
+        인덱스로 찾아 UNION 한다.
+        """
+        return union(
+            select(Project.id).where(Project.creator_id == user_id),
+            select(ProjectMember.project_id).where(ProjectMember.user_id == user_id),
+        )
+
     @staticmethod
     async def get_projects_by_user(db: AsyncSession, user_id: int) -> List[Project]:
         # 사용자가 생성했거나 멤버로 참여하는 프로젝트
-        query = select(Project).join(
-            ProjectMember, Project.id == ProjectMember.project_id
-        ).where(
-            (Project.creator_id == user_id) | (ProjectMember.user_id == user_id)
-        ).distinct()
+        query = select(Project).where(
+            Project.id.in_(ProjectService.accessible_project_ids(user_id))
+        )
         
         result = await db.execute(query)
         return result.scalars().all()
@@ -39,8 +58,8 @@ class ProjectService:
             creator_id=creator_id
         )
         db.add(project)
-        await db.commit()
-        await db.refresh(project)
+        # id가 필요하므로 INSERT만 먼저 보낸다 (커밋은 호출 측에서 한 번)
+        await db.flush()
         
         # 프로젝트 생성자를 멤버로 추가
         member = ProjectMember(
@@ -49,7 +68,8 @@ class ProjectService:
             role="lead"
         )
         db.add(member)
-        await db.commit()
+        await StatsService.project_created(db, project, [creator_id])
+        await db.flush()
         
         return project
     
@@ -66,10 +86,18 @@ class ProjectService:
             role=role
         )
         db.add(member)
-        await db.commit()
-        await db.refresh(member)
+        project = await ProjectService.get_project_by_id(db, project_id)
+        await StatsService.member_added(db, project, user_id)
+        await db.flush()
         return member
     
+    @staticmethod
+    async def get_project_member_ids(db: AsyncSession, project_id: int) -> List[int]:
+        result = await db.execute(
+            select(ProjectMember.user_id).where(ProjectMember.project_id == project_id)
+        )
+        return list(result.scalars())
+    
     @staticmethod
     async def get_project_members(db: AsyncSession, project_id: int) -> List[User]:
         result = await db.execute(
@@ -0,0 +1,338 @@
+import asyncio
+import re
+import time
+from dataclasses import dataclass, replace
+from datetime import datetime, timezone, tzinfo
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from dateutil.rrule import rrule, rrulestr
+from redis.exceptions import RedisError
+from sqlalchemy import event, inspect, select
+from sqlalchemy.orm import Session, object_session
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.redis import get_redis
+from app.models.calendar import Event, EventException
+from app.utils.logger import logger
+
+# 캘린더 일정에 의미 없는 빈도 (한 주 조회로도 수만 회차가 생긴다)
+_UNSUPPORTED_FREQ = re.compile(r"FREQ=(SECONDLY|MINUTELY)", re.IGNORECASE)
+# 회차 수가 정해진 규칙 (없으면 무기한 시리즈)
+_BOUNDED = re.compile(r"(?:^|[:;])\s*(COUNT|UNTIL)\s*=", re.IGNORECASE)
+
+
+@dataclass(frozen=True)
+class Occurrence:
+    """조회 기간 안에 실제로 나타나는 일정 한 회 (세션과 무관한 값 객체)
+
+    단일 일정은 그대로, 반복 일정은 회차마다 하나씩 만들어진다.
+    `recurrence_id`는 규칙상 원래 시작 시각(RFC 5545 RECURRENCE-ID)이다.
+    """
+
+    id: int
+    calendar_id: int
+    title: str
+    description: Optional[str]
+    start_time: datetime
+    end_time: datetime
+    is_all_day: bool
+    location: Optional[str]
+    project_id: Optional[int]
+    task_id: Optional[int]
+    rrule: Optional[str] = None
+    timezone: str = "UTC"
+    recurrence_id: Optional[datetime] = None
+
+    @classmethod
+    def from_event(cls, event: Event) -> "Occurrence":
+        return cls(
+            id=event.id,
+            calendar_id=event.calendar_id,
+            title=event.title,
+            description=event.description,
+            start_time=as_utc(event.start_time),
+            end_time=as_utc(event.end_time),
+            is_all_day=bool(event.is_all_day),
+            location=event.location,
+            project_id=event.project_id,
+            task_id=event.task_id,
+            rrule=event.rrule,
+            timezone=event.timezone or "UTC",
+        )
+
+
+def as_utc(value: datetime) -> datetime:
+    """UTC 시각으로 변환 (시간대 없는 값(SQLite)은 UTC로 간주)"""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def get_zone(tzid: Optional[str]) -> tzinfo:
+    """IANA 시간대 이름 검증/조회 (없는 이름은 ValueError)"""
+    try:
+        return ZoneInfo(tzid or "UTC")
+    except (ZoneInfoNotFoundError, ValueError) as exc:
+        raise ValueError(f"Unknown time zone: {tzid}") from exc
+
+
+def parse_rrule(rule: str, dtstart: datetime, tzid: Optional[str] = "UTC") -> rrule:
+    """RRULE 문자열 검증/파싱 (잘못된 규칙은 ValueError)
+
+    BYDAY/BYHOUR 같은 규칙은 일정의 시간대(TZID) 벽시계 기준으로 펼친다.
+    UTC로 펼치면 KST 월요일 08:00 시리즈가 일요일 23:00(UTC)이 되어 요일이
+    어긋나고, 서머타임 전환 뒤에는 회차 시각이 한 시간씩 밀린다.
+    """
+    if "\n" in rule or "DTSTART" in rule.upper():
+        raise ValueError("Recurrence must be a single RRULE without DTSTART")
+    if _UNSUPPORTED_FREQ.search(rule):
+        raise ValueError("Recurrence frequency must be HOURLY or coarser")
+    zone = get_zone(tzid)
+    try:
+        parsed = rrulestr(rule, dtstart=as_utc(dtstart).astimezone(zone))
+    except (ValueError, TypeError) as exc:
+        raise ValueError(f"Invalid recurrence rule: {exc}") from exc
+    if not isinstance(parsed, rrule):
+        raise ValueError("Recurrence must be a single RRULE")
+    return parsed
+
+
+def occurrences_after(parsed: rrule, after: datetime) -> Iterable[datetime]:
+    """`after` 이후(포함) 회차 시작 시각을 UTC로"""
+    for start in parsed.xafter(after, inc=True):
+        yield start.astimezone(timezone.utc)
+
+
+def series_end(
+    rule: str, start_time: datetime, end_time: datetime, tzid: Optional[str] = "UTC"
+) -> Optional[datetime]:
+    """마지막 회차의 종료 시각 (COUNT/UNTIL이 없거나 회차가 너무 많으면 None=무기한)"""
+    parsed = parse_rrule(rule, start_time, tzid)
+    if not _BOUNDED.search(rule):
+        return None
+
+    start = as_utc(start_time)
+    last = start
+    for index, last in enumerate(occurrences_after(parsed, start)):
+        if index >= settings.RECURRENCE_END_SCAN_LIMIT:
+            return None
+    return last + (as_utc(end_time) - start)
+
+
+def is_occurrence(series: Event, original_start: datetime) -> bool:
+    parsed = parse_rrule(series.rrule, series.start_time, series.timezone)
+    original_start = as_utc(original_start)
+    return next(occurrences_after(parsed, original_start), None) == original_start
+
+
+def expand(
+    series: Event,
+    exceptions: Iterable[EventException],
+    range_start: datetime,
+    range_end: datetime,
+) -> List[Occurrence]:
+    """시리즈에서 [range_start, range_end)와 겹치는 회차만 생성
+
+    규칙은 `xafter`로 기간 시작 직전부터 하나씩 펼치고 기간 끝을 넘는 즉시
+    멈추므로, 무기한 시리즈라도 기간 밖 회차는 만들지 않는다. 취소된 회차는
+    빼고, 변경된 회차는 변경 값으로 바꾼다 (다른 시각으로 옮겨져 기간 안에
+    들어온 회차도 포함).
+    """
+    start = as_utc(series.start_time)
+    duration = as_utc(series.end_time) - start
+    parsed = parse_rrule(series.rrule, start, series.timezone)
+    base = Occurrence.from_event(series)
+
+    overrides: Dict[datetime, EventException] = {
+        as_utc(exception.original_start): exception for exception in exceptions
+    }
+    occurrences: List[Occurrence] = []
+
+    def emit(original: datetime, exception: Optional[EventException]) -> None:
+        occurrence = replace(
+            base,
+            start_time=original,
+            end_time=original + duration,
+            recurrence_id=original,
+        )
+        if exception is not None:
+            if exception.is_cancelled:
+                return
+            occurrence = _apply(occurrence, exception)
+        if occurrence.start_time < range_end and occurrence.end_time >= range_start:
+            occurrences.append(occurrence)
+
+    for original in occurrences_after(parsed, range_start - duration):
+        if original >= range_end:
+            break
+        emit(original, overrides.pop(original, None))
+
+    # 기간 밖 회차가 기간 안으로 옮겨진 경우
+    for original, exception in overrides.items():
+        if exception.start_time is not None:
+            emit(original, exception)
+
+    return occurrences
+
+
+def _apply(occurrence: Occurrence, exception: EventException) -> Occurrence:
+    changes = {
+        field: getattr(exception, field)
+        for field in ("title", "description", "location")
+        if getattr(exception, field) is not None
+    }
+    if exception.start_time is not None:
+        changes["start_time"] = as_utc(exception.start_time)
+        changes["end_time"] = as_utc(exception.end_time)
+    return replace(occurrence, **changes)
+
+
+# 캘린더별 펼친 회차 캐시: calendar_id -> {(range_start, range_end): 회차 목록}
+# 시리즈/예외 변경이 커밋되면 해당 캘린더 항목을 통째로 지운다
+occurrence_cache = TTLCache(
+    maxsize=settings.OCCURRENCE_CACHE_SIZE, ttl=settings.OCCURRENCE_CACHE_TTL
+)
+
+OCCURRENCE_CACHE_VERSION_KEY = "pms:occurrence_cache:version"
+
+# 세션에 쌓아 두는 커밋 대기 중인 변경 (무효화할 calendar_id 집합)
+_PENDING_KEY = "occurrence_cache_changes"
+
+_version = 0
+_version_checked_at = 0.0
+# 무효화할 때마다 증가 (조회 도중 무효화된 결과를 캐시하지 않도록)
+_epoch = 0
+_pending_bumps: Set[asyncio.Task] = set()
+
+Window = Tuple[datetime, datetime]
+
+
+async def get_cached_window(
+    calendar_id: int, window: Window
+) -> Optional[List[Occurrence]]:
+    await _check_version()
+    windows = occurrence_cache.get(calendar_id)
+    return windows.get(window) if windows is not None else None
+
+
+def cache_epoch() -> int:
+    """DB 조회 전에 읽어 두었다가 cache_window에 넘긴다"""
+    return _epoch
+
+
+def cache_window(
+    calendar_id: int, window: Window, occurrences: Sequence[Occurrence], epoch: int
+) -> None:
+    # 조회하는 사이 커밋된 변경이 있으면 이전 값일 수 있으므로 저장하지 않는다
+    if epoch != _epoch:
+        return
+    windows = occurrence_cache.get(calendar_id)
+    if windows is None:
+        windows = TTLCache(maxsize=settings.OCCURRENCE_CACHE_WINDOWS)
+        occurrence_cache.set(calendar_id, windows)
+    windows.set(window, list(occurrences))
+
+
+def invalidate_calendar(calendar_id: int) -> None:
+    global _epoch
+    _epoch += 1
+    occurrence_cache.delete(calendar_id)
+
+
+def invalidate_calendars_on_commit(
+    session: Session, calendar_ids: Iterable[int]
+) -> None:
+    """세션이 커밋되면 이 워커와 다른 워커의 캘린더 회차 캐시를 무효화
+
+    매퍼 이벤트가 잡지 못하는 벌크 UPDATE/DELETE 뒤에 호출한다.
+    """
+    session.info.setdefault(_PENDING_KEY, set()).update(
+        calendar_id for calendar_id in calendar_ids if calendar_id is not None
+    )
+
+
+async def _check_version() -> None:
+    """다른 워커가 일정을 변경했으면 (버전 키 증가) 로컬 캐시를 모두 버린다"""
+    global _version, _version_checked_at, _epoch
+    now = time.monotonic()
+    if now - _version_checked_at < settings.OCCURRENCE_CACHE_VERSION_CHECK_INTERVAL:
+        return
+    _version_checked_at = now
+
+    try:
+        value = int(await get_redis().get(OCCURRENCE_CACHE_VERSION_KEY) or 0)
+    except RedisError as e:
+        # Redis 장애 시 OCCURRENCE_CACHE_TTL로만 만료
+        logger.warning("Occurrence cache version check failed", error=str(e))
+        return
+    if value != _version:
+        _epoch += 1
+        occurrence_cache.clear()
+        _version = value
+
+
+async def _bump_version() -> None:
+    global _version, _version_checked_at, _epoch
+    try:
+        value = await get_redis().incr(OCCURRENCE_CACHE_VERSION_KEY)
+    except RedisError as e:
+        logger.warning("Occurrence cache version bump failed", error=str(e))
+        return
+    # 그 사이 다른 워커도 올렸다면 그 변경은 아직 반영하지 못했다
+    if value != _version + 1:
+        _epoch += 1
+        occurrence_cache.clear()
+    _version = value
+    _version_checked_at = time.monotonic()
+
+
+@event.listens_for(Event, "after_insert")
+@event.listens_for(Event, "after_update")
+@event.listens_for(Event, "after_delete")
+def _record_event_change(mapper, connection, target: Event) -> None:
+    history = inspect(target).attrs
+    was_recurring = target.rrule is not None or any(history.rrule.history.deleted)
+    session = object_session(target)
+    if not was_recurring or session is None:
+        return
+    invalidate_calendars_on_commit(
+        session, [target.calendar_id, *history.calendar_id.history.deleted]
+    )
+
+
+@event.listens_for(EventException, "after_insert")
+@event.listens_for(EventException, "after_update")
+@event.listens_for(EventException, "after_delete")
+def _record_exception_change(mapper, connection, target: EventException) -> None:
+    session = object_session(target)
+    if session is None:
+        return
+    calendar_id = connection.execute(
+        select(Event.calendar_id).where(Event.id == target.event_id)
+    ).scalar()
+    invalidate_calendars_on_commit(session, [calendar_id])
+
+
+# flush 시점에 지우면 커밋 전에 다른 요청이 이전 회차를 다시 캐시할 수 있으므로
+# 커밋된 뒤에 이 워커의 항목을 지우고, 다른 워커에는 버전 키로 알린다
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session: Session) -> None:
+    calendar_ids = session.info.pop(_PENDING_KEY, None)
+    if not calendar_ids:
+        return
+    for calendar_id in calendar_ids:
+        invalidate_calendar(calendar_id)
+
+    try:
+        task = asyncio.get_running_loop().create_task(_bump_version())
+    except RuntimeError:
+        return
+    _pending_bumps.add(task)
+    task.add_done_callback(_pending_bumps.discard)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
@@ -0,0 +1,161 @@
+import re
+from typing import List, Optional, Sequence, Tuple
+
+from sqlalchemy import (
+    Float,
+    Row,
+    Select,
+    and_,
+    case,
+    cast,
+    column,
+    func,
+    literal,
+    literal_column,
+    null,
+    or_,
+    select,
+    table,
+    tuple_,
+    union_all,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.project import Project, ProjectComment
+from app.models.search import FTS5_WEIGHTS, SEARCH_CONFIG, SEARCH_DOCUMENTS, fts_table
+from app.models.task import Task, TaskComment
+from app.services.project_service import ProjectService
+
+SEARCH_KINDS = ("project", "task", "task_comment", "project_comment")
+
+# (rank, kind, id) 정렬 키
+SearchCursor = Tuple[float, str, int]
+
+
+class SearchService:
+    """프로젝트/작업/댓글 전문 검색
+
+    PostgreSQL은 저장 생성 컬럼 `search_vector`(GIN)를 `websearch_to_tsquery`로,
+    SQLite는 FTS5 테이블을 `MATCH`로 찾는다. 그 밖의 DB는 색인 없이 단어마다
+    ILIKE로 찾는다. 종류별 결과를 UNION ALL 해 관련도 순으로 정렬하고
+    (rank, kind, id) 키셋으로 페이지를 나눈다.
+    """
+
+    @staticmethod
+    async def search(
+        db: AsyncSession,
+        user_id: int,
+        query: str,
+        kinds: Optional[Sequence[str]] = None,
+        limit: int = 20,
+        after: Optional[SearchCursor] = None,
+    ) -> List[Row]:
+        dialect = db.get_bind().dialect.name
+        if dialect == "sqlite":
+            # FTS5 쿼리 문법 오류를 피하도록 단어만 골라 각각 따옴표로 감싼다 (AND)
+            query = " ".join(f'"{term}"' for term in re.findall(r"\w+", query))
+        elif dialect != "postgresql":
+            query = " ".join(re.findall(r"\w+", query))
+        if not query.strip():
+            return []
+
+        project_ids = ProjectService.accessible_project_ids(user_id)
+        branches = [
+            SearchService._branch(dialect, kind, query, project_ids)
+            for kind in (kinds or SEARCH_KINDS)
+        ]
+        hits = union_all(*branches).subquery("hits")
+
+        stmt = select(hits)
+        if after is not None:
+            stmt = stmt.where(
+                tuple_(hits.c.rank, hits.c.kind, hits.c.id) < tuple_(*after)
+            )
+        stmt = stmt.order_by(
+            hits.c.rank.desc(), hits.c.kind.desc(), hits.c.id.desc()
+        ).limit(limit)
+
+        result = await db.execute(stmt)
+        return result.all()
+
+    @staticmethod
+    def _branch(dialect: str, kind: str, query: str, project_ids) -> Select:
+        if kind == "project":
+            model = Project
+            columns = (Project.name, Project.id, null())
+            visible = Project.id.in_(project_ids)
+        elif kind == "task":
+            model = Task
+            columns = (Task.title, Task.project_id, Task.id)
+            visible = Task.project_id.in_(project_ids)
+        elif kind == "task_comment":
+            model = TaskComment
+            columns = (TaskComment.content, Task.project_id, TaskComment.task_id)
+            visible = Task.project_id.in_(project_ids)
+        elif kind == "project_comment":
+            model = ProjectComment
+            columns = (ProjectComment.content, ProjectComment.project_id, null())
+            visible = ProjectComment.project_id.in_(project_ids)
+        else:
+            raise ValueError(f"Unknown search type: {kind}")
+
+        title, project_id, task_id = columns
+        tablename = model.__tablename__
+
+        if dialect == "postgresql":
+            vector = literal_column(f"{tablename}.search_vector")
+            tsquery = func.websearch_to_tsquery(
+                literal_column(f"'{SEARCH_CONFIG}'::regconfig"), query
+            )
+            rank = cast(func.ts_rank(vector, tsquery), Float)
+            matched = vector.op("@@")(tsquery)
+            source = model.__table__
+        elif dialect == "sqlite":
+            fts = table(fts_table(tablename), column("rowid"))
+            weights = [FTS5_WEIGHTS[weight] for _, weight in SEARCH_DOCUMENTS[model]]
+            # bm25()는 낮을수록 관련도가 높으므로 부호를 뒤집는다
+            rank = -func.bm25(literal_column(fts.name), *weights)
+            matched = literal_column(fts.name).op("MATCH")(query)
+            source = model.__table__.join(fts, fts.c.rowid == model.id)
+        else:
+            # 모든 단어가 (어느 컬럼에든) 들어 있으면 일치, 관련도는 단어가 들어 있는
+            # 컬럼 가중치의 합
+            documents = [
+                (getattr(model, name), FTS5_WEIGHTS[weight])
+                for name, weight in SEARCH_DOCUMENTS[model]
+            ]
+            terms = query.split()
+            matched = and_(
+                *[
+                    or_(*[col.icontains(term, autoescape=True) for col, _ in documents])
+                    for term in terms
+                ]
+            )
+            rank = cast(
+                sum(
+                    (
+                        case((col.icontains(term, autoescape=True), weight), else_=0.0)
+                        for term in terms
+                        for col, weight in documents
+                    ),
+                    literal(0.0),
+                ),
+                Float,
+            )
+            source = model.__table__
+
+        if kind == "task_comment":
+            source = source.join(Task.__table__, Task.id == TaskComment.task_id)
+
+        return (
+            select(
+                literal(kind).label("kind"),
+                model.id.label("id"),
+                rank.label("rank"),
+                title.label("title"),
+                project_id.label("project_id"),
+                task_id.label("task_id"),
+            )
+            .select_from(source)
+            .where(matched, visible)
+        )
@@ -0,0 +1,498 @@
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import and_, case, func, insert, select, true, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.project import Project, ProjectMember, ProjectStatus
+from app.models.stats import StatsCounter
+from app.models.task import Task, TaskAssignment, TaskStatus
+from app.models.user import User
+
+# (scope, scope_id, metric) -> delta
+Deltas = Dict[Tuple[str, int, str], int]
+
+
+class StatsService:
+    """대시보드 통계
+
+    사용자별 카운터는 `stats_counters`에, 프로젝트별 작업 수와 진행률은
+    `projects` 행에 유지한다. 변경 경로에서는 같은 트랜잭션 안에서 델타만
+    반영하므로 대시보드와 프로젝트 진행률 조회는 tasks 테이블을 스캔하지 않는다.
+    """
+
+    @staticmethod
+    async def get_dashboard_stats(db: AsyncSession, user_id: int) -> Dict[str, int]:
+        result = await db.execute(
+            select(StatsCounter.metric, StatsCounter.value).where(
+                StatsCounter.scope == "user", StatsCounter.scope_id == user_id
+            )
+        )
+        counters = dict(result.all())
+
+        if "projects_total" not in counters:
+            # 가입 시 초기화되지 않은 사용자: 읽기 경로에서는 쓰지 않고 바로 집계
+            # (저장은 rebuild_user_counters로 따로 한다)
+            return await StatsService.compute_user_stats(db, user_id)
+
+        # 마감 초과는 시간에 따라 변하므로 카운터로 유지할 수 없어 조회 시 계산
+        overdue_result = await db.execute(
+            select(func.count(Task.id))
+            .join(TaskAssignment, TaskAssignment.task_id == Task.id)
+            .where(
+                TaskAssignment.user_id == user_id,
+                Task.due_date < func.now(),
+                Task.status != TaskStatus.DONE,
+            )
+        )
+        counters["tasks_overdue"] = overdue_result.scalar() or 0
+        return counters
+
+    @staticmethod
+    async def compute_user_stats(db: AsyncSession, user_id: int) -> Dict[str, int]:
+        """사용자의 모든 프로젝트/작업 카운터를 단일 쿼리로 집계"""
+        member_project_ids = select(ProjectMember.project_id).where(
+            ProjectMember.user_id == user_id
+        )
+        projects = (
+            select(
+                func.count(Project.id).label("projects_total"),
+                *[
+                    func.count(Project.id)
+                    .filter(Project.status == status)
+                    .label(f"projects_{status.value}")
+                    for status in ProjectStatus
+                ],
+            )
+            .where(Project.id.in_(member_project_ids))
+            .subquery()
+        )
+
+        tasks = (
+            select(
+                func.count(Task.id).label("tasks_total"),
+                *[
+                    func.count(Task.id)
+                    .filter(Task.status == status)
+                    .label(f"tasks_{status.value}")
+                    for status in TaskStatus
+                ],
+                func.count(Task.id)
+                .filter(
+                    and_(Task.due_date < func.now(), Task.status != TaskStatus.DONE)
+                )
+                .label("tasks_overdue"),
+            )
+            .join(TaskAssignment, TaskAssignment.task_id == Task.id)
+            .where(TaskAssignment.user_id == user_id)
+            .subquery()
+        )
+
+        # 둘 다 한 행짜리 집계라 명시적으로 붙인다 (FROM 두 개면 카티전 곱 경고)
+        result = await db.execute(
+            select(projects, tasks).select_from(projects.join(tasks, true()))
+        )
+        return {key: value or 0 for key, value in result.mappings().one().items()}
+
+    @staticmethod
+    async def rebuild_user_counters(db: AsyncSession, user_id: int) -> Dict[str, int]:
+        """카운터를 실제 데이터 기준으로 다시 계산 (드리프트 보정용)"""
+        stats = await StatsService.compute_user_stats(db, user_id)
+        counters = {
+            metric: value
+            for metric, value in stats.items()
+            if metric != "tasks_overdue"
+        }
+        await StatsService._upsert(
+            db,
+            [("user", user_id, metric, value) for metric, value in counters.items()],
+            replace=True,
+        )
+        return counters
+
+    # ----- 변경 경로에서 호출하는 델타 훅 (커밋은 호출 측에서) -----
+
+    @staticmethod
+    async def user_created(db: AsyncSession, user_id: int) -> None:
+        """새 사용자의 카운터 행 (이후 델타는 0에서부터 더해진다)"""
+        await StatsService._upsert(
+            db,
+            [
+                ("user", user_id, "projects_total", 0),
+                ("user", user_id, "tasks_total", 0),
+            ],
+        )
+
+    @staticmethod
+    async def project_created(
+        db: AsyncSession, project: Project, member_ids: Iterable[int]
+    ) -> None:
+        status = ProjectStatus(project.status).value
+        deltas: Deltas = defaultdict(int)
+        for user_id in member_ids:
+            deltas[("user", user_id, "projects_total")] += 1
+            deltas[("user", user_id, f"projects_{status}")] += 1
+        await StatsService.apply_deltas(db, deltas)
+
+    @staticmethod
+    async def project_status_changed(
+        db: AsyncSession, project_id: int, old_status, new_status
+    ) -> None:
+        old_status = ProjectStatus(old_status).value
+        new_status = ProjectStatus(new_status).value
+        if old_status == new_status:
+            return
+
+        deltas: Deltas = defaultdict(int)
+        for user_id in await StatsService._project_member_ids(db, project_id):
+            deltas[("user", user_id, f"projects_{old_status}")] -= 1
+            deltas[("user", user_id, f"projects_{new_status}")] += 1
+        await StatsService.apply_deltas(db, deltas)
+
+    @staticmethod
+    async def project_deleted(db: AsyncSession, project: Project) -> List[int]:
+        """멤버의 프로젝트 카운터와 담당자의 작업 카운터를 뺀다
+
+        작업은 프로젝트와 함께 지워지므로 삭제 전에 호출한다. 카운터가 바뀐
+        사용자 id를 돌려준다.
+        """
+        status = ProjectStatus(project.status).value
+        deltas: Deltas = defaultdict(int)
+        for user_id in await StatsService._project_member_ids(db, project.id):
+            deltas[("user", user_id, "projects_total")] -= 1
+            deltas[("user", user_id, f"projects_{status}")] -= 1
+
+        assigned = await db.execute(
+            select(TaskAssignment.user_id, Task.status, func.count(Task.id))
+            .join(Task, Task.id == TaskAssignment.task_id)
+            .where(Task.project_id == project.id)
+            .group_by(TaskAssignment.user_id, Task.status)
+        )
+        for user_id, task_status, count in assigned:
+            deltas[("user", user_id, "tasks_total")] -= count
+            deltas[("user", user_id, f"tasks_{TaskStatus(task_status).value}")] -= count
+
+        await StatsService.apply_deltas(db, deltas)
+        return sorted({scope_id for _, scope_id, _ in deltas})
+
+    @staticmethod
+    async def member_added(db: AsyncSession, project: Project, user_id: int) -> None:
+        await StatsService.project_created(db, project, [user_id])
+
+    @staticmethod
+    async def task_created(db: AsyncSession, task: Task) -> None:
+        await StatsService.tasks_created(db, [task])
+
+    @staticmethod
+    async def tasks_created(db: AsyncSession, tasks: Iterable[Task]) -> None:
+        deltas: Deltas = defaultdict(int)
+        for task in tasks:
+            status = TaskStatus(task.status).value
+            deltas[("project", task.project_id, "tasks_total")] += 1
+            deltas[("project", task.project_id, f"tasks_{status}")] += 1
+        await StatsService.apply_deltas(db, deltas)
+
+    @staticmethod
+    async def task_status_changed(
+        db: AsyncSession, task: Task, old_status, new_status
+    ) -> None:
+        old_status = TaskStatus(old_status).value
+        new_status = TaskStatus(new_status).value
+        if old_status == new_status:
+            return
+
+        deltas: Deltas = defaultdict(int)
+        for scope, scope_id in await StatsService._task_scopes(db, task):
+            deltas[(scope, scope_id, f"tasks_{old_status}")] -= 1
+            deltas[(scope, scope_id, f"tasks_{new_status}")] += 1
+        await StatsService.apply_deltas(db, deltas)
+
+    @staticmethod
+    async def task_deleted(db: AsyncSession, task: Task) -> None:
+        status = TaskStatus(task.status).value
+        deltas: Deltas = defaultdict(int)
+        for scope, scope_id in await StatsService._task_scopes(db, task):
+            deltas[(scope, scope_id, "tasks_total")] -= 1
+            deltas[(scope, scope_id, f"tasks_{status}")] -= 1
+        await StatsService.apply_deltas(db, deltas)
+
+    @staticmethod
+    async def task_assigned(db: AsyncSession, task: Task, user_id: int) -> None:
+        await StatsService.tasks_assigned(db, [(task, user_id)])
+
+    @staticmethod
+    async def tasks_assigned(
+        db: AsyncSession, assignments: Iterable[Tuple[Task, int]]
+    ) -> None:
+        deltas: Deltas = defaultdict(int)
+        for task, user_id in assignments:
+            status = TaskStatus(task.status).value
+            deltas[("user", user_id, "tasks_total")] += 1
+            deltas[("user", user_id, f"tasks_{status}")] += 1
+        await StatsService.apply_deltas(db, deltas)
+
+    @staticmethod
+    async def apply_deltas(db: AsyncSession, deltas: Deltas) -> None:
+        """사용자 델타는 stats_counters에 upsert, 프로젝트 델타는 projects 행에 반영"""
+        rows = [
+            (scope, scope_id, metric, delta)
+            for (scope, scope_id, metric), delta in sorted(deltas.items())
+            if delta
+        ]
+        await StatsService._upsert(db, [row for row in rows if row[0] != "project"])
+
+        project_deltas: Dict[int, Dict[str, int]] = defaultdict(dict)
+        for scope, project_id, metric, delta in rows:
+            if scope == "project":
+                project_deltas[project_id][metric] = delta
+        for project_id, metrics in project_deltas.items():
+            await StatsService._update_project_counts(db, project_id, metrics)
+
+    # ----- 프로젝트 작업 수/진행률 -----
+
+    @staticmethod
+    def progress_expression(total, done):
+        """완료 작업 비율(0-100, 내림). 작업이 없으면 0"""
+        return case((total > 0, (done * 100) // total), else_=0)
+
+    @staticmethod
+    async def _update_project_counts(
+        db: AsyncSession, project_id: int, metrics: Dict[str, int]
+    ) -> None:
+        """프로젝트 행 하나에 델타를 더하고 진행률을 같은 UPDATE에서 다시 계산
+
+        SET 절의 컬럼 참조는 갱신 전 값이므로 진행률도 델타를 더해 계산한다.
+        동시 갱신이 있어도 행 잠금 아래에서 상대값으로 더해져 유실되지 않는다.
+        """
+        values = {
+            metric: getattr(Project, metric) + delta
+            for metric, delta in metrics.items()
+        }
+        values["progress"] = StatsService.progress_expression(
+            Project.tasks_total + metrics.get("tasks_total", 0),
+            Project.tasks_done + metrics.get(f"tasks_{TaskStatus.DONE.value}", 0),
+        )
+        await db.execute(
+            update(Project)
+            .where(Project.id == project_id)
+            .values(**values)
+            .execution_options(synchronize_session="fetch")
+        )
+
+    @staticmethod
+    async def reconcile_project_counts(
+        db: AsyncSession, after_id: int = 0, limit: int = 500
+    ) -> Tuple[Optional[int], int]:
+        """id > after_id 인 프로젝트 limit개의 작업 수/진행률을 실제 값과 맞춘다
+
+        tasks를 프로젝트별로 한 번 집계해 저장된 값과 비교하고, 어긋난 행만
+        갱신한다. 반환값은 (다음 배치의 after_id 또는 None, 보정한 행 수).
+        커밋은 호출 측에서 한다.
+        """
+        columns = ["tasks_total"] + [f"tasks_{status.value}" for status in TaskStatus]
+        projects = (
+            select(Project.id)
+            .where(Project.id > after_id)
+            .order_by(Project.id)
+            .limit(limit)
+            .subquery()
+        )
+        actual = (
+            select(
+                Task.project_id,
+                func.count(Task.id).label("tasks_total"),
+                *[
+                    func.count(Task.id)
+                    .filter(Task.status == status)
+                    .label(f"tasks_{status.value}")
+                    for status in TaskStatus
+                ],
+            )
+            .where(Task.project_id.in_(select(projects.c.id)))
+            .group_by(Task.project_id)
+            .subquery()
+        )
+        result = await db.execute(
+            select(
+                Project.id,
+                Project.progress,
+                *[getattr(Project, column) for column in columns],
+                *[
+                    func.coalesce(actual.c[column], 0).label(f"actual_{column}")
+                    for column in columns
+                ],
+            )
+            .join(projects, projects.c.id == Project.id)
+            .outerjoin(actual, actual.c.project_id == Project.id)
+            .order_by(Project.id)
+        )
+        rows = result.mappings().all()
+        if not rows:
+            return None, 0
+
+        fixes = []
+        for row in rows:
+            counts = {column: row[f"actual_{column}"] for column in columns}
+            total, done = (
+                counts["tasks_total"],
+                counts[f"tasks_{TaskStatus.DONE.value}"],
+            )
+            counts["progress"] = done * 100 // total if total else 0
+            if any(row[column] != value for column, value in counts.items()):
+                fixes.append({"id": row["id"], **counts})
+
+        if fixes:
+            # PK가 포함된 dict 목록 → 행별 UPDATE를 executemany로 전송
+            await db.execute(update(Project), fixes)
+
+        next_after = rows[-1]["id"] if len(rows) == limit else None
+        return next_after, len(fixes)
+
+    @staticmethod
+    async def reconcile_user_counters(
+        db: AsyncSession, after_id: int = 0, limit: int = 500
+    ) -> Tuple[Optional[int], int]:
+        """id > after_id 인 사용자 limit명의 카운터를 실제 값과 맞춘다
+
+        멤버십/담당 작업을 사용자별로 한 번씩 집계해 저장된 카운터와 비교하고,
+        어긋난(또는 초기화되지 않은) 사용자의 카운터만 덮어쓴다. 반환값은
+        (다음 배치의 after_id 또는 None, 보정한 사용자 수). 커밋은 호출 측에서 한다.
+        """
+        result = await db.execute(
+            select(User.id).where(User.id > after_id).order_by(User.id).limit(limit)
+        )
+        user_ids = list(result.scalars())
+        if not user_ids:
+            return None, 0
+
+        actual: Dict[int, Dict[str, int]] = {
+            user_id: {"projects_total": 0, "tasks_total": 0} for user_id in user_ids
+        }
+        projects = await db.execute(
+            select(ProjectMember.user_id, Project.status, func.count(Project.id))
+            .join(Project, Project.id == ProjectMember.project_id)
+            .where(ProjectMember.user_id.in_(user_ids))
+            .group_by(ProjectMember.user_id, Project.status)
+        )
+        for user_id, status, count in projects:
+            actual[user_id]["projects_total"] += count
+            actual[user_id][f"projects_{ProjectStatus(status).value}"] = count
+        tasks = await db.execute(
+            select(TaskAssignment.user_id, Task.status, func.count(Task.id))
+            .join(Task, Task.id == TaskAssignment.task_id)
+            .where(TaskAssignment.user_id.in_(user_ids))
+            .group_by(TaskAssignment.user_id, Task.status)
+        )
+        for user_id, status, count in tasks:
+            actual[user_id]["tasks_total"] += count
+            actual[user_id][f"tasks_{TaskStatus(status).value}"] = count
+
+        stored: Dict[int, Dict[str, int]] = defaultdict(dict)
+        result = await db.execute(
+            select(
+                StatsCounter.scope_id, StatsCounter.metric, StatsCounter.value
+            ).where(StatsCounter.scope == "user", StatsCounter.scope_id.in_(user_ids))
+        )
+        for user_id, metric, value in result:
+            stored[user_id][metric] = value
+
+        rows = []
+        for user_id, counters in actual.items():
+            current = stored[user_id]
+            # 없는 상태별 행은 0으로 보지만, 합계 행이 없으면 초기화한다
+            if "projects_total" in current and all(
+                current.get(metric, 0) == counters.get(metric, 0)
+                for metric in counters.keys() | current.keys()
+            ):
+                continue
+            rows.extend(
+                ("user", user_id, metric, counters.get(metric, 0))
+                for metric in sorted(counters.keys() | current.keys())
+            )
+        await StatsService._upsert(db, rows, replace=True)
+
+        fixed = len({user_id for _, user_id, _, _ in rows})
+        next_after = user_ids[-1] if len(user_ids) == limit else None
+        return next_after, fixed
+
+    @staticmethod
+    async def _task_scopes(db: AsyncSession, task: Task) -> List[Tuple[str, int]]:
+        """작업 카운터가 걸린 (scope, scope_id): 소속 프로젝트와 담당자들"""
+        result = await db.execute(
+            select(TaskAssignment.user_id).where(TaskAssignment.task_id == task.id)
+        )
+        return [("project", task.project_id)] + [
+            ("user", user_id) for user_id in result.scalars()
+        ]
+
+    @staticmethod
+    async def _project_member_ids(db: AsyncSession, project_id: int) -> List[int]:
+        result = await db.execute(
+            select(ProjectMember.user_id).where(ProjectMember.project_id == project_id)
+        )
+        return list(result.scalars())
+
+    @staticmethod
+    async def _upsert(
+        db: AsyncSession,
+        rows: List[Tuple[str, int, str, int]],
+        replace: bool = False,
+    ) -> None:
+        """여러 카운터를 INSERT ... ON CONFLICT 한 문장으로 반영"""
+        if not rows:
+            return
+
+        dialect = db.get_bind().dialect.name
+        dialect_insert = {"postgresql": pg_insert, "sqlite": sqlite_insert}.get(dialect)
+        if dialect_insert is None:
+            await StatsService._update_or_insert(db, rows, replace)
+            return
+
+        stmt = dialect_insert(StatsCounter).values(
+            [
+                {"scope": scope, "scope_id": scope_id, "metric": metric, "value": value}
+                for scope, scope_id, metric, value in rows
+            ]
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["scope", "scope_id", "metric"],
+            set_={
+                "value": (
+                    stmt.excluded.value
+                    if replace
+                    else StatsCounter.value + stmt.excluded.value
+                ),
+                "updated_at": func.now(),
+            },
+        )
+        await db.execute(stmt)
+
+    @staticmethod
+    async def _update_or_insert(
+        db: AsyncSession,
+        rows: List[Tuple[str, int, str, int]],
+        replace: bool = False,
+    ) -> None:
+        """ON CONFLICT가 없는 DB용: 카운터마다 UPDATE하고 없던 행만 INSERT"""
+        for scope, scope_id, metric, value in rows:
+            result = await db.execute(
+                update(StatsCounter)
+                .where(
+                    StatsCounter.scope == scope,
+                    StatsCounter.scope_id == scope_id,
+                    StatsCounter.metric == metric,
+                )
+                .values(
+                    value=value if replace else StatsCounter.value + value,
+                    updated_at=func.now(),
+                )
+                .execution_options(synchronize_session=False)
+            )
+            if result.rowcount == 0:
+                await db.execute(
+                    insert(StatsCounter).values(
+                        scope=scope, scope_id=scope_id, metric=metric, value=value
+                    )
+                )
@@ -1,13 +1,35 @@
-from typing import Optional, List
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, List, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from app.models.task import Task, TaskAssignment, TaskComment
+from sqlalchemy import Integer, Row, case, delete, func, insert, literal_column, select, union, update
+from app.core.config import settings
+from app.models.calendar import Event
+from app.models.project import Project, ProjectMember
+from app.models.task import (
+    Task,
+    TaskAssignment,
+    TaskAttachment,
+    TaskComment,
+    TaskStatus,
+    TaskTag,
+)
 from app.models.user import User
+from app.services.project_service import ProjectService
+from app.services.recurrence import invalidate_calendars_on_commit
+from app.services.stats_service import StatsService
 
 class TaskService:
     @staticmethod
-    async def get_task_by_id(db: AsyncSession, task_id: int) -> Optional[Task]:
-        result = await db.execute(select(Task).where(Task.id == task_id))
+    async def get_task_by_id(
+        db: AsyncSession, task_id: int, user_id: Optional[int] = None
+    ) -> Optional[Task]:
+        """작업 조회 (user_id를 주면 그 사용자가 접근할 수 있는 프로젝트의 작업만)"""
+        query = select(Task).where(Task.id == task_id)
+        if user_id is not None:
+            query = query.where(
+                Task.project_id.in_(ProjectService.accessible_project_ids(user_id))
+            )
+        result = await db.execute(query)
         return result.scalar_one_or_none()
     
     @staticmethod
@@ -24,6 +46,108 @@ class TaskService:
         )
         return result.scalars().all()
     
+    @staticmethod
+    async def get_task_tree(
+        db: AsyncSession, user_id: int, root_id: int, max_depth: int
+    ) -> List[Row]:
+        """루트 작업과 max_depth 단계까지의 하위 작업을 쿼리 한 번으로 조회
+
+        재귀 CTE `subtree`로 트리를 내려가고, 트리의 각 노드에서 다시 자손을
+        펼친 `closure`(조상, 자손) 쌍을 GROUP BY 해 노드별 롤업(자신 포함 작업 수,
+        완료 수, 예상/실제 시간 합)을 SQL에서 계산한다. 롤업은 표시 깊이와
+        무관하게 TASK_TREE_MAX_DEPTH 단계까지의 모든 자손을 센다.
+
+        행: (Task, depth, task_count, done_count, estimated_hours, actual_hours),
+        depth, id 순. 루트가 없거나 접근할 수 없는 프로젝트면 빈 목록.
+        """
+        zero = literal_column("0", Integer)
+
+        subtree = (
+            select(Task.id, zero.label("depth"))
+            .where(
+                Task.id == root_id,
+                Task.project_id.in_(ProjectService.accessible_project_ids(user_id)),
+            )
+            .cte("subtree", recursive=True)
+        )
+        subtree = subtree.union_all(
+            select(Task.id, subtree.c.depth + 1)
+            .join(subtree, Task.parent_task_id == subtree.c.id)
+            .where(subtree.c.depth < max_depth)
+        )
+
+        closure = select(
+            subtree.c.id.label("ancestor_id"),
+            subtree.c.id.label("descendant_id"),
+            zero.label("level"),
+        ).cte("closure", recursive=True)
+        closure = closure.union_all(
+            select(closure.c.ancestor_id, Task.id, closure.c.level + 1)
+            .join(closure, Task.parent_task_id == closure.c.descendant_id)
+            .where(closure.c.level < settings.TASK_TREE_MAX_DEPTH)
+        )
+
+        rollup = (
+            select(
+                closure.c.ancestor_id,
+                func.count().label("task_count"),
+                func.sum(case((Task.status == TaskStatus.DONE, 1), else_=0)).label(
+                    "done_count"
+                ),
+                func.coalesce(func.sum(Task.estimated_hours), 0).label(
+                    "estimated_hours"
+                ),
+                func.coalesce(func.sum(Task.actual_hours), 0).label("actual_hours"),
+            )
+            .join(Task, Task.id == closure.c.descendant_id)
+            .group_by(closure.c.ancestor_id)
+            .subquery("rollup")
+        )
+
+        result = await db.execute(
+            select(
+                Task,
+                subtree.c.depth,
+                rollup.c.task_count,
+                rollup.c.done_count,
+                rollup.c.estimated_hours,
+                rollup.c.actual_hours,
+            )
+            .join(subtree, subtree.c.id == Task.id)
+            .join(rollup, rollup.c.ancestor_id == Task.id)
+            .order_by(subtree.c.depth, Task.id)
+        )
+        return result.all()
+
+    @staticmethod
+    async def get_task_ancestors(
+        db: AsyncSession, user_id: int, task_id: int
+    ) -> List[Task]:
+        """상위 작업 체인을 루트부터 직속 상위 작업 순으로 조회 (쿼리 한 번)"""
+        ancestors = (
+            select(
+                Task.parent_task_id.label("id"),
+                literal_column("1", Integer).label("distance"),
+            )
+            .where(
+                Task.id == task_id,
+                Task.project_id.in_(ProjectService.accessible_project_ids(user_id)),
+            )
+            .cte("ancestors", recursive=True)
+        )
+        ancestors = ancestors.union_all(
+            select(Task.parent_task_id, ancestors.c.distance + 1)
+            .join(ancestors, Task.id == ancestors.c.id)
+            .where(ancestors.c.distance < settings.TASK_TREE_MAX_DEPTH)
+        )
+
+        result = await db.execute(
+            select(Task)
+            .join(ancestors, ancestors.c.id == Task.id)
+            .order_by(ancestors.c.distance.desc())
+        )
+        return result.scalars().all()
+
     @staticmethod
     async def create_task(
         db: AsyncSession,
@@ -43,8 +167,8 @@ class TaskService:
             created_by=created_by
         )
         db.add(task)
-        await db.commit()
-        await db.refresh(task)
+        await StatsService.task_created(db, task)
+        await db.flush()
         return task
     
     @staticmethod
@@ -60,10 +184,186 @@ class TaskService:
             assigned_by=assigned_by
         )
         db.add(assignment)
-        await db.commit()
-        await db.refresh(assignment)
+        task = await TaskService.get_task_by_id(db, task_id)
+        await StatsService.task_assigned(db, task, user_id)
+        await db.flush()
         return assignment
     
+    @staticmethod
+    async def create_tasks(
+        db: AsyncSession, rows: List[Dict[str, Any]], created_by: int
+    ) -> Tuple[List[Tuple[int, Task]], Dict[int, str]]:
+        """여러 작업을 한 번에 생성
+
+        참조 프로젝트는 IN 쿼리 한 번으로 확인하고(created_by가 접근할 수 없는
+        프로젝트는 없는 것으로 본다), 유효한 행만 다중 행 INSERT ... RETURNING
+        으로 넣는다. 반환값은 (입력 인덱스, 작업) 목록과 실패한 행의 인덱스별
+        오류 메시지다.
+        """
+        project_ids = {row["project_id"] for row in rows}
+        result = await db.execute(
+            select(Project.id).where(
+                Project.id.in_(project_ids),
+                Project.id.in_(ProjectService.accessible_project_ids(created_by)),
+            )
+        )
+        existing_project_ids = set(result.scalars())
+
+        errors: Dict[int, str] = {}
+        valid: List[int] = []
+        for index, row in enumerate(rows):
+            if not row["title"].strip():
+                errors[index] = "Title is required"
+            elif row["project_id"] not in existing_project_ids:
+                errors[index] = "Project not found"
+            else:
+                valid.append(index)
+
+        if not valid:
+            return [], errors
+
+        result = await db.scalars(
+            insert(Task).returning(Task, sort_by_parameter_order=True),
+            [{**rows[index], "created_by": created_by} for index in valid],
+        )
+        tasks = list(result)
+        await StatsService.tasks_created(db, tasks)
+        return list(zip(valid, tasks)), errors
+
+    @staticmethod
+    async def assign_tasks(
+        db: AsyncSession, pairs: List[Tuple[int, int]], assigned_by: int
+    ) -> Tuple[List[Tuple[int, TaskAssignment]], Dict[int, str]]:
+        """여러 (작업, 사용자) 할당을 한 번에 생성
+
+        작업/사용자/프로젝트 멤버십/기존 할당을 각각 한 번의 IN 쿼리로 확인한다.
+        assigned_by가 접근할 수 없는 프로젝트의 작업은 없는 것으로 보고,
+        담당자는 작업 프로젝트의 멤버(또는 생성자)여야 한다.
+        """
+        task_ids = {task_id for task_id, _ in pairs}
+        user_ids = {user_id for _, user_id in pairs}
+
+        result = await db.execute(
+            select(Task).where(
+                Task.id.in_(task_ids),
+                Task.project_id.in_(ProjectService.accessible_project_ids(assigned_by)),
+            )
+        )
+        tasks = {task.id: task for task in result.scalars()}
+        result = await db.execute(select(User.id).where(User.id.in_(user_ids)))
+        existing_user_ids = set(result.scalars())
+        project_ids = {task.project_id for task in tasks.values()}
+        result = await db.execute(
+            union(
+                select(Project.creator_id, Project.id).where(
+                    Project.id.in_(project_ids), Project.creator_id.in_(user_ids)
+                ),
+                select(ProjectMember.user_id, ProjectMember.project_id).where(
+                    ProjectMember.project_id.in_(project_ids),
+                    ProjectMember.user_id.in_(user_ids),
+                ),
+            )
+        )
+        memberships = set(result.tuples())
+        result = await db.execute(
+            select(TaskAssignment.task_id, TaskAssignment.user_id).where(
+                TaskAssignment.task_id.in_(task_ids),
+                TaskAssignment.user_id.in_(user_ids),
+            )
+        )
+        assigned = set(result.tuples())
+
+        errors: Dict[int, str] = {}
+        valid: List[int] = []
+        for index, pair in enumerate(pairs):
+            task_id, user_id = pair
+            if task_id not in tasks:
+                errors[index] = "Task not found"
+            elif user_id not in existing_user_ids:
+                errors[index] = "User not found"
+            elif (user_id, tasks[task_id].project_id) not in memberships:
+                errors[index] = "User is not a project member"
+            elif pair in assigned:
+                errors[index] = "Task already assigned to this user"
+            else:
+                # 같은 요청 안의 중복도 거른다
+                assigned.add(pair)
+                valid.append(index)
+
+        if not valid:
+            return [], errors
+
+        result = await db.scalars(
+            insert(TaskAssignment).returning(
+                TaskAssignment, sort_by_parameter_order=True
+            ),
+            [
+                {
+                    "task_id": pairs[index][0],
+                    "user_id": pairs[index][1],
+                    "assigned_by": assigned_by,
+                }
+                for index in valid
+            ],
+        )
+        assignments = list(result)
+        await StatsService.tasks_assigned(
+            db, [(tasks[a.task_id], a.user_id) for a in assignments]
+        )
+        return list(zip(valid, assignments)), errors
+
+    @staticmethod
+    async def update_task_status(
+        db: AsyncSession, task: Task, status: TaskStatus
+    ) -> Task:
+        """상태 변경 (프로젝트 작업 수/진행률과 담당자 카운터도 같은 트랜잭션에서 반영)"""
+        old_status = task.status
+        task.status = status
+        task.completed_at = (
+            datetime.now(timezone.utc) if status == TaskStatus.DONE else None
+        )
+        await StatsService.task_status_changed(db, task, old_status, status)
+        await db.flush()
+        return task
+
+    @staticmethod
+    async def delete_task(db: AsyncSession, task: Task) -> None:
+        """작업과 딸린 할당/댓글/첨부/태그 삭제
+
+        하위 작업은 삭제하지 않고 상위 작업으로 올리며, 연결된 일정은 연결만 끊는다.
+        """
+        await StatsService.task_deleted(db, task)
+        for model in (TaskAssignment, TaskComment, TaskAttachment, TaskTag):
+            await db.execute(
+                delete(model)
+                .where(model.task_id == task.id)
+                .execution_options(synchronize_session=False)
+            )
+        await db.execute(
+            update(Task)
+            .where(Task.parent_task_id == task.id)
+            .values(parent_task_id=task.parent_task_id)
+            .execution_options(synchronize_session=False)
+        )
+        result = await db.execute(
+            update(Event)
+            .where(Event.task_id == task.id)
+            .values(task_id=None)
+            .returning(Event.calendar_id)
+            .execution_options(synchronize_session=False)
+        )
+        # 펼쳐 둔 반복 일정 회차에도 작업 연결이 들어 있다
+        invalidate_calendars_on_commit(db.sync_session, result.scalars())
+        await db.delete(task)
+        await db.flush()
+
+    @staticmethod
+    async def get_task_assignee_ids(db: AsyncSession, task_id: int) -> List[int]:
+        result = await db.execute(
+            select(TaskAssignment.user_id).where(TaskAssignment.task_id == task_id)
+        )
+        return list(result.scalars())
+
     @staticmethod
     async def get_task_assignees(db: AsyncSession, task_id: int) -> List[User]:
         result = await db.execute(
@@ -1,8 +1,10 @@
 from typing import Optional, List
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from app.models.user import User, UserActivityLog
-from app.core.security import get_password_hash, verify_password
+from app.models.user import User
+from app.core.hashing import password_hasher
+from app.services.activity_log_writer import activity_log_writer
+from app.services.stats_service import StatsService
 
 class UserService:
     @staticmethod
@@ -29,7 +31,7 @@ class UserService:
         full_name: Optional[str] = None,
         role: str = "developer"
     ) -> User:
-        hashed_password = get_password_hash(password)
+        hashed_password = await password_hasher.hash(password)
         user = User(
             email=email,
             username=username,
@@ -38,8 +40,8 @@ class UserService:
             role=role
         )
         db.add(user)
-        await db.commit()
-        await db.refresh(user)
+        await db.flush()
+        await StatsService.user_created(db, user.id)
         return user
     
     @staticmethod
@@ -48,9 +50,15 @@ class UserService:
         user: User,
         new_password: str
     ) -> User:
-        user.hashed_password = get_password_hash(new_password)
-        await db.commit()
-        await db.refresh(user)
+        user.hashed_password = await password_hasher.hash(new_password)
+        await db.flush()
+        return user
+    
+    @staticmethod
+    async def deactivate_user(db: AsyncSession, user: User) -> User:
+        # 캐시된 인증 정보는 커밋 후 모든 워커에서 무효화된다 (app.core.user_cache)
+        user.is_active = False
+        await db.flush()
         return user
     
     @staticmethod
@@ -62,12 +70,13 @@ class UserService:
         resource_id: Optional[int] = None,
         description: Optional[str] = None
     ):
-        activity_log = UserActivityLog(
-            user_id=user_id,
-            action=action,
-            resource_type=resource_type,
-            resource_id=resource_id,
-            description=description
-        )
-        db.add(activity_log)
-        await db.commit()
\ No newline at end of file
+        # 행마다 커밋하지 않고 일괄 기록기로 넘긴다 (호출 측 트랜잭션과 무관)
+        await activity_log_writer.write(
+            {
+                "user_id": user_id,
+                "action": action,
+                "resource_type": resource_type,
+                "resource_id": resource_id,
+                "description": description,
+            }
+        )
\ No newline at end of file
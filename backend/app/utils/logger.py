@@ -36,7 +36,12 @@ def log_user_activity(
     description: str = None,
     extra_data: Dict[str, Any] = None
 ):
-    """사용자 활동 로깅"""
+    """사용자 활동 로깅
+
+    구조화 로그와 user_activity_logs 테이블이 같은 일괄 기록 스트림에서 채워진다.
+    """
+    from app.services.activity_log_writer import activity_log_writer
+
     log_data = {
         "user_id": user_id,
         "action": action,
@@ -48,4 +53,4 @@ def log_user_activity(
     if extra_data:
         log_data.update(extra_data)
     
-    logger.info("User activity", **log_data)
\ No newline at end of file
+    activity_log_writer.record(log_data)
\ No newline at end of file
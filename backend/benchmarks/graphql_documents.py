@@ -0,0 +1,113 @@
+"""GraphQL 파싱/검증 캐시와 persisted query 효과 측정
+
+프론트엔드(`frontend/src/graphql`)의 gql 문서를 요청 흐름처럼 반복해서
+`schema.execute()`로 실행한다. 같은 스키마를 ParserCache/ValidationCache
+확장 없이(uncached), 그리고 main.py와 같은 설정으로(cached) 만들어 요청당
+시간을 비교하고, 쿼리 본문 대신 APQ 해시만 보낼 때의 요청 본문 크기도 본다.
+
+DB와 변수 없이 실행하므로 실행 단계는 변수 검사나 리졸버에서 바로 오류로
+끝나고 (두 경우 같은 비용), 차이는 문서 파싱/검증에서 난다.
+
+    cd backend && python -m benchmarks.graphql_documents --requests 5000
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import re
+import time
+from pathlib import Path
+
+import strawberry
+from strawberry.extensions import ParserCache, ValidationCache
+
+from app.api.graphql.mutations import Mutation
+from app.api.graphql.persisted_queries import query_hash
+from app.api.graphql.queries import Query
+from app.core.config import settings
+
+DEFAULT_OPERATIONS_DIR = Path(__file__).resolve().parents[2] / "frontend/src/graphql"
+GQL_PATTERN = re.compile(r"gql`(.*?)`", re.S)
+
+
+def load_operations(directory: Path) -> list:
+    operations = []
+    for path in sorted(directory.rglob("*.ts")):
+        operations.extend(
+            match.strip() for match in GQL_PATTERN.findall(path.read_text())
+        )
+    # 구독은 execute()가 아닌 subscribe()로 처리되므로 제외
+    return [query for query in operations if not query.startswith("subscription")]
+
+
+def build_schema(cached: bool) -> strawberry.Schema:
+    extensions = (
+        [
+            ParserCache(maxsize=settings.GRAPHQL_DOCUMENT_CACHE_SIZE),
+            ValidationCache(maxsize=settings.GRAPHQL_DOCUMENT_CACHE_SIZE),
+        ]
+        if cached
+        else []
+    )
+    return strawberry.Schema(query=Query, mutation=Mutation, extensions=extensions)
+
+
+async def run(label: str, schema: strawberry.Schema, operations: list, requests: int):
+    started = time.perf_counter()
+    for i in range(requests):
+        await schema.execute(operations[i % len(operations)], context_value={})
+    elapsed = time.perf_counter() - started
+
+    print(
+        f"{label:>9}: {elapsed / requests * 1e6:8.1f} us/request "
+        f"({requests / elapsed:9.0f} requests/s)"
+    )
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--operations-dir", type=Path, default=DEFAULT_OPERATIONS_DIR)
+    args = parser.parse_args()
+
+    operations = load_operations(args.operations_dir)
+    if not operations:
+        raise SystemExit(f"No gql documents found under {args.operations_dir}")
+    print(f"{len(operations)} operations from {args.operations_dir}")
+
+    # 리졸버 오류 로그는 측정과 무관
+    logging.getLogger("strawberry.execution").disabled = True
+    uncached = asyncio.run(
+        run("uncached", build_schema(cached=False), operations, args.requests)
+    )
+    cached = asyncio.run(
+        run("cached", build_schema(cached=True), operations, args.requests)
+    )
+    print(f"  speedup: {uncached / cached:.1f}x")
+
+    full = sum(len(json.dumps({"query": query})) for query in operations)
+    hashed = sum(
+        len(
+            json.dumps(
+                {
+                    "extensions": {
+                        "persistedQuery": {
+                            "version": 1,
+                            "sha256Hash": query_hash(query),
+                        }
+                    }
+                }
+            )
+        )
+        for query in operations
+    )
+    print(
+        f"request body: {full / len(operations):.0f} B with query, "
+        f"{hashed / len(operations):.0f} B with APQ hash"
+    )
+
+
+if __name__ == "__main__":
+    main()
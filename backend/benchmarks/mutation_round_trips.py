@@ -0,0 +1,140 @@
+"""뮤테이션별 DB 왕복 수 측정
+
+빈 DB에 스키마를 만들고 GraphQL 뮤테이션을 실제 스키마로 실행하면서 요청마다
+나간 SQL 문장 수와 COMMIT 수를 센다. 서비스가 `flush()`만 하고 뮤테이션이
+한 번 커밋하는지(COMMIT 1), 서버 기본값을 `refresh()` SELECT 없이 RETURNING
+으로 받는지를 확인하는 용도.
+
+    cd backend && python -m benchmarks.mutation_round_trips
+    cd backend && python -m benchmarks.mutation_round_trips \\
+        --database-url postgresql+asyncpg://.../bench
+
+주의: 대상 DB의 테이블을 만들고 끝나면 모두 삭제하므로 빈 검사용 DB를 쓸 것.
+"""
+
+import argparse
+import asyncio
+from collections import Counter
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.api.graphql.loaders import Loaders
+from app.core.database import Base
+from app.main import schema
+from app.models import calendar, permission, stats  # noqa: F401 (테이블 등록)
+from app.services.user_service import UserService
+
+MUTATIONS = [
+    (
+        "register",
+        """mutation {
+          register(userInput: {email: "new@example.com", username: "new",
+                               password: "secret123", fullName: "New"}) {
+            accessToken user { id createdAt }
+          }
+        }""",
+    ),
+    (
+        "login",
+        """mutation {
+          login(usernameOrEmail: "new", password: "secret123") { user { id } }
+        }""",
+    ),
+    (
+        "createProject",
+        """mutation {
+          createProject(projectInput: {name: "p", status: PLANNING, priority: "high"}) {
+            id createdAt
+          }
+        }""",
+    ),
+    (
+        "updateProject",
+        """mutation {
+          updateProject(projectId: 1, projectInput: {name: "p2", status: IN_PROGRESS}) {
+            id updatedAt
+          }
+        }""",
+    ),
+    (
+        "createTask",
+        """mutation {
+          createTask(taskInput: {title: "t", projectId: 1, status: TODO}) {
+            id createdAt
+          }
+        }""",
+    ),
+    (
+        "assignTask",
+        """mutation { assignTask(taskId: 1, userId: 1) }""",
+    ),
+    (
+        "createTasks(10)",
+        """mutation {
+          createTasks(inputs: [%s]) { tasks { id } errors { index } }
+        }"""
+        % ", ".join(
+            f'{{title: "t{i}", projectId: 1, status: TODO}}' for i in range(10)
+        ),
+    ),
+]
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--database-url", default="sqlite+aiosqlite:///:memory:")
+    args = parser.parse_args()
+
+    engine = create_async_engine(args.database_url)
+    session_maker = async_sessionmaker(
+        engine, class_=AsyncSession, expire_on_commit=False
+    )
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    counts: Counter = Counter()
+
+    def on_execute(conn, cursor, statement, parameters, context, executemany):
+        counts[statement.lstrip().split(None, 1)[0].upper()] += 1
+
+    def on_commit(conn):
+        counts["COMMIT"] += 1
+
+    try:
+        event.listen(engine.sync_engine, "before_cursor_execute", on_execute)
+        event.listen(engine.sync_engine, "commit", on_commit)
+
+        print(f"{'mutation':<16}{'statements':>11}{'SELECT':>8}{'commits':>9}")
+        current_user = None
+        for name, query in MUTATIONS:
+            async with session_maker() as session:
+                counts.clear()
+                result = await schema.execute(
+                    query,
+                    context_value={
+                        "db": session,
+                        "current_user": current_user,
+                        "loaders": Loaders(session),
+                    },
+                )
+                if result.errors:
+                    raise SystemExit(f"{name} failed: {result.errors[0].message}")
+                statements = sum(v for k, v in counts.items() if k != "COMMIT")
+                print(
+                    f"{name:<16}{statements:>11}{counts['SELECT']:>8}"
+                    f"{counts['COMMIT']:>9}"
+                )
+            if current_user is None:
+                # 이후 뮤테이션은 방금 가입한 사용자로 실행
+                async with session_maker() as session:
+                    current_user = await UserService.get_user_by_id(session, 1)
+    finally:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
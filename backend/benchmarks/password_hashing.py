@@ -0,0 +1,88 @@
+"""로그인(bcrypt) 부하 중 이벤트 루프 지연 측정
+
+동시에 N건의 비밀번호 검증을 실행하면서, 별도 코루틴이 10ms 간격으로
+`SELECT 1`을 보내 그 지연을 기록한다. bcrypt를 이벤트 루프에서 직접 실행할
+때(inline)와 PasswordHasher의 스레드/프로세스 풀을 쓸 때를 비교한다.
+
+    cd backend && python -m benchmarks.password_hashing --logins 40
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.hashing import PasswordHasher
+from app.core.security import get_password_hash, verify_password
+
+PASSWORD = "correct horse battery staple"
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def probe(engine, stop: asyncio.Event, latencies: list):
+    # 쿼리를 보내려던 시각부터 응답까지를 측정 (루프가 막혀 있던 시간 포함)
+    async with engine.connect() as conn:
+        while not stop.is_set():
+            scheduled = time.perf_counter() + 0.01
+            await asyncio.sleep(0.01)
+            await conn.execute(text("SELECT 1"))
+            latencies.append((time.perf_counter() - scheduled) * 1000)
+
+
+async def run(mode: str, logins: int, workers: int, hashed: str):
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    hasher = None
+    if mode != "inline":
+        hasher = PasswordHasher(
+            executor_type=mode, max_workers=workers, max_concurrency=workers
+        )
+
+    async def login():
+        if hasher is None:
+            return verify_password(PASSWORD, hashed)
+        return await hasher.verify(PASSWORD, hashed)
+
+    stop = asyncio.Event()
+    latencies: list = []
+    probe_task = asyncio.create_task(probe(engine, stop, latencies))
+    await asyncio.sleep(0.05)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(login() for _ in range(logins)))
+    elapsed = time.perf_counter() - started
+
+    stop.set()
+    await probe_task
+    await engine.dispose()
+    if hasher is not None:
+        hasher.shutdown()
+
+    print(
+        f"{mode:>8}: {logins / elapsed:7.1f} logins/s | "
+        f"SELECT 1 p50 {statistics.median(latencies):8.2f} ms, "
+        f"p99 {percentile(latencies, 99):8.2f} ms, "
+        f"max {max(latencies):8.2f} ms ({len(latencies)} samples)"
+    )
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--logins", type=int, default=40)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    hashed = get_password_hash(PASSWORD)
+    for mode in ("inline", "thread", "process"):
+        await run(mode, args.logins, args.workers, hashed)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
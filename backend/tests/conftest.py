@@ -1,13 +1,26 @@
 import pytest
 import asyncio
-from typing import AsyncGenerator
-from httpx import AsyncClient
+from typing import AsyncGenerator, Callable, Dict
+from httpx import ASGITransport, AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.pool import StaticPool
 
 from app.main import app
+from app.api.graphql import context as graphql_context, subscriptions
+from app.api.graphql.extensions import cost_budget
+from app.api.graphql.http_cache import _policy_cache
+from app.api.graphql.persisted_queries import persisted_query_registry
+from app.api.graphql.response_cache import response_cache
+from app.core.change_hub import MemoryBroker, change_hub
 from app.core.database import Base, get_db
-from app.core.config import settings
+from app.core.permissions import permission_engine
+from app.core.security import create_access_token
+from app.core.user_cache import user_cache
+from app.models.project import Project, ProjectMember
+from app.models.user import User
+from app.services import activity_log_writer, export_service, project_count_reconciler
+from app.services.attachment_service import _access_cache
+from app.services.recurrence import occurrence_cache
 
 # Test database URL (in-memory SQLite for testing)
 # psycopg는 PostgreSQL 전용이므로 테스트에서는 aiosqlite 사용
@@ -23,30 +36,120 @@ TestingSessionLocal = async_sessionmaker(
     engine, class_=AsyncSession, expire_on_commit=False
 )
 
+# Redis 없이 동작하는 프로세스 내 백엔드로 바꾼다
+response_cache.backend = "memory"
+change_hub.broker = MemoryBroker()
 
-@pytest.fixture(scope="session")
-def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+# 요청 밖에서 직접 세션을 여는 코드(활동 로그, 구독, 내보내기 등)도 테스트 DB로
+for module in (
+    activity_log_writer,
+    export_service,
+    graphql_context,
+    project_count_reconciler,
+    subscriptions,
+):
+    module.async_session_maker = TestingSessionLocal
+
+
+@pytest.fixture(scope="session", autouse=True)
+def dispose_engine():
+    """aiosqlite 워커 스레드가 남아 있으면 인터프리터가 종료되지 않는다"""
+    yield
+    asyncio.run(engine.dispose())
+
+
+@pytest.fixture(autouse=True)
+def reset_caches():
+    """테스트 사이에 프로세스 캐시가 이전 테스트의 데이터를 돌려주지 않도록 비운다"""
+    user_cache.clear()
+    cost_budget._buckets.clear()
+    permission_engine._cache.clear()
+    permission_engine._catalog = None
+    _access_cache.clear()
+    _policy_cache.clear()
+    response_cache._local.clear()
+    response_cache._tag_versions.clear()
+    occurrence_cache.clear()
+    persisted_query_registry._local.clear()
+    yield
 
 
 @pytest.fixture
 async def db_session() -> AsyncGenerator[AsyncSession, None]:
     async with engine.begin() as connection:
         await connection.run_sync(Base.metadata.create_all)
-        async with TestingSessionLocal() as session:
-            yield session
+    async with TestingSessionLocal() as session:
+        yield session
+    async with engine.begin() as connection:
         await connection.run_sync(Base.metadata.drop_all)
 
 
 @pytest.fixture
 async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
-    def get_test_db():
-        return db_session
+    async def get_test_db():
+        # 요청마다 새 세션 (운영의 get_db와 같이 요청 단위 unit of work)
+        async with TestingSessionLocal() as session:
+            yield session
 
     app.dependency_overrides[get_db] = get_test_db
-    async with AsyncClient(app=app, base_url="http://testserver") as client:
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://testserver") as client:
         yield client
     app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def create_user(db_session: AsyncSession) -> Callable:
+    async def _create_user(username: str, **kwargs) -> User:
+        user = User(
+            email=f"{username}@example.com",
+            username=username,
+            hashed_password="not-used",
+            **kwargs,
+        )
+        db_session.add(user)
+        await db_session.commit()
+        return user
+
+    return _create_user
+
+
+@pytest.fixture
+def create_project(db_session: AsyncSession) -> Callable:
+    async def _create_project(
+        creator: User, name: str = "Project", members=()
+    ) -> Project:
+        project = Project(name=name, creator_id=creator.id)
+        db_session.add(project)
+        await db_session.flush()
+        for member in members:
+            db_session.add(ProjectMember(project_id=project.id, user_id=member.id))
+        await db_session.commit()
+        return project
+
+    return _create_project
+
+
+def _auth_headers(user: User) -> Dict[str, str]:
+    return {"Authorization": f"Bearer {create_access_token(user.id)}"}
+
+
+@pytest.fixture
+def auth_headers() -> Callable:
+    return _auth_headers
+
+
+@pytest.fixture
+def graphql(client: AsyncClient) -> Callable:
+    """인증 사용자로 GraphQL 요청을 보내고 응답 JSON을 돌려준다"""
+
+    async def _graphql(user: User, query: str, variables: Dict = None) -> Dict:
+        response = await client.post(
+            "/graphql",
+            json={"query": query, "variables": variables or {}},
+            headers=_auth_headers(user),
+        )
+        assert response.status_code == 200, response.text
+        return response.json()
+
+    return _graphql
@@ -0,0 +1,46 @@
+import asyncio
+
+from sqlalchemy import select
+
+from app.models.user import UserActivityLog
+from app.services.activity_log_writer import ActivityLogWriter
+
+
+class GatedWriter(ActivityLogWriter):
+    """첫 배치의 기록을 열어 줄 때까지 붙잡아 기록 도중의 종료를 재현"""
+
+    def __init__(self):
+        super().__init__(max_queue=10, batch_size=1, flush_interval=0.01)
+        self.flushing = asyncio.Event()
+        self.release = asyncio.Event()
+
+    async def _flush(self, batch):
+        if not self.flushing.is_set():
+            self.flushing.set()
+            await self.release.wait()
+        await super()._flush(batch)
+
+
+async def test_stop_during_flush_finishes_the_batch_and_drains_the_queue(
+    db_session, create_user
+):
+    user = await create_user("alice")
+    writer = GatedWriter()
+    writer.start()
+
+    await writer.write({"user_id": user.id, "action": "first"})
+    await writer.flushing.wait()
+    await writer.write({"user_id": user.id, "action": "second"})
+    stop = asyncio.ensure_future(writer.stop())
+    await asyncio.sleep(0.05)
+    assert not stop.done()
+
+    writer.release.set()
+    await stop
+
+    result = await db_session.execute(
+        select(UserActivityLog.action).order_by(UserActivityLog.id)
+    )
+    assert list(result.scalars()) == ["first", "second"]
+    assert writer.stats()["written"] == 2
+    assert not writer.running
@@ -0,0 +1,233 @@
+import hashlib
+import os
+
+import pytest
+
+from app.core.config import settings
+
+CONTENT = b"0123456789"
+
+
+@pytest.fixture(autouse=True)
+def upload_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "UPLOAD_DIR", str(tmp_path))
+    return tmp_path
+
+
+async def _start_upload(client, headers, project_id, length=len(CONTENT)):
+    response = await client.post(
+        f"/attachments/projects/{project_id}/uploads",
+        params={"filename": "notes.txt"},
+        headers={**headers, "Upload-Length": str(length)},
+    )
+    assert response.status_code == 201
+    return response.json()["upload_id"]
+
+
+async def _patch(client, headers, upload_id, offset, body):
+    return await client.patch(
+        f"/attachments/uploads/{upload_id}",
+        content=body,
+        headers={**headers, "Upload-Offset": str(offset)},
+    )
+
+
+async def test_resumable_upload_continues_from_the_stored_offset(
+    db_session, client, create_user, create_project, auth_headers, upload_dir
+):
+    user = await create_user("alice")
+    project = await create_project(user)
+    headers = auth_headers(user)
+    upload_id = await _start_upload(client, headers, project.id)
+
+    response = await _patch(client, headers, upload_id, 0, CONTENT[:4])
+    assert response.status_code == 204
+    assert response.headers["upload-offset"] == "4"
+
+    # 끊긴 뒤 HEAD로 서버가 받은 오프셋을 확인하고 그 지점부터 다시 보낸다
+    response = await client.head(f"/attachments/uploads/{upload_id}", headers=headers)
+    assert response.headers["upload-offset"] == "4"
+    assert response.headers["upload-length"] == str(len(CONTENT))
+
+    response = await _patch(client, headers, upload_id, 2, CONTENT[2:])
+    assert response.status_code == 409
+    assert response.headers["upload-offset"] == "4"
+
+    response = await _patch(client, headers, upload_id, 4, CONTENT[4:])
+    assert response.status_code == 201
+    assert response.headers["upload-offset"] == str(len(CONTENT))
+    body = response.json()
+    content_hash = hashlib.sha256(CONTENT).hexdigest()
+    assert (body["file_size"], body["content_hash"]) == (len(CONTENT), content_hash)
+
+    blob = upload_dir / "blobs" / content_hash[:2] / content_hash[2:4] / content_hash
+    assert blob.read_bytes() == CONTENT
+    # 완료된 세션과 임시 파일은 남지 않는다
+    assert os.listdir(upload_dir / "partial") == []
+    response = await client.head(f"/attachments/uploads/{upload_id}", headers=headers)
+    assert response.status_code == 404
+
+
+async def test_upload_beyond_declared_length_is_rejected(
+    db_session, client, create_user, create_project, auth_headers
+):
+    user = await create_user("alice")
+    project = await create_project(user)
+    headers = auth_headers(user)
+    upload_id = await _start_upload(client, headers, project.id, length=4)
+
+    response = await _patch(client, headers, upload_id, 0, CONTENT)
+
+    assert response.status_code == 413
+
+
+async def test_upload_sessions_belong_to_their_creator(
+    db_session, client, create_user, create_project, auth_headers
+):
+    owner = await create_user("owner")
+    other = await create_user("other")
+    project = await create_project(owner, members=[other])
+    upload_id = await _start_upload(client, auth_headers(owner), project.id)
+
+    response = await client.head(
+        f"/attachments/uploads/{upload_id}", headers=auth_headers(other)
+    )
+    assert response.status_code == 404
+    response = await _patch(client, auth_headers(other), upload_id, 0, CONTENT)
+    assert response.status_code == 404
+
+    response = await client.delete(
+        f"/attachments/uploads/{upload_id}", headers=auth_headers(owner)
+    )
+    assert response.status_code == 204
+    response = await _patch(client, auth_headers(owner), upload_id, 0, CONTENT)
+    assert response.status_code == 404
+
+
+async def test_same_content_is_stored_once(
+    db_session, client, create_user, create_project, auth_headers, upload_dir
+):
+    user = await create_user("alice")
+    project = await create_project(user)
+    headers = auth_headers(user)
+
+    results = []
+    for filename in ("a.txt", "b.txt"):
+        response = await client.post(
+            f"/attachments/projects/{project.id}",
+            params={"filename": filename},
+            content=CONTENT,
+            headers=headers,
+        )
+        assert response.status_code == 201
+        results.append(response.json())
+
+    assert [result["deduplicated"] for result in results] == [False, True]
+    assert results[0]["content_hash"] == results[1]["content_hash"]
+    blobs = [files for _, _, files in os.walk(upload_dir / "blobs") if files]
+    assert blobs == [[results[0]["content_hash"]]]
+
+
+async def _upload(client, headers, project_id, filename="notes.txt"):
+    response = await client.post(
+        f"/attachments/projects/{project_id}",
+        params={"filename": filename},
+        content=CONTENT,
+        headers=headers,
+    )
+    return response.json()
+
+
+async def test_range_download_returns_partial_content(
+    db_session, client, create_user, create_project, auth_headers
+):
+    user = await create_user("alice")
+    project = await create_project(user)
+    headers = auth_headers(user)
+    attachment = await _upload(client, headers, project.id)
+    url = f"/attachments/projects/files/{attachment['id']}"
+
+    response = await client.get(url, headers=headers)
+    assert response.status_code == 200
+    assert response.content == CONTENT
+    assert response.headers["accept-ranges"] == "bytes"
+
+    response = await client.get(url, headers={**headers, "Range": "bytes=2-5"})
+    assert response.status_code == 206
+    assert response.content == CONTENT[2:6]
+    assert response.headers["content-range"] == f"bytes 2-5/{len(CONTENT)}"
+
+    response = await client.get(url, headers={**headers, "Range": "bytes=-3"})
+    assert response.status_code == 206
+    assert response.content == CONTENT[-3:]
+
+    response = await client.get(url, headers={**headers, "Range": "bytes=50-"})
+    assert response.status_code == 416
+
+
+async def test_download_is_revalidated_by_content_hash(
+    db_session, client, create_user, create_project, auth_headers
+):
+    user = await create_user("alice")
+    project = await create_project(user)
+    headers = auth_headers(user)
+    attachment = await _upload(client, headers, project.id)
+    url = f"/attachments/projects/files/{attachment['id']}"
+
+    response = await client.get(url, headers=headers)
+    etag = f'"{attachment["content_hash"]}"'
+    assert response.headers["etag"] == etag
+    assert response.headers["cache-control"] == (
+        f"private, max-age={settings.ATTACHMENT_CACHE_MAX_AGE}, immutable"
+    )
+    assert response.headers["content-disposition"] == 'inline; filename="notes.txt"'
+
+    response = await client.get(url, headers={**headers, "If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+
+
+async def test_download_requires_project_access(
+    db_session, client, create_user, create_project, auth_headers
+):
+    owner = await create_user("owner")
+    member = await create_user("member")
+    outsider = await create_user("outsider")
+    project = await create_project(owner, members=[member])
+    attachment = await _upload(client, auth_headers(owner), project.id)
+    url = f"/attachments/projects/files/{attachment['id']}"
+
+    response = await client.get(url, headers=auth_headers(member))
+    assert response.status_code == 200
+
+    response = await client.get(
+        url, headers={**auth_headers(outsider), "Range": "bytes=0-1"}
+    )
+    assert response.status_code == 404
+    # 다른 대상 종류의 같은 id로도 읽을 수 없다
+    response = await client.get(
+        f"/attachments/tasks/files/{attachment['id']}", headers=auth_headers(owner)
+    )
+    assert response.status_code == 404
+
+
+async def test_accel_redirect_leaves_the_transfer_to_the_proxy(
+    db_session, client, create_user, create_project, auth_headers, monkeypatch
+):
+    user = await create_user("alice")
+    project = await create_project(user)
+    headers = auth_headers(user)
+    attachment = await _upload(client, headers, project.id)
+    monkeypatch.setattr(settings, "ATTACHMENT_ACCEL_REDIRECT_PREFIX", "/protected/")
+
+    response = await client.get(
+        f"/attachments/projects/files/{attachment['id']}",
+        headers={**headers, "Range": "bytes=0-1"},
+    )
+
+    content_hash = attachment["content_hash"]
+    assert response.status_code == 200
+    assert response.content == b""
+    assert response.headers["x-accel-redirect"] == (
+        f"/protected/blobs/{content_hash[:2]}/{content_hash[2:4]}/{content_hash}"
+    )
@@ -0,0 +1,186 @@
+from sqlalchemy import select
+
+from app.core.config import settings
+from app.models.project import Project
+from app.models.stats import StatsCounter
+from app.models.task import Task, TaskAssignment
+
+CREATE_TASKS = """
+mutation CreateTasks($inputs: [TaskInput!]!) {
+  createTasks(inputs: $inputs) {
+    tasks { id title }
+    errors { index message }
+  }
+}
+"""
+
+ASSIGN_TASKS = """
+mutation AssignTasks($pairs: [TaskAssignmentInput!]!) {
+  assignTasks(pairs: $pairs) {
+    assignments { taskId userId }
+    errors { index message }
+  }
+}
+"""
+
+
+async def test_create_tasks_reports_per_row_errors(
+    db_session, graphql, create_user, create_project
+):
+    user = await create_user("alice")
+    project = await create_project(user)
+
+    result = await graphql(
+        user,
+        CREATE_TASKS,
+        {
+            "inputs": [
+                {"title": "first", "projectId": project.id},
+                {"title": "   ", "projectId": project.id},
+                {"title": "orphan", "projectId": project.id + 100},
+                {"title": "second", "projectId": project.id},
+            ]
+        },
+    )
+    payload = result["data"]["createTasks"]
+
+    assert [task["title"] for task in payload["tasks"]] == ["first", "second"]
+    assert payload["errors"] == [
+        {"index": 1, "message": "Title is required"},
+        {"index": 2, "message": "Project not found"},
+    ]
+
+    project = await db_session.get(Project, project.id, populate_existing=True)
+    assert project.tasks_total == 2
+    assert project.tasks_todo == 2
+
+
+async def test_create_tasks_with_only_invalid_rows_creates_nothing(
+    db_session, graphql, create_user
+):
+    user = await create_user("alice")
+
+    result = await graphql(
+        user, CREATE_TASKS, {"inputs": [{"title": "orphan", "projectId": 999}]}
+    )
+
+    assert result["data"]["createTasks"] == {
+        "tasks": [],
+        "errors": [{"index": 0, "message": "Project not found"}],
+    }
+    assert (await db_session.scalars(select(Task))).all() == []
+
+
+async def test_create_tasks_rejects_oversized_batches(
+    graphql, create_user, create_project, monkeypatch
+):
+    user = await create_user("alice")
+    project = await create_project(user)
+    monkeypatch.setattr(settings, "BATCH_MUTATION_MAX_SIZE", 2)
+
+    result = await graphql(
+        user,
+        CREATE_TASKS,
+        {"inputs": [{"title": f"t{i}", "projectId": project.id} for i in range(3)]},
+    )
+
+    assert result["data"] is None
+    assert "Batch size exceeds 2 items" in result["errors"][0]["message"]
+
+
+async def test_assign_tasks_reports_per_row_errors(
+    db_session, graphql, create_user, create_project
+):
+    owner = await create_user("owner")
+    member = await create_user("member")
+    project = await create_project(owner, members=[member])
+    first = Task(title="first", project_id=project.id, created_by=owner.id)
+    second = Task(title="second", project_id=project.id, created_by=owner.id)
+    db_session.add_all([first, second])
+    await db_session.flush()
+    db_session.add(
+        TaskAssignment(task_id=first.id, user_id=owner.id, assigned_by=owner.id)
+    )
+    await db_session.commit()
+
+    result = await graphql(
+        owner,
+        ASSIGN_TASKS,
+        {
+            "pairs": [
+                {"taskId": first.id, "userId": member.id},
+                {"taskId": 999, "userId": member.id},
+                {"taskId": second.id, "userId": 999},
+                {"taskId": first.id, "userId": owner.id},
+                {"taskId": first.id, "userId": member.id},
+                {"taskId": second.id, "userId": member.id},
+            ]
+        },
+    )
+    payload = result["data"]["assignTasks"]
+
+    assert payload["assignments"] == [
+        {"taskId": first.id, "userId": member.id},
+        {"taskId": second.id, "userId": member.id},
+    ]
+    assert payload["errors"] == [
+        {"index": 1, "message": "Task not found"},
+        {"index": 2, "message": "User not found"},
+        {"index": 3, "message": "Task already assigned to this user"},
+        {"index": 4, "message": "Task already assigned to this user"},
+    ]
+
+    counters = await db_session.execute(
+        select(StatsCounter.metric, StatsCounter.value).where(
+            StatsCounter.scope == "user", StatsCounter.scope_id == member.id
+        )
+    )
+    assert dict(counters.all()) == {"tasks_total": 2, "tasks_todo": 2}
+
+
+async def test_bulk_mutations_are_scoped_to_accessible_projects(
+    db_session, graphql, create_user, create_project
+):
+    owner = await create_user("owner")
+    member = await create_user("member")
+    outsider = await create_user("outsider")
+    project = await create_project(owner, members=[member])
+    task = Task(title="first", project_id=project.id, created_by=owner.id)
+    db_session.add(task)
+    await db_session.commit()
+
+    result = await graphql(
+        outsider,
+        CREATE_TASKS,
+        {"inputs": [{"title": "intruder", "projectId": project.id}]},
+    )
+    assert result["data"]["createTasks"] == {
+        "tasks": [],
+        "errors": [{"index": 0, "message": "Project not found"}],
+    }
+
+    result = await graphql(
+        outsider, ASSIGN_TASKS, {"pairs": [{"taskId": task.id, "userId": outsider.id}]}
+    )
+    assert result["data"]["assignTasks"]["errors"] == [
+        {"index": 0, "message": "Task not found"}
+    ]
+
+    # 담당자도 프로젝트 멤버(또는 생성자)여야 한다
+    result = await graphql(
+        member,
+        ASSIGN_TASKS,
+        {
+            "pairs": [
+                {"taskId": task.id, "userId": outsider.id},
+                {"taskId": task.id, "userId": owner.id},
+            ]
+        },
+    )
+    payload = result["data"]["assignTasks"]
+    assert payload["assignments"] == [{"taskId": task.id, "userId": owner.id}]
+    assert payload["errors"] == [
+        {"index": 0, "message": "User is not a project member"}
+    ]
+    assignments = await db_session.scalars(select(TaskAssignment.user_id))
+    assert assignments.all() == [owner.id]
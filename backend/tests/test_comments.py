@@ -0,0 +1,186 @@
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import func, select
+
+from app.models.project import ProjectComment
+from app.models.task import Task, TaskComment
+
+ADD_TASK_COMMENT = """
+mutation AddTaskComment($taskId: Int!, $input: CommentInput!) {
+  addTaskComment(taskId: $taskId, commentInput: $input) { id parentId replyCount }
+}
+"""
+
+ADD_PROJECT_COMMENT = """
+mutation AddProjectComment($projectId: Int!, $input: CommentInput!) {
+  addProjectComment(projectId: $projectId, commentInput: $input) { id }
+}
+"""
+
+TASK_COMMENTS = """
+query TaskComments($taskId: Int!, $first: Int!, $after: String) {
+  taskComments(taskId: $taskId, first: $first, after: $after) {
+    edges {
+      node { id content replyCount replies { id content parentId replyCount } }
+    }
+    pageInfo { hasNextPage endCursor }
+  }
+}
+"""
+
+PROJECT_COMMENTS = """
+query ProjectComments($projectId: Int!) {
+  projectComments(projectId: $projectId) {
+    edges { node { content replies { content } } }
+  }
+}
+"""
+
+
+async def _create_task(db_session, user, project):
+    task = Task(title="Task", project_id=project.id, created_by=user.id)
+    db_session.add(task)
+    await db_session.commit()
+    return task
+
+
+async def _comment(graphql, user, task_id, content, parent_id=None):
+    result = await graphql(
+        user,
+        ADD_TASK_COMMENT,
+        {"taskId": task_id, "input": {"content": content, "parentId": parent_id}},
+    )
+    return result["data"]["addTaskComment"] if result["data"] else result
+
+
+async def test_replies_roll_up_reply_count_and_nest_under_the_root(
+    db_session, graphql, create_user, create_project
+):
+    user = await create_user("alice")
+    project = await create_project(user)
+    task = await _create_task(db_session, user, project)
+
+    root = await _comment(graphql, user, task.id, "root")
+    reply = await _comment(graphql, user, task.id, "reply", parent_id=root["id"])
+    nested = await _comment(graphql, user, task.id, "nested", parent_id=reply["id"])
+    assert nested["parentId"] == reply["id"]
+
+    result = await graphql(user, TASK_COMMENTS, {"taskId": task.id, "first": 10})
+    edges = result["data"]["taskComments"]["edges"]
+
+    # 최상위 댓글만 페이지에 나오고, 답글 하위 트리는 replies에 작성 순으로 붙는다
+    assert len(edges) == 1
+    thread = edges[0]["node"]
+    assert (thread["content"], thread["replyCount"]) == ("root", 2)
+    assert thread["replies"] == [
+        {
+            "id": reply["id"],
+            "content": "reply",
+            "parentId": root["id"],
+            "replyCount": 1,
+        },
+        {
+            "id": nested["id"],
+            "content": "nested",
+            "parentId": reply["id"],
+            "replyCount": 0,
+        },
+    ]
+
+
+async def test_reply_to_comment_of_another_task_is_rejected(
+    db_session, graphql, create_user, create_project
+):
+    user = await create_user("alice")
+    project = await create_project(user)
+    task = await _create_task(db_session, user, project)
+    other = await _create_task(db_session, user, project)
+    root = await _comment(graphql, user, other.id, "root")
+
+    result = await _comment(graphql, user, task.id, "reply", parent_id=root["id"])
+
+    assert result["data"] is None
+    assert "Parent comment not found" in result["errors"][0]["message"]
+    comment = await db_session.get(TaskComment, root["id"], populate_existing=True)
+    assert comment.reply_count == 0
+
+
+async def test_threads_page_newest_first_by_cursor(
+    db_session, graphql, create_user, create_project
+):
+    user = await create_user("alice")
+    project = await create_project(user)
+    task = await _create_task(db_session, user, project)
+    # SQLite의 func.now()는 초 단위라 키셋 순서를 위해 작성 시각을 직접 지정
+    base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    db_session.add_all(
+        TaskComment(
+            task_id=task.id,
+            author_id=user.id,
+            content=f"comment {index}",
+            created_at=base + timedelta(minutes=index),
+        )
+        for index in range(5)
+    )
+    await db_session.commit()
+
+    contents, after = [], None
+    for expected_next in (True, True, False):
+        result = await graphql(
+            user, TASK_COMMENTS, {"taskId": task.id, "first": 2, "after": after}
+        )
+        connection = result["data"]["taskComments"]
+        contents.extend(edge["node"]["content"] for edge in connection["edges"])
+        assert connection["pageInfo"]["hasNextPage"] is expected_next
+        after = connection["pageInfo"]["endCursor"]
+
+    assert contents == [f"comment {index}" for index in reversed(range(5))]
+
+
+async def test_threads_are_hidden_from_users_without_project_access(
+    db_session, graphql, create_user, create_project
+):
+    owner = await create_user("owner")
+    outsider = await create_user("outsider")
+    project = await create_project(owner)
+    task = await _create_task(db_session, owner, project)
+    db_session.add_all(
+        [
+            TaskComment(task_id=task.id, author_id=owner.id, content="secret"),
+            ProjectComment(project_id=project.id, author_id=owner.id, content="plan"),
+        ]
+    )
+    await db_session.commit()
+
+    result = await graphql(outsider, TASK_COMMENTS, {"taskId": task.id, "first": 10})
+    assert result["data"]["taskComments"]["edges"] == []
+
+    result = await graphql(outsider, PROJECT_COMMENTS, {"projectId": project.id})
+    assert result["data"]["projectComments"]["edges"] == []
+
+    result = await graphql(owner, PROJECT_COMMENTS, {"projectId": project.id})
+    assert result["data"]["projectComments"]["edges"] == [
+        {"node": {"content": "plan", "replies": []}}
+    ]
+
+
+async def test_users_without_project_access_cannot_comment(
+    db_session, graphql, create_user, create_project
+):
+    owner = await create_user("owner")
+    outsider = await create_user("outsider")
+    project = await create_project(owner)
+    task = await _create_task(db_session, owner, project)
+
+    result = await _comment(graphql, outsider, task.id, "intrusion")
+    assert "Task not found" in result["errors"][0]["message"]
+
+    result = await graphql(
+        outsider,
+        ADD_PROJECT_COMMENT,
+        {"projectId": project.id, "input": {"content": "intrusion"}},
+    )
+    assert "Project not found" in result["errors"][0]["message"]
+
+    for model in (TaskComment, ProjectComment):
+        assert await db_session.scalar(select(func.count(model.id))) == 0
@@ -0,0 +1,140 @@
+import csv
+import io
+import json
+
+import pytest
+
+from app.core.config import settings
+from app.models.task import Task, TaskAssignment
+from app.models.user import UserActivityLog
+from app.services.export_service import ExportService
+
+
+@pytest.fixture
+async def exported_project(db_session, create_user, create_project):
+    owner = await create_user("owner")
+    member = await create_user("member")
+    project = await create_project(owner, members=[member])
+    other = await create_project(owner, name="Other")
+
+    tasks = [
+        Task(title=title, project_id=project.id, created_by=owner.id)
+        for title in ("Design", "Build")
+    ]
+    other_task = Task(title="Elsewhere", project_id=other.id, created_by=owner.id)
+    db_session.add_all([*tasks, other_task])
+    await db_session.flush()
+    db_session.add(
+        TaskAssignment(task_id=tasks[0].id, user_id=member.id, assigned_by=owner.id)
+    )
+    db_session.add_all(
+        [
+            UserActivityLog(
+                user_id=owner.id,
+                action="project_created",
+                resource_type="project",
+                resource_id=project.id,
+            ),
+            UserActivityLog(
+                user_id=member.id,
+                action="task_updated",
+                resource_type="task",
+                resource_id=tasks[1].id,
+            ),
+            UserActivityLog(
+                user_id=owner.id,
+                action="task_updated",
+                resource_type="task",
+                resource_id=other_task.id,
+            ),
+        ]
+    )
+    await db_session.commit()
+    return owner, member, project
+
+
+# 데이터셋별로 확인할 열과 기대 값 (다른 프로젝트의 행은 빠진다)
+EXPECTED = {
+    "tasks": ("title", ["Design", "Build"]),
+    "assignments": ("task_title", ["Design"]),
+    "activity": ("action", ["project_created", "task_updated"]),
+}
+
+
+async def _export(client, headers, project_id, dataset, format):
+    return await client.get(
+        f"/exports/projects/{project_id}/{dataset}",
+        params={"format": format},
+        headers=headers,
+    )
+
+
+@pytest.mark.parametrize("dataset", EXPECTED)
+async def test_csv_export(client, auth_headers, exported_project, dataset):
+    _, member, project = exported_project
+
+    response = await _export(client, auth_headers(member), project.id, dataset, "csv")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "text/csv; charset=utf-8"
+    assert response.headers["content-disposition"] == (
+        f'attachment; filename="project-{project.id}-{dataset}.csv"'
+    )
+    column, values = EXPECTED[dataset]
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [row[column] for row in rows] == values
+
+
+@pytest.mark.parametrize("dataset", EXPECTED)
+async def test_ndjson_export(
+    client, auth_headers, exported_project, monkeypatch, dataset
+):
+    # 한 행씩 읽어도 행이 나뉘거나 빠지지 않는다
+    monkeypatch.setattr(settings, "EXPORT_CHUNK_SIZE", 1)
+    _, member, project = exported_project
+
+    response = await _export(
+        client, auth_headers(member), project.id, dataset, "ndjson"
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    column, values = EXPECTED[dataset]
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [row[column] for row in rows] == values
+
+
+async def test_tasks_ndjson_serializes_enums_and_dates(
+    client, auth_headers, exported_project
+):
+    owner, _, project = exported_project
+
+    response = await _export(client, auth_headers(owner), project.id, "tasks", "ndjson")
+
+    row = json.loads(response.text.splitlines()[0])
+    assert row["status"] == "todo"
+    assert isinstance(row["created_at"], str)
+
+
+async def test_export_requires_project_access(
+    client, create_user, auth_headers, exported_project
+):
+    _, _, project = exported_project
+    outsider = await create_user("outsider")
+
+    response = await _export(client, auth_headers(outsider), project.id, "tasks", "csv")
+
+    assert response.status_code == 404
+
+
+async def test_csv_header_is_the_first_chunk(exported_project, monkeypatch):
+    monkeypatch.setattr(settings, "EXPORT_CHUNK_SIZE", 1)
+    _, _, project = exported_project
+    query = ExportService.tasks_query(project.id)
+
+    chunks = [chunk async for chunk in ExportService.stream(query, "csv")]
+
+    columns = [column.key for column in query.selected_columns]
+    assert chunks[0].decode() == ",".join(columns) + "\r\n"
+    # 헤더 뒤로 행마다 한 청크
+    assert len(chunks) == 3
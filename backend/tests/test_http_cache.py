@@ -0,0 +1,88 @@
+USERS = "{ users { edges { node { username } } } }"
+
+ME_AND_USERS = "{ me { username } users { edges { node { username } } } }"
+
+ME = "{ me { username fullName } }"
+
+PROJECTS = "{ projects { edges { node { name } } } }"
+
+
+async def _get(client, headers, query, **extra_headers):
+    return await client.get(
+        "/graphql", params={"query": query}, headers={**headers, **extra_headers}
+    )
+
+
+async def test_get_query_carries_cache_headers_and_revalidates(
+    db_session, client, create_user, auth_headers
+):
+    user = await create_user("alice")
+    headers = auth_headers(user)
+
+    response = await _get(client, headers, USERS)
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == "public, max-age=60"
+    assert response.headers["vary"] == "Authorization"
+    etag = response.headers["etag"]
+
+    response = await _get(client, headers, USERS, **{"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+    # 약한 비교, 여러 값 중 하나만 맞아도 304
+    response = await _get(
+        client, headers, USERS, **{"If-None-Match": f'"other", W/{etag}'}
+    )
+    assert response.status_code == 304
+
+
+async def test_etag_changes_with_the_result(
+    db_session, client, create_user, auth_headers
+):
+    user = await create_user("alice")
+    headers = auth_headers(user)
+    etag = (await _get(client, headers, ME)).headers["etag"]
+
+    user.full_name = "Alice Kim"
+    await db_session.commit()
+
+    response = await _get(client, headers, ME, **{"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["data"]["me"]["fullName"] == "Alice Kim"
+    assert response.headers["etag"] != etag
+
+
+async def test_private_hint_wins_and_unhinted_roots_are_not_cached(
+    db_session, client, create_user, auth_headers
+):
+    user = await create_user("alice")
+    headers = auth_headers(user)
+
+    response = await _get(client, headers, ME_AND_USERS)
+    assert response.headers["cache-control"] == "private, max-age=60"
+
+    response = await _get(client, headers, PROJECTS)
+    assert response.headers["cache-control"] == "private, no-cache"
+    assert "etag" in response.headers
+
+
+async def test_errors_and_post_requests_are_not_cached(
+    db_session, client, create_user, auth_headers
+):
+    user = await create_user("alice")
+    headers = auth_headers(user)
+
+    response = await _get(
+        client,
+        headers,
+        '{ events(rangeStart: "2024-03-02T00:00:00Z", '
+        'rangeEnd: "2024-03-01T00:00:00Z") { id } }',
+    )
+    assert response.json()["errors"]
+    assert response.headers["cache-control"] == "no-store"
+    assert "etag" not in response.headers
+
+    response = await client.post("/graphql", json={"query": USERS}, headers=headers)
+    assert response.status_code == 200
+    assert "etag" not in response.headers
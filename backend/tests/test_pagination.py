@@ -0,0 +1,63 @@
+from datetime import datetime, timedelta, timezone
+
+from app.models.project import Project
+
+PROJECTS_QUERY = """
+query Projects($first: Int!, $after: String) {
+  projects(first: $first, after: $after) {
+    edges { cursor node { id name } }
+    pageInfo { hasNextPage endCursor }
+  }
+}
+"""
+
+
+async def _collect_pages(graphql, user, first):
+    names, pages, after = [], 0, None
+    while True:
+        result = await graphql(user, PROJECTS_QUERY, {"first": first, "after": after})
+        connection = result["data"]["projects"]
+        names.extend(edge["node"]["name"] for edge in connection["edges"])
+        pages += 1
+        if not connection["pageInfo"]["hasNextPage"]:
+            return names, pages
+        after = connection["pageInfo"]["endCursor"]
+
+
+async def test_projects_keyset_pagination_walks_every_row_once(
+    db_session, graphql, create_user
+):
+    owner = await create_user("owner")
+    outsider = await create_user("outsider")
+
+    base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    # 같은 created_at이 섞여 있어도 id로 순서가 정해져야 한다
+    created = [base, base, base + timedelta(hours=1), base + timedelta(hours=2), base]
+    for index, created_at in enumerate(created):
+        db_session.add(
+            Project(name=f"p{index}", creator_id=owner.id, created_at=created_at)
+        )
+    db_session.add(Project(name="hidden", creator_id=outsider.id, created_at=base))
+    await db_session.commit()
+
+    names, pages = await _collect_pages(graphql, owner, first=2)
+
+    assert pages == 3
+    assert names == ["p3", "p2", "p4", "p1", "p0"]
+
+
+async def test_projects_pagination_rejects_invalid_cursor(graphql, create_user):
+    owner = await create_user("owner")
+
+    result = await graphql(owner, PROJECTS_QUERY, {"first": 2, "after": "not-a-cursor"})
+
+    assert result["data"] is None
+    assert "Invalid cursor" in result["errors"][0]["message"]
+
+
+async def test_projects_pagination_rejects_non_positive_page_size(graphql, create_user):
+    owner = await create_user("owner")
+
+    result = await graphql(owner, PROJECTS_QUERY, {"first": 0})
+
+    assert "`first` must be positive" in result["errors"][0]["message"]
@@ -0,0 +1,91 @@
+from sqlalchemy import insert
+
+from app.core.config import settings
+from app.core.permissions import permission_engine
+from app.models.permission import Permission, Role, RolePermission, UserRole
+
+
+async def _grant(db_session, user, resource="project", action="update"):
+    role = Role(name=f"{resource}-{action}-role")
+    permission = Permission(
+        name=f"{resource}:{action}", resource=resource, action=action
+    )
+    db_session.add_all([role, permission])
+    await db_session.flush()
+    db_session.add(RolePermission(role_id=role.id, permission_id=permission.id))
+    user_role = UserRole(user_id=user.id, role_id=role.id)
+    db_session.add(user_role)
+    await db_session.commit()
+    return role, user_role
+
+
+async def test_revoking_a_role_invalidates_cached_permissions(db_session, create_user):
+    user = await create_user("alice")
+    _, user_role = await _grant(db_session, user)
+
+    assert await permission_engine.has_permission(
+        db_session, user.id, "project", "update"
+    )
+
+    await db_session.delete(user_role)
+    await db_session.commit()
+
+    assert not await permission_engine.has_permission(
+        db_session, user.id, "project", "update"
+    )
+
+
+async def test_granting_a_permission_to_a_role_invalidates_cache(
+    db_session, create_user
+):
+    user = await create_user("alice")
+    role, _ = await _grant(db_session, user)
+    assert not await permission_engine.has_permission(
+        db_session, user.id, "project", "delete"
+    )
+
+    permission = Permission(name="project:delete", resource="project", action="delete")
+    db_session.add(permission)
+    await db_session.flush()
+    db_session.add(RolePermission(role_id=role.id, permission_id=permission.id))
+    await db_session.commit()
+
+    assert await permission_engine.has_permission(
+        db_session, user.id, "project", "delete"
+    )
+
+
+async def test_rolled_back_changes_do_not_invalidate(db_session, create_user):
+    user = await create_user("alice")
+    user_id = user.id
+    _, user_role = await _grant(db_session, user)
+    assert await permission_engine.has_permission(
+        db_session, user_id, "project", "update"
+    )
+    cached = permission_engine._cache.get(user_id)
+
+    await db_session.delete(user_role)
+    await db_session.flush()
+    await db_session.rollback()
+
+    assert permission_engine._cache.get(user_id) is cached
+
+
+async def test_catalog_reloads_after_ttl(db_session, create_user, monkeypatch):
+    user = await create_user("alice")
+    await _grant(db_session, user)
+    assert not await permission_engine.has_permission(
+        db_session, user.id, "task", "read"
+    )
+
+    # 다른 워커가 추가한 권한 (이 프로세스의 세션 이벤트를 거치지 않음)
+    await db_session.execute(
+        insert(Permission).values(name="task:read", resource="task", action="read")
+    )
+    await db_session.commit()
+    assert "task" not in {resource for resource, _ in permission_engine._catalog}
+
+    monkeypatch.setattr(settings, "PERMISSION_CATALOG_TTL", 0)
+    await permission_engine.has_permission(db_session, user.id, "task", "read")
+
+    assert ("task", "read") in permission_engine._catalog
@@ -0,0 +1,70 @@
+import json
+
+import pytest
+
+from app.api.graphql.persisted_queries import query_hash
+
+USERS = "{ users { edges { node { username } } } }"
+
+
+def _extensions(query):
+    return {"persistedQuery": {"version": 1, "sha256Hash": query_hash(query)}}
+
+
+async def _post(client, headers, extensions, query=None):
+    body = {"extensions": extensions}
+    if query is not None:
+        body["query"] = query
+    return await client.post("/graphql", json=body, headers=headers)
+
+
+async def _get(client, headers, extensions, query=None):
+    params = {"extensions": json.dumps(extensions)}
+    if query is not None:
+        params["query"] = query
+    return await client.get("/graphql", params=params, headers=headers)
+
+
+@pytest.mark.parametrize("send", [_post, _get])
+async def test_unknown_hash_is_registered_and_then_served(
+    db_session, client, create_user, auth_headers, send
+):
+    user = await create_user("alice")
+    headers = auth_headers(user)
+    extensions = _extensions(USERS)
+
+    response = await send(client, headers, extensions)
+    assert response.status_code == 200
+    assert response.json()["errors"][0]["extensions"]["code"] == (
+        "PERSISTED_QUERY_NOT_FOUND"
+    )
+
+    response = await send(client, headers, extensions, USERS)
+    assert "errors" not in response.json()
+
+    # 해시만 보내도 등록된 문서로 실행된다 (GET이어도 GraphiQL이 아니다)
+    response = await send(client, headers, extensions)
+    assert response.headers["content-type"] == "application/json"
+    assert response.json()["data"]["users"]["edges"] == [
+        {"node": {"username": "alice"}}
+    ]
+
+
+@pytest.mark.parametrize("send", [_post, _get])
+async def test_query_that_does_not_match_its_hash_is_rejected(
+    db_session, client, create_user, auth_headers, send
+):
+    user = await create_user("alice")
+    headers = auth_headers(user)
+    extensions = _extensions("{ me { username } }")
+
+    response = await send(client, headers, extensions, USERS)
+    assert response.json()["errors"][0]["extensions"]["code"] == (
+        "PERSISTED_QUERY_HASH_MISMATCH"
+    )
+
+    # 어긋난 본문은 그 해시로 등록되지 않는다
+    response = await send(client, headers, extensions)
+    assert response.json()["errors"][0]["extensions"]["code"] == (
+        "PERSISTED_QUERY_NOT_FOUND"
+    )
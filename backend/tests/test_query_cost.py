@@ -0,0 +1,88 @@
+from graphql import FragmentDefinitionNode, parse
+
+from app.api.graphql import extensions
+from app.api.graphql.extensions import CostBudget, calculate_cost
+from app.core.config import settings
+from app.main import schema
+
+PROJECTS = """
+query Projects($first: Int!) {
+  projects(first: $first) {
+    edges { node { id name creator { id } } }
+  }
+}
+"""
+
+
+def _cost(query: str, variables=None) -> int:
+    document = parse(query)
+    operation, *definitions = document.definitions
+    fragments = {
+        definition.name.value: definition
+        for definition in definitions
+        if isinstance(definition, FragmentDefinitionNode)
+    }
+    return calculate_cost(schema._schema, operation, fragments, variables)
+
+
+def test_connection_cost_scales_with_first():
+    # projects(1) + first × (edges(1) + node(1) + creator(1))
+    assert _cost(PROJECTS, {"first": 10}) == 1 + 10 * 3
+    assert _cost(PROJECTS, {"first": 50}) == 1 + 50 * 3
+    # 페이지 크기 상한을 넘는 값은 상한으로 계산
+    assert _cost(PROJECTS, {"first": 10_000}) == _cost(PROJECTS, {"first": 100})
+
+
+def test_field_weights_and_fragments_are_counted():
+    query = """
+    query {
+      dashboardStats { ...Stats }
+    }
+    fragment Stats on DashboardStats {
+      totalTasks
+      tasksByStatus { status count }
+    }
+    """
+    # dashboardStats(10) + 조각 안의 tasksByStatus 목록(1, 하위 필드는 스칼라)
+    assert _cost(query) == 10 + 1
+
+
+def test_budget_refills_over_time(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(extensions.time, "monotonic", lambda: now[0])
+    budget = CostBudget(capacity=10, window=10.0)
+
+    assert budget.consume("user:1", 6)["allowed"]
+    denied = budget.consume("user:1", 6)
+    assert not denied["allowed"]
+    assert denied["remaining"] == 4
+    assert denied["retry_after"] == 2.0
+    # 다른 사용자의 예산과는 별개
+    assert budget.consume("user:2", 6)["allowed"]
+
+    now[0] += 2.0
+    assert budget.consume("user:1", 6)["allowed"]
+
+
+async def test_query_over_maximum_cost_is_rejected(graphql, create_user, monkeypatch):
+    user = await create_user("alice")
+    monkeypatch.setattr(settings, "GRAPHQL_MAX_QUERY_COST", 30)
+
+    result = await graphql(user, PROJECTS, {"first": 20})
+
+    assert result["data"] is None
+    assert result["errors"][0]["extensions"]["code"] == "QUERY_TOO_EXPENSIVE"
+    assert result["extensions"]["cost"] == {"requested": 61, "maximum": 30}
+
+
+async def test_budget_is_reported_and_enforced(graphql, create_user, monkeypatch):
+    user = await create_user("alice")
+    monkeypatch.setattr(extensions, "cost_budget", CostBudget(capacity=50, window=60))
+
+    result = await graphql(user, PROJECTS, {"first": 10})
+    assert result["data"] == {"projects": {"edges": []}}
+    assert result["extensions"]["cost"]["budget"] == {"remaining": 19, "capacity": 50}
+
+    result = await graphql(user, PROJECTS, {"first": 10})
+    assert result["errors"][0]["extensions"]["code"] == "QUERY_BUDGET_EXCEEDED"
+    assert result["extensions"]["cost"]["budget"]["retryAfter"] > 0
@@ -0,0 +1,203 @@
+"""서비스 쿼리 실행 계획 회귀 검사
+
+테스트 DB에 데이터를 채운 뒤 UserService/ProjectService/TaskService 등의 조회
+메서드를 실행하며 실제로 나간 SELECT를 모두 수집하고, 각 문장을
+EXPLAIN QUERY PLAN 해서 테이블 전체 스캔이 하나라도 있으면 실패한다
+(인덱스 누락을 CI에서 잡는 용도).
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import Base
+from app.models.calendar import Calendar, Event
+from app.models.project import Project, ProjectAttachment, ProjectMember
+from app.models.task import (
+    Task,
+    TaskAssignment,
+    TaskAttachment,
+    TaskComment,
+    TaskStatus,
+)
+from app.models.user import User, UserActivityLog
+from app.services.attachment_service import AttachmentService
+from app.services.calendar_service import CalendarService
+from app.services.comment_service import CommentService
+from app.services.project_service import ProjectService
+from app.services.task_service import TaskService
+from app.services.user_service import UserService
+
+USERS = 50
+PROJECTS_PER_USER = 4
+TASKS_PER_PROJECT = 20
+
+
+async def seed(session: AsyncSession) -> None:
+    now = datetime.now(timezone.utc)
+    users = [
+        User(email=f"user{i}@example.com", username=f"user{i}", hashed_password="x")
+        for i in range(USERS)
+    ]
+    session.add_all(users)
+    await session.flush()
+
+    for i, owner in enumerate(users):
+        cal = Calendar(name=f"calendar{i}", owner_id=owner.id)
+        session.add(cal)
+        await session.flush()
+        session.add_all(
+            Event(
+                title=f"event{i}-{d}",
+                start_time=now + timedelta(days=d),
+                end_time=now + timedelta(days=d, hours=1),
+                calendar_id=cal.id,
+                created_by=owner.id,
+            )
+            for d in range(20)
+        )
+        session.add_all(
+            UserActivityLog(user_id=owner.id, action="login") for _ in range(20)
+        )
+
+        for p in range(PROJECTS_PER_USER):
+            project = Project(name=f"project{i}-{p}", creator_id=owner.id)
+            session.add(project)
+            await session.flush()
+            members = {owner.id, users[(i + 1) % USERS].id}
+            session.add_all(
+                ProjectMember(project_id=project.id, user_id=user_id)
+                for user_id in members
+            )
+            for t in range(TASKS_PER_PROJECT):
+                task = Task(
+                    title=f"task{i}-{p}-{t}",
+                    project_id=project.id,
+                    created_by=owner.id,
+                    status=list(TaskStatus)[t % len(TaskStatus)],
+                    due_date=now + timedelta(days=t),
+                )
+                session.add(task)
+                await session.flush()
+                session.add(
+                    TaskAssignment(
+                        task_id=task.id, user_id=owner.id, assigned_by=owner.id
+                    )
+                )
+                session.add(
+                    TaskAttachment(
+                        task_id=task.id,
+                        filename="a",
+                        file_path="a",
+                        uploaded_by=owner.id,
+                    )
+                )
+            session.add(
+                ProjectAttachment(
+                    project_id=project.id,
+                    filename="a",
+                    file_path="a",
+                    uploaded_by=owner.id,
+                )
+            )
+
+    await session.commit()
+
+
+async def exercise(session: AsyncSession) -> None:
+    """검사 대상 조회 경로 실행"""
+    now = datetime.now(timezone.utc)
+    user = await UserService.get_user_by_id(session, USERS // 2)
+    await UserService.get_user_by_email(session, user.email)
+    await UserService.get_user_by_username(session, user.username)
+
+    projects = await ProjectService.get_projects_by_user(session, user.id)
+    await ProjectService.get_project_by_id(session, projects[0].id)
+    await ProjectService.get_project_members(session, projects[0].id)
+
+    tasks = await TaskService.get_tasks_by_project(session, projects[0].id)
+    await TaskService.get_task_by_id(session, tasks[0].id)
+    await TaskService.get_tasks_by_user(session, user.id)
+    await TaskService.get_task_assignees(session, tasks[0].id)
+    await TaskService.get_task_tree(session, user.id, tasks[0].id, 10)
+    await TaskService.get_task_ancestors(session, user.id, tasks[1].id)
+    await session.execute(
+        CommentService.thread_query(TaskComment, tasks[0].id, user.id)
+        .order_by(TaskComment.created_at.desc(), TaskComment.id.desc())
+        .limit(21)
+    )
+    await CommentService.get_replies(session, TaskComment, [1, 2, 3])
+
+    await CalendarService.get_events(session, 1, now, now + timedelta(days=7))
+
+    await AttachmentService.get_attachment_file(session, user.id, "projects", 1)
+    await AttachmentService.get_attachment_file(session, user.id, "tasks", 1)
+
+    # 아직 서비스 메서드가 없는 작업/활동 로그 접근 경로
+    await session.execute(
+        select(Task).where(
+            Task.project_id == projects[0].id,
+            Task.status == TaskStatus.TODO,
+            Task.due_date < now + timedelta(days=7),
+        )
+    )
+    await session.execute(
+        select(UserActivityLog)
+        .where(UserActivityLog.user_id == user.id)
+        .order_by(UserActivityLog.created_at.desc())
+        .limit(20)
+    )
+
+
+def seq_scans_sqlite(rows: list) -> list:
+    # "SCAN tasks" = 전체 테이블 스캔, "SEARCH tasks USING INDEX ..." = 인덱스 탐색
+    # (CTE/서브쿼리 결과를 훑는 "SCAN subtree" 같은 줄은 테이블 스캔이 아니다)
+    found = []
+    for row in rows:
+        detail = row[-1]
+        if (
+            detail.startswith("SCAN ")
+            and "USING" not in detail
+            and "CONSTANT ROW" not in detail
+        ):
+            name = detail.split()[1]
+            if name in Base.metadata.tables:
+                found.append(name)
+    return found
+
+
+@pytest.mark.slow
+async def test_service_queries_use_indexes(db_session):
+    await seed(db_session)
+    engine = db_session.bind
+    async with engine.begin() as conn:
+        await conn.exec_driver_sql("ANALYZE")
+
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith(("SELECT", "WITH")):
+            statements.append((statement, parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", capture)
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            await exercise(session)
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", capture)
+
+    failures = []
+    async with engine.connect() as conn:
+        for statement, parameters in statements:
+            result = await conn.exec_driver_sql(
+                f"EXPLAIN QUERY PLAN {statement}", parameters
+            )
+            scans = seq_scans_sqlite(result.all())
+            if scans:
+                summary = " ".join(statement.split())[:100]
+                failures.append(f"seq scan on {', '.join(scans)}: {summary}")
+
+    assert len(statements) >= 20
+    assert not failures, "\n".join(failures)
@@ -0,0 +1,434 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.core.config import settings
+from app.models.calendar import Calendar, Event
+from app.services import recurrence
+from app.services.calendar_service import CalendarService
+from app.services.recurrence import (
+    cache_epoch,
+    cache_window,
+    expand,
+    get_cached_window,
+    invalidate_calendar,
+    is_occurrence,
+    occurrence_cache,
+    series_end,
+)
+
+UTC = timezone.utc
+
+CREATE_EVENT = """
+mutation CreateEvent($input: EventInput!) {
+  createEvent(eventInput: $input) { id timezone }
+}
+"""
+
+EVENTS = """
+query Events($rangeStart: DateTime!, $rangeEnd: DateTime!) {
+  events(rangeStart: $rangeStart, rangeEnd: $rangeEnd) {
+    title startTime recurrenceId
+  }
+}
+"""
+
+CANCEL_OCCURRENCE = """
+mutation Cancel($eventId: Int!, $recurrenceId: DateTime!) {
+  cancelEventOccurrence(eventId: $eventId, recurrenceId: $recurrenceId)
+}
+"""
+
+
+def _series(rule, start, tzid="UTC", duration=timedelta(hours=1)):
+    return Event(
+        id=1,
+        calendar_id=1,
+        title="Standup",
+        start_time=start,
+        end_time=start + duration,
+        is_all_day=False,
+        rrule=rule,
+        timezone=tzid,
+    )
+
+
+def _starts(series, range_start, range_end):
+    return [
+        occurrence.start_time
+        for occurrence in expand(series, [], range_start, range_end)
+    ]
+
+
+def test_byday_follows_the_event_time_zone():
+    # 2024-03-04(월) 08:00 KST == 2024-03-03(일) 23:00 UTC
+    series = _series(
+        "FREQ=WEEKLY;BYDAY=MO,WE;COUNT=4",
+        datetime(2024, 3, 3, 23, tzinfo=UTC),
+        tzid="Asia/Seoul",
+    )
+
+    starts = _starts(
+        series, datetime(2024, 3, 1, tzinfo=UTC), datetime(2024, 4, 1, tzinfo=UTC)
+    )
+
+    # KST 기준 월/수 08:00 (UTC로는 일/화 23:00)
+    assert starts == [
+        datetime(2024, 3, 3, 23, tzinfo=UTC),
+        datetime(2024, 3, 5, 23, tzinfo=UTC),
+        datetime(2024, 3, 10, 23, tzinfo=UTC),
+        datetime(2024, 3, 12, 23, tzinfo=UTC),
+    ]
+    assert series_end(
+        series.rrule, series.start_time, series.end_time, series.timezone
+    ) == datetime(2024, 3, 13, 0, tzinfo=UTC)
+
+
+def test_wall_clock_time_is_kept_across_daylight_saving_time():
+    # 금요일 09:00 (뉴욕), 2024-03-10에 EST(-5) -> EDT(-4)
+    series = _series(
+        "FREQ=WEEKLY;BYDAY=FR",
+        datetime(2024, 3, 8, 14, tzinfo=UTC),
+        tzid="America/New_York",
+    )
+
+    starts = _starts(
+        series, datetime(2024, 3, 1, tzinfo=UTC), datetime(2024, 3, 23, tzinfo=UTC)
+    )
+
+    assert starts == [
+        datetime(2024, 3, 8, 14, tzinfo=UTC),
+        datetime(2024, 3, 15, 13, tzinfo=UTC),
+        datetime(2024, 3, 22, 13, tzinfo=UTC),
+    ]
+    assert is_occurrence(series, datetime(2024, 3, 15, 13, tzinfo=UTC))
+    assert not is_occurrence(series, datetime(2024, 3, 15, 14, tzinfo=UTC))
+
+
+def test_series_end_reads_count_and_until_from_the_rule():
+    start = datetime(2024, 3, 8, 14, tzinfo=UTC)
+    end = start + timedelta(minutes=30)
+    tzid = "America/New_York"
+
+    assert series_end("FREQ=DAILY", start, end, tzid) is None
+    assert series_end("FREQ=DAILY;UNTIL=20240311T000000Z", start, end, tzid) == (
+        datetime(2024, 3, 10, 13, 30, tzinfo=UTC)
+    )
+    assert series_end("COUNT=2;FREQ=DAILY", start, end, tzid) == (
+        datetime(2024, 3, 9, 14, 30, tzinfo=UTC)
+    )
+
+
+def test_unknown_time_zone_is_rejected():
+    with pytest.raises(ValueError, match="Unknown time zone"):
+        series_end(
+            "FREQ=DAILY;COUNT=2",
+            datetime(2024, 3, 8, tzinfo=UTC),
+            datetime(2024, 3, 8, 1, tzinfo=UTC),
+            "Mars/Olympus_Mons",
+        )
+
+
+async def test_events_query_expands_series_in_its_time_zone(
+    db_session, graphql, create_user
+):
+    user = await create_user("alice")
+    calendar = Calendar(name="Work", owner_id=user.id, max_event_seconds=3600)
+    db_session.add(calendar)
+    await db_session.commit()
+
+    result = await graphql(
+        user,
+        CREATE_EVENT,
+        {
+            "input": {
+                "title": "Standup",
+                "calendarId": calendar.id,
+                "startTime": "2024-03-03T23:00:00Z",
+                "endTime": "2024-03-03T23:30:00Z",
+                "rrule": "FREQ=WEEKLY;BYDAY=MO,WE;COUNT=2",
+                "timezone": "Asia/Seoul",
+            }
+        },
+    )
+    assert result["data"]["createEvent"]["timezone"] == "Asia/Seoul"
+
+    result = await graphql(
+        user,
+        EVENTS,
+        {"rangeStart": "2024-03-01T00:00:00Z", "rangeEnd": "2024-03-31T00:00:00Z"},
+    )
+
+    starts = [
+        datetime.fromisoformat(event["startTime"]) for event in result["data"]["events"]
+    ]
+    assert [start.astimezone(UTC) for start in starts] == [
+        datetime(2024, 3, 3, 23, tzinfo=UTC),
+        datetime(2024, 3, 5, 23, tzinfo=UTC),
+    ]
+
+
+async def test_create_event_with_unknown_time_zone_is_rejected(
+    db_session, graphql, create_user
+):
+    user = await create_user("alice")
+    calendar = Calendar(name="Work", owner_id=user.id)
+    db_session.add(calendar)
+    await db_session.commit()
+
+    result = await graphql(
+        user,
+        CREATE_EVENT,
+        {
+            "input": {
+                "title": "Standup",
+                "calendarId": calendar.id,
+                "startTime": "2024-03-04T08:00:00Z",
+                "endTime": "2024-03-04T08:30:00Z",
+                "timezone": "Mars/Olympus_Mons",
+            }
+        },
+    )
+
+    assert result["data"] is None
+    assert "Unknown time zone" in result["errors"][0]["message"]
+
+
+async def _calendar(db_session, user):
+    calendar = Calendar(name="Work", owner_id=user.id)
+    db_session.add(calendar)
+    await db_session.commit()
+    return calendar
+
+
+async def _create_event(graphql, user, calendar, title, start, end, **fields):
+    result = await graphql(
+        user,
+        CREATE_EVENT,
+        {
+            "input": {
+                "title": title,
+                "calendarId": calendar.id,
+                "startTime": start,
+                "endTime": end,
+                **fields,
+            }
+        },
+    )
+    return int(result["data"]["createEvent"]["id"])
+
+
+async def _events(graphql, user, range_start, range_end):
+    result = await graphql(
+        user, EVENTS, {"rangeStart": range_start, "rangeEnd": range_end}
+    )
+    return [
+        (event["title"], datetime.fromisoformat(event["startTime"]).astimezone(UTC))
+        for event in result["data"]["events"]
+    ]
+
+
+async def test_times_with_an_offset_are_stored_as_utc(db_session, graphql, create_user):
+    user = await create_user("alice")
+    calendar = await _calendar(db_session, user)
+    await _create_event(
+        graphql,
+        user,
+        calendar,
+        "Standup",
+        "2026-01-05T09:00:00+09:00",
+        "2026-01-05T10:00:00+09:00",
+    )
+
+    # 범위 경계도 오프셋을 반영해 비교한다
+    assert await _events(
+        graphql, user, "2026-01-05T08:00:00+09:00", "2026-01-05T09:30:00+09:00"
+    ) == [("Standup", datetime(2026, 1, 5, 0, tzinfo=UTC))]
+    assert (
+        await _events(
+            graphql, user, "2026-01-05T11:00:00+09:00", "2026-01-06T00:00:00+09:00"
+        )
+        == []
+    )
+
+
+async def test_cancelling_an_occurrence_given_with_an_offset(
+    db_session, graphql, create_user
+):
+    user = await create_user("alice")
+    calendar = await _calendar(db_session, user)
+    event_id = await _create_event(
+        graphql,
+        user,
+        calendar,
+        "Standup",
+        "2026-01-05T09:00:00+09:00",
+        "2026-01-05T09:30:00+09:00",
+        rrule="FREQ=DAILY;COUNT=3",
+        timezone="Asia/Seoul",
+    )
+
+    result = await graphql(
+        user,
+        CANCEL_OCCURRENCE,
+        {"eventId": event_id, "recurrenceId": "2026-01-06T09:00:00+09:00"},
+    )
+    assert result["data"]["cancelEventOccurrence"] is True
+
+    starts = await _events(
+        graphql, user, "2026-01-01T00:00:00Z", "2026-01-31T00:00:00Z"
+    )
+    assert starts == [
+        ("Standup", datetime(2026, 1, 5, 0, tzinfo=UTC)),
+        ("Standup", datetime(2026, 1, 7, 0, tzinfo=UTC)),
+    ]
+
+
+async def test_events_query_returns_events_overlapping_the_range(
+    db_session, graphql, create_user
+):
+    user = await create_user("alice")
+    other = await create_user("bob")
+    calendar = await _calendar(db_session, user)
+    other_calendar = await _calendar(db_session, other)
+    for title, start, end in [
+        ("ends at range start", "2024-03-04T07:00:00Z", "2024-03-04T08:00:00Z"),
+        ("inside", "2024-03-04T09:00:00Z", "2024-03-04T10:00:00Z"),
+        ("spans range end", "2024-03-04T11:00:00Z", "2024-03-04T13:00:00Z"),
+        ("starts at range end", "2024-03-04T12:00:00Z", "2024-03-04T12:30:00Z"),
+        ("before", "2024-03-04T05:00:00Z", "2024-03-04T06:00:00Z"),
+    ]:
+        await _create_event(graphql, user, calendar, title, start, end)
+    await _create_event(
+        graphql,
+        other,
+        other_calendar,
+        "someone else's",
+        "2024-03-04T09:00:00Z",
+        "2024-03-04T10:00:00Z",
+    )
+
+    # [rangeStart, rangeEnd) 와 겹치는 일정 (끝 시각 포함), 시작 시각 순
+    events = await _events(
+        graphql, user, "2024-03-04T08:00:00Z", "2024-03-04T12:00:00Z"
+    )
+    assert [title for title, _ in events] == [
+        "ends at range start",
+        "inside",
+        "spans range end",
+    ]
+
+
+async def test_events_range_must_not_be_reversed(db_session, graphql, create_user):
+    user = await create_user("alice")
+
+    result = await graphql(
+        user,
+        EVENTS,
+        {"rangeStart": "2024-03-02T00:00:00Z", "rangeEnd": "2024-03-01T00:00:00Z"},
+    )
+
+    assert result["data"] is None
+    assert result["errors"]
+
+
+class FakeRedis:
+    def __init__(self):
+        self.values = {}
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def incr(self, key):
+        self.values[key] = int(self.values.get(key, 0)) + 1
+        return self.values[key]
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    redis = FakeRedis()
+    monkeypatch.setattr(recurrence, "get_redis", lambda: redis)
+    monkeypatch.setattr(settings, "OCCURRENCE_CACHE_VERSION_CHECK_INTERVAL", 0)
+    monkeypatch.setattr(recurrence, "_version", 0)
+    return redis
+
+
+async def _cached_series(db_session, create_user):
+    """회차가 캐시된 반복 일정"""
+    user = await create_user("alice")
+    calendar = await _calendar(db_session, user)
+    series = Event(
+        title="Standup",
+        calendar_id=calendar.id,
+        start_time=datetime(2024, 3, 4, 9, tzinfo=UTC),
+        end_time=datetime(2024, 3, 4, 9, 30, tzinfo=UTC),
+        rrule="FREQ=DAILY;COUNT=3",
+        created_by=user.id,
+    )
+    db_session.add(series)
+    await db_session.commit()
+    await asyncio.gather(*recurrence._pending_bumps)
+    await CalendarService.get_events(
+        db_session,
+        user.id,
+        datetime(2024, 3, 1, tzinfo=UTC),
+        datetime(2024, 3, 31, tzinfo=UTC),
+    )
+    assert occurrence_cache.get(calendar.id) is not None
+    return series, calendar.id
+
+
+async def test_occurrence_cache_is_invalidated_after_commit(
+    db_session, create_user, fake_redis
+):
+    series, calendar_id = await _cached_series(db_session, create_user)
+
+    series.title = "Daily"
+    await db_session.flush()
+    # 커밋 전에는 이전 회차를 유지한다 (롤백되면 그대로 유효)
+    assert occurrence_cache.get(calendar_id) is not None
+    await db_session.commit()
+    assert occurrence_cache.get(calendar_id) is None
+
+    # 다른 워커에는 버전 키로 알린다 (일정 생성 커밋이 1)
+    await asyncio.gather(*recurrence._pending_bumps)
+    assert fake_redis.values[recurrence.OCCURRENCE_CACHE_VERSION_KEY] == 2
+
+
+async def test_rolled_back_change_keeps_cached_occurrences(
+    db_session, create_user, fake_redis
+):
+    series, calendar_id = await _cached_series(db_session, create_user)
+
+    series.title = "Daily"
+    await db_session.flush()
+    await db_session.rollback()
+    await db_session.commit()
+
+    assert occurrence_cache.get(calendar_id) is not None
+    assert fake_redis.values[recurrence.OCCURRENCE_CACHE_VERSION_KEY] == 1
+
+
+async def test_version_bump_from_another_worker_clears_cached_occurrences(
+    db_session, create_user, fake_redis
+):
+    _, calendar_id = await _cached_series(db_session, create_user)
+    window = (datetime(2024, 3, 1, tzinfo=UTC), datetime(2024, 3, 31, tzinfo=UTC))
+    assert await get_cached_window(calendar_id, window) is not None
+
+    await fake_redis.incr(recurrence.OCCURRENCE_CACHE_VERSION_KEY)
+
+    assert await get_cached_window(calendar_id, window) is None
+
+
+def test_window_read_before_an_invalidation_is_not_cached():
+    window = (datetime(2024, 3, 1, tzinfo=UTC), datetime(2024, 3, 31, tzinfo=UTC))
+
+    epoch = cache_epoch()
+    invalidate_calendar(1)
+    cache_window(1, window, [], epoch)
+    assert occurrence_cache.get(1) is None
+
+    cache_window(1, window, [], cache_epoch())
+    assert occurrence_cache.get(1) is not None
@@ -0,0 +1,138 @@
+from sqlalchemy import update
+
+from app.api.graphql.response_cache import ResponseCache
+from app.models.project import Project
+
+PROJECTS = "{ projects { edges { node { id name } } } }"
+
+DASHBOARD = "{ dashboardStats { totalProjects } }"
+
+USERS = "{ users { edges { node { username } } } }"
+
+CREATE_PROJECT = """
+mutation CreateProject($input: ProjectInput!) {
+  createProject(projectInput: $input) { id }
+}
+"""
+
+UPDATE_PROJECT = """
+mutation UpdateProject($projectId: Int!, $input: ProjectInput!) {
+  updateProject(projectId: $projectId, projectInput: $input) { id }
+}
+"""
+
+REGISTER = """
+mutation Register($input: UserInput!) {
+  register(userInput: $input) { user { id } }
+}
+"""
+
+
+def _names(result):
+    return [edge["node"]["name"] for edge in result["data"]["projects"]["edges"]]
+
+
+async def _rename_behind_the_cache(db_session, project_id, name):
+    """뮤테이션을 거치지 않은 변경 (캐시가 무효화되지 않는다)"""
+    await db_session.execute(
+        update(Project).where(Project.id == project_id).values(name=name)
+    )
+    await db_session.commit()
+
+
+async def test_projects_are_served_from_cache_until_a_mutation_invalidates(
+    db_session, graphql, create_user, create_project
+):
+    user = await create_user("alice")
+    project = await create_project(user, name="Apollo")
+
+    assert _names(await graphql(user, PROJECTS)) == ["Apollo"]
+    await _rename_behind_the_cache(db_session, project.id, "Stale")
+    assert _names(await graphql(user, PROJECTS)) == ["Apollo"]
+
+    await graphql(
+        user, UPDATE_PROJECT, {"projectId": project.id, "input": {"name": "Gemini"}}
+    )
+
+    assert _names(await graphql(user, PROJECTS)) == ["Gemini"]
+
+
+async def test_project_change_invalidates_every_member_page(
+    db_session, graphql, create_user, create_project
+):
+    owner = await create_user("owner")
+    member = await create_user("member")
+    project = await create_project(owner, name="Apollo", members=[member])
+
+    assert _names(await graphql(member, PROJECTS)) == ["Apollo"]
+    await graphql(
+        owner, UPDATE_PROJECT, {"projectId": project.id, "input": {"name": "Gemini"}}
+    )
+
+    assert _names(await graphql(member, PROJECTS)) == ["Gemini"]
+
+
+async def test_user_scoped_results_are_not_shared_between_users(
+    db_session, graphql, create_user, create_project
+):
+    alice = await create_user("alice")
+    bob = await create_user("bob")
+    await create_project(alice, name="Apollo")
+
+    assert _names(await graphql(alice, PROJECTS)) == ["Apollo"]
+    assert _names(await graphql(bob, PROJECTS)) == []
+
+
+async def test_dashboard_stats_refresh_after_creating_a_project(
+    db_session, graphql, create_user
+):
+    user = await create_user("alice")
+    assert (await graphql(user, DASHBOARD))["data"]["dashboardStats"] == {
+        "totalProjects": 0
+    }
+
+    await graphql(user, CREATE_PROJECT, {"input": {"name": "Apollo"}})
+
+    assert (await graphql(user, DASHBOARD))["data"]["dashboardStats"] == {
+        "totalProjects": 1
+    }
+
+
+async def test_shared_user_list_refreshes_after_registration(
+    db_session, graphql, create_user
+):
+    alice = await create_user("alice")
+    bob = await create_user("bob")
+
+    result = await graphql(alice, USERS)
+    assert len(result["data"]["users"]["edges"]) == 2
+
+    await graphql(
+        bob,
+        REGISTER,
+        {
+            "input": {
+                "email": "carol@example.com",
+                "username": "carol",
+                "password": "secret-password",
+            }
+        },
+    )
+
+    # 다른 사용자의 요청도 같은 공유 항목을 읽고, 가입으로 무효화된다
+    result = await graphql(bob, USERS)
+    assert len(result["data"]["users"]["edges"]) == 3
+
+
+async def test_entry_is_not_stored_when_invalidated_during_execution():
+    cache = ResponseCache(backend="memory", maxsize=10, ttl=60)
+
+    epoch = await cache.epoch()
+    await cache.invalidate(["project:1"])
+    await cache.set("key", {"projects": []}, {"project:1"}, epoch)
+    assert await cache.get("key") is None
+
+    await cache.set("key", {"projects": []}, {"project:1"}, await cache.epoch())
+    assert await cache.get("key") == {"projects": []}
+    await cache.invalidate(["project:1"])
+    assert await cache.get("key") is None
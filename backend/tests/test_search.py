@@ -0,0 +1,141 @@
+from types import SimpleNamespace
+
+from app.models.project import Project
+from app.models.task import Task
+from app.services.search_service import SearchService
+
+SEARCH = """
+query Search($query: String!, $first: Int!, $after: String) {
+  search(query: $query, first: $first, after: $after) {
+    edges { node { type id title } }
+    pageInfo { hasNextPage endCursor }
+  }
+}
+"""
+
+
+async def _search(graphql, user, query, first=20, after=None):
+    result = await graphql(
+        user, SEARCH, {"query": query, "first": first, "after": after}
+    )
+    return result["data"]["search"]
+
+
+def _titles(connection):
+    return [edge["node"]["title"] for edge in connection["edges"]]
+
+
+async def test_title_matches_rank_above_description_matches(
+    db_session, graphql, create_user, create_project
+):
+    user = await create_user("alice")
+    project = await create_project(user, name="Website")
+    db_session.add_all(
+        [
+            Task(
+                title="Update footer",
+                description="mention the roadmap",
+                project_id=project.id,
+                created_by=user.id,
+            ),
+            Task(title="Roadmap review", project_id=project.id, created_by=user.id),
+            Task(title="Unrelated", project_id=project.id, created_by=user.id),
+        ]
+    )
+    await db_session.commit()
+
+    connection = await _search(graphql, user, "roadmap")
+
+    assert _titles(connection) == ["Roadmap review", "Update footer"]
+
+
+async def test_search_only_returns_accessible_projects(
+    db_session, graphql, create_user, create_project
+):
+    member = await create_user("member")
+    outsider = await create_user("outsider")
+    shared = await create_project(outsider, name="Apollo shared", members=[member])
+    await create_project(outsider, name="Apollo private")
+    db_session.add(
+        Task(title="Apollo launch", project_id=shared.id, created_by=outsider.id)
+    )
+    await db_session.commit()
+
+    connection = await _search(graphql, member, "apollo")
+
+    assert sorted(_titles(connection)) == ["Apollo launch", "Apollo shared"]
+
+
+async def test_search_cursor_pages_through_all_results(
+    db_session, graphql, create_user, create_project
+):
+    user = await create_user("alice")
+    project = await create_project(user, name="Other")
+    db_session.add_all(
+        Task(title=f"Release note {index}", project_id=project.id, created_by=user.id)
+        for index in range(5)
+    )
+    await db_session.commit()
+
+    titles, after = [], None
+    for expected_next in (True, True, False):
+        connection = await _search(graphql, user, "release", first=2, after=after)
+        titles.extend(_titles(connection))
+        assert connection["pageInfo"]["hasNextPage"] is expected_next
+        after = connection["pageInfo"]["endCursor"]
+
+    assert sorted(titles) == [f"Release note {index}" for index in range(5)]
+
+
+async def test_ilike_fallback_for_databases_without_full_text_search(
+    db_session, create_user, create_project, monkeypatch
+):
+    user = await create_user("alice")
+    outsider = await create_user("outsider")
+    project = await create_project(user, name="Mobile app")
+    await create_project(outsider, name="Mobile secret")
+    db_session.add_all(
+        [
+            Task(
+                title="Mobile login",
+                description="100% done",
+                project_id=project.id,
+                created_by=user.id,
+            ),
+            Task(title="Desktop login", project_id=project.id, created_by=user.id),
+        ]
+    )
+    await db_session.commit()
+
+    monkeypatch.setattr(
+        db_session,
+        "get_bind",
+        lambda *args, **kwargs: SimpleNamespace(dialect=SimpleNamespace(name="mssql")),
+    )
+
+    rows = await SearchService.search(db_session, user.id, "mobile LOGIN")
+    assert [(row.kind, row.title) for row in rows] == [("task", "Mobile login")]
+
+    rows = await SearchService.search(db_session, user.id, "mobile")
+    # 제목(A) 일치가 설명(B) 일치보다, 같은 가중치면 (kind, id) 역순
+    assert [(row.kind, row.title, row.rank) for row in rows] == [
+        ("task", "Mobile login", 10.0),
+        ("project", "Mobile app", 10.0),
+    ]
+
+    # LIKE 와일드카드는 글자 그대로 찾는다
+    rows = await SearchService.search(db_session, user.id, "100")
+    assert [row.title for row in rows] == ["Mobile login"]
+    assert await SearchService.search(db_session, user.id, "%") == []
+
+
+async def test_projects_are_indexed_by_name(db_session, create_user):
+    user = await create_user("alice")
+    db_session.add(Project(name="Quarterly planning", creator_id=user.id))
+    await db_session.commit()
+
+    rows = await SearchService.search(db_session, user.id, "quarterly")
+
+    assert [(row.kind, row.title) for row in rows] == [
+        ("project", "Quarterly planning")
+    ]
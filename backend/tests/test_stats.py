@@ -0,0 +1,160 @@
+import warnings
+
+from sqlalchemy import func, select
+from sqlalchemy.exc import SAWarning
+
+from app.models.stats import StatsCounter
+from app.models.task import Task, TaskAssignment
+from app.services.project_count_reconciler import ProjectCountReconciler
+from app.services.stats_service import StatsService
+
+REGISTER = """
+mutation Register($input: UserInput!) {
+  register(userInput: $input) { user { id } accessToken }
+}
+"""
+
+DASHBOARD = "{ dashboardStats { totalProjects totalTasks } }"
+
+
+async def _counters(db_session, user_id):
+    result = await db_session.execute(
+        select(StatsCounter.metric, StatsCounter.value).where(
+            StatsCounter.scope == "user", StatsCounter.scope_id == user_id
+        )
+    )
+    return dict(result.all())
+
+
+async def _assign_task(db_session, project, creator, assignee):
+    """뮤테이션을 거치지 않은 작업/배정 (카운터는 갱신되지 않는다)"""
+    task = Task(title="task", project_id=project.id, created_by=creator.id)
+    db_session.add(task)
+    await db_session.flush()
+    db_session.add(
+        TaskAssignment(task_id=task.id, user_id=assignee.id, assigned_by=creator.id)
+    )
+    await db_session.commit()
+    return task
+
+
+async def test_register_initializes_user_counters(
+    db_session, client, create_user, auth_headers
+):
+    # 라우터 인증(REQUIRE_AUTH)을 통과하기 위한 기존 사용자
+    admin = await create_user("admin")
+    response = await client.post(
+        "/graphql",
+        json={
+            "query": REGISTER,
+            "variables": {
+                "input": {
+                    "email": "new@example.com",
+                    "username": "new",
+                    "password": "secret-password",
+                }
+            },
+        },
+        headers=auth_headers(admin),
+    )
+    user_id = int(response.json()["data"]["register"]["user"]["id"])
+
+    assert await _counters(db_session, user_id) == {
+        "projects_total": 0,
+        "tasks_total": 0,
+    }
+
+
+async def test_dashboard_without_counters_is_computed_without_writing(
+    db_session, graphql, create_user, create_project
+):
+    user = await create_user("legacy")
+    await create_project(user, members=[user])
+
+    result = await graphql(user, DASHBOARD)
+
+    assert result["data"]["dashboardStats"] == {"totalProjects": 1, "totalTasks": 0}
+    count = await db_session.scalar(select(func.count(StatsCounter.id)))
+    assert count == 0
+
+
+async def test_update_or_insert_fallback_adds_and_replaces(db_session, create_user):
+    user = await create_user("alice")
+
+    await StatsService._update_or_insert(
+        db_session, [("user", user.id, "tasks_total", 2)]
+    )
+    await StatsService._update_or_insert(
+        db_session,
+        [("user", user.id, "tasks_total", 3), ("user", user.id, "tasks_done", 1)],
+    )
+    assert await _counters(db_session, user.id) == {"tasks_total": 5, "tasks_done": 1}
+
+    await StatsService._update_or_insert(
+        db_session, [("user", user.id, "tasks_total", 4)], replace=True
+    )
+    assert (await _counters(db_session, user.id))["tasks_total"] == 4
+
+
+async def test_compute_user_stats_joins_without_a_cartesian_product(
+    db_session, create_user, create_project
+):
+    user = await create_user("alice")
+    project = await create_project(user, members=[user])
+    await _assign_task(db_session, project, user, user)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", SAWarning)
+        stats = await StatsService.compute_user_stats(db_session, user.id)
+
+    assert (stats["projects_total"], stats["tasks_total"]) == (1, 1)
+
+
+async def test_reconciler_rebuilds_drifted_user_counters(
+    db_session, create_user, create_project
+):
+    owner = await create_user("owner")
+    members = [await create_user(f"member{index}") for index in range(3)]
+    project = await create_project(owner, members=members)
+    await _assign_task(db_session, project, owner, members[0])
+    reconciler = ProjectCountReconciler(interval=60, batch_size=2)
+
+    # 카운터가 없는 사용자도 초기화된다 (batch_size보다 사용자가 많다)
+    # 프로젝트 1행 + 사용자 4명
+    assert await reconciler.reconcile() == 5
+    assert await _counters(db_session, members[0].id) == {
+        "projects_total": 1,
+        "projects_planning": 1,
+        "tasks_total": 1,
+        "tasks_todo": 1,
+    }
+    assert await _counters(db_session, owner.id) == {
+        "projects_total": 0,
+        "tasks_total": 0,
+    }
+    assert await reconciler.reconcile() == 0
+
+    await _assign_task(db_session, project, owner, members[1])
+    assert await reconciler.reconcile() == 2
+    assert (await _counters(db_session, members[1].id))["tasks_todo"] == 1
+
+
+async def test_project_deleted_decrements_assignee_task_counters(
+    db_session, create_user, create_project
+):
+    owner = await create_user("owner")
+    member = await create_user("member")
+    project = await create_project(owner, members=[owner, member])
+    await _assign_task(db_session, project, owner, member)
+    await ProjectCountReconciler(interval=60, batch_size=10).reconcile()
+
+    affected = await StatsService.project_deleted(db_session, project)
+    await db_session.commit()
+
+    assert affected == sorted([owner.id, member.id])
+    assert await _counters(db_session, member.id) == {
+        "projects_total": 0,
+        "projects_planning": 0,
+        "tasks_total": 0,
+        "tasks_todo": 0,
+    }
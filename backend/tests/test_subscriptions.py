@@ -0,0 +1,89 @@
+import asyncio
+import contextlib
+
+from sqlalchemy import delete
+
+from app.core.change_hub import change_hub, project_channel, publish_project_change
+from app.core.config import settings
+from app.main import schema
+from app.models.project import ProjectMember
+
+PROJECT_CHANGED = "subscription { projectChanged { op projectId } }"
+
+
+async def _subscribe(user):
+    stream = await schema.subscribe(
+        PROJECT_CHANGED, context_value={"current_user": user}
+    )
+    # 첫 이벤트를 기다리는 동안 구독(채널 등록)이 끝나도록 미리 돌려 둔다
+    next_event = asyncio.ensure_future(anext(stream))
+    await asyncio.sleep(0.05)
+    return stream, next_event
+
+
+async def _next_change(next_event):
+    result = await asyncio.wait_for(next_event, 1.0)
+    assert result.errors is None
+    return result.data["projectChanged"]
+
+
+async def _close(stream, next_event):
+    next_event.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await next_event
+    await stream.aclose()
+
+
+async def test_project_changed_follows_membership_changes(
+    db_session, create_user, create_project, monkeypatch
+):
+    monkeypatch.setattr(settings, "SUBSCRIPTION_ACCESS_RECHECK_SECONDS", 0.05)
+    owner = await create_user("owner")
+    member = await create_user("member")
+    project = await create_project(owner)
+    other = await create_project(owner, name="Other")
+
+    stream, next_event = await _subscribe(member)
+    try:
+        # 구독 후에 멤버로 추가된 프로젝트도 받는다
+        db_session.add(ProjectMember(project_id=project.id, user_id=member.id))
+        await db_session.commit()
+        await asyncio.sleep(0.1)
+        await publish_project_change("updated", other)
+        await publish_project_change("updated", project)
+        assert await _next_change(next_event) == {
+            "op": "UPDATED",
+            "projectId": project.id,
+        }
+
+        # 멤버에서 빠지면 채널에서도 빠지고 이벤트를 받지 않는다
+        await db_session.execute(
+            delete(ProjectMember).where(ProjectMember.user_id == member.id)
+        )
+        await db_session.commit()
+        next_event = asyncio.ensure_future(anext(stream))
+        await asyncio.sleep(0.1)
+        assert project_channel(project.id) not in change_hub._channels
+        await publish_project_change("updated", project)
+        await asyncio.sleep(0.1)
+        assert not next_event.done()
+    finally:
+        await _close(stream, next_event)
+
+
+async def test_project_changed_receives_newly_created_projects(
+    db_session, create_user, create_project
+):
+    owner = await create_user("owner")
+
+    stream, next_event = await _subscribe(owner)
+    try:
+        project = await create_project(owner)
+        await publish_project_change("created", project, user_id=owner.id)
+        assert await _next_change(next_event) == {
+            "op": "CREATED",
+            "projectId": project.id,
+        }
+        assert project_channel(project.id) in change_hub._channels
+    finally:
+        await _close(stream, next_event)
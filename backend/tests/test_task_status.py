@@ -0,0 +1,88 @@
+from sqlalchemy import select
+
+from app.models.project import Project
+from app.models.task import Task, TaskStatus
+
+CREATE_TASK = """
+mutation CreateTask($input: TaskInput!) {
+  createTask(taskInput: $input) { id status }
+}
+"""
+
+UPDATE_STATUS = """
+mutation UpdateStatus($taskId: Int!, $status: TaskStatusEnum!) {
+  updateTaskStatus(taskId: $taskId, status: $status) { id status }
+}
+"""
+
+
+async def _reload_project(db_session, project_id: int) -> Project:
+    result = await db_session.execute(
+        select(Project)
+        .where(Project.id == project_id)
+        .execution_options(populate_existing=True)
+    )
+    return result.scalar_one()
+
+
+async def _create_tasks(graphql, user, project, count):
+    ids = []
+    for index in range(count):
+        result = await graphql(
+            user,
+            CREATE_TASK,
+            {"input": {"title": f"task {index}", "projectId": project.id}},
+        )
+        ids.append(int(result["data"]["createTask"]["id"]))
+    return ids
+
+
+async def test_status_change_rolls_up_project_counts_and_progress(
+    db_session, graphql, create_user, create_project
+):
+    owner = await create_user("owner")
+    member = await create_user("member")
+    project = await create_project(owner, members=[member])
+    task_ids = await _create_tasks(graphql, owner, project, 4)
+
+    for task_id, status in zip(task_ids, ["DONE", "DONE", "IN_PROGRESS"]):
+        result = await graphql(
+            member, UPDATE_STATUS, {"taskId": task_id, "status": status}
+        )
+        assert "errors" not in result
+
+    project = await _reload_project(db_session, project.id)
+    assert project.tasks_total == 4
+    assert project.tasks_done == 2
+    assert project.tasks_in_progress == 1
+    assert project.tasks_todo == 1
+    assert project.progress == 50
+
+    # 완료를 되돌리면 진행률도 내려간다
+    await graphql(owner, UPDATE_STATUS, {"taskId": task_ids[0], "status": "TODO"})
+    project = await _reload_project(db_session, project.id)
+    assert project.tasks_done == 1
+    assert project.tasks_todo == 2
+    assert project.progress == 25
+
+
+async def test_outsider_cannot_change_task_status(
+    db_session, graphql, create_user, create_project
+):
+    owner = await create_user("owner")
+    outsider = await create_user("outsider")
+    project = await create_project(owner)
+    (task_id,) = await _create_tasks(graphql, owner, project, 1)
+
+    result = await graphql(
+        outsider, UPDATE_STATUS, {"taskId": task_id, "status": "DONE"}
+    )
+
+    assert result["data"] is None
+    assert "Task not found" in result["errors"][0]["message"]
+
+    task = await db_session.get(Task, task_id, populate_existing=True)
+    assert task.status == TaskStatus.TODO
+    project = await _reload_project(db_session, project.id)
+    assert project.tasks_done == 0
+    assert project.progress == 0
@@ -0,0 +1,111 @@
+import pytest
+
+from app.models.task import Task, TaskStatus
+
+TASK_TREE = """
+query TaskTree($rootId: Int!, $maxDepth: Int) {
+  taskTree(rootId: $rootId, maxDepth: $maxDepth) {
+    depth
+    task { title parentTaskId }
+    rollup { taskCount doneCount doneRatio estimatedHours actualHours }
+  }
+}
+"""
+
+ANCESTORS = """
+query Ancestors($taskId: Int!) {
+  ancestors(taskId: $taskId) { title }
+}
+"""
+
+
+@pytest.fixture
+async def tree(db_session, create_user, create_project):
+    """root ─┬─ a ── a1 ── a1x
+    └─ b (done)"""
+    owner = await create_user("owner")
+    project = await create_project(owner)
+
+    async def add(title, parent=None, status=TaskStatus.TODO, hours=1):
+        task = Task(
+            title=title,
+            project_id=project.id,
+            created_by=owner.id,
+            parent_task_id=parent.id if parent else None,
+            status=status,
+            estimated_hours=hours,
+            actual_hours=hours if status == TaskStatus.DONE else None,
+        )
+        db_session.add(task)
+        await db_session.flush()
+        return task
+
+    root = await add("root")
+    a = await add("a", root)
+    await add("b", root, status=TaskStatus.DONE, hours=2)
+    a1 = await add("a1", a)
+    a1x = await add("a1x", a1, status=TaskStatus.DONE)
+    await db_session.commit()
+    return owner, {task.title: task for task in (root, a, a1, a1x)}
+
+
+async def test_task_tree_returns_the_subtree_with_rollups(graphql, tree):
+    owner, tasks = tree
+
+    result = await graphql(owner, TASK_TREE, {"rootId": tasks["root"].id})
+
+    nodes = result["data"]["taskTree"]
+    assert [(node["depth"], node["task"]["title"]) for node in nodes] == [
+        (0, "root"),
+        (1, "a"),
+        (1, "b"),
+        (2, "a1"),
+        (3, "a1x"),
+    ]
+    assert nodes[1]["task"]["parentTaskId"] == tasks["root"].id
+    assert nodes[0]["rollup"] == {
+        "taskCount": 5,
+        "doneCount": 2,
+        "doneRatio": 0.4,
+        "estimatedHours": 6,
+        "actualHours": 3,
+    }
+    assert nodes[1]["rollup"]["taskCount"] == 3
+
+
+async def test_task_tree_depth_limits_nodes_but_not_rollups(graphql, tree):
+    owner, tasks = tree
+
+    result = await graphql(
+        owner, TASK_TREE, {"rootId": tasks["root"].id, "maxDepth": 1}
+    )
+
+    nodes = result["data"]["taskTree"]
+    assert [node["task"]["title"] for node in nodes] == ["root", "a", "b"]
+    # 표시하지 않은 자손도 롤업에는 포함된다
+    assert nodes[1]["rollup"]["taskCount"] == 3
+    assert nodes[1]["rollup"]["doneCount"] == 1
+
+
+async def test_ancestors_run_from_the_root_to_the_direct_parent(graphql, tree):
+    owner, tasks = tree
+
+    result = await graphql(owner, ANCESTORS, {"taskId": tasks["a1x"].id})
+
+    assert [task["title"] for task in result["data"]["ancestors"]] == [
+        "root",
+        "a",
+        "a1",
+    ]
+    result = await graphql(owner, ANCESTORS, {"taskId": tasks["root"].id})
+    assert result["data"]["ancestors"] == []
+
+
+async def test_tree_queries_require_project_access(graphql, create_user, tree):
+    _, tasks = tree
+    outsider = await create_user("outsider")
+
+    result = await graphql(outsider, TASK_TREE, {"rootId": tasks["root"].id})
+    assert result["data"]["taskTree"] == []
+    result = await graphql(outsider, ANCESTORS, {"taskId": tasks["a1x"].id})
+    assert result["data"]["ancestors"] == []
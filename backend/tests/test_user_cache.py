@@ -0,0 +1,94 @@
+import asyncio
+
+from app.core import user_cache as user_cache_module
+from app.core.config import settings
+from app.core.user_cache import cache_user, get_cached_user, user_cache
+from app.services.user_service import UserService
+
+ME_QUERY = "{ me { id username } }"
+
+
+class FakeRedis:
+    def __init__(self):
+        self.values = {}
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def incr(self, key):
+        self.values[key] = int(self.values.get(key, 0)) + 1
+        return self.values[key]
+
+
+async def test_deactivated_user_is_rejected_after_commit(
+    db_session, client, create_user, auth_headers
+):
+    user = await create_user("alice")
+    headers = auth_headers(user)
+    response = await client.post("/graphql", json={"query": ME_QUERY}, headers=headers)
+    assert response.json()["data"]["me"]["username"] == "alice"
+    assert user_cache.get(user.id) is not None
+
+    await UserService.deactivate_user(db_session, user)
+    # 커밋 전에는 이전 스냅샷을 유지한다 (롤백되면 그대로 유효)
+    assert user_cache.get(user.id) is not None
+    await db_session.commit()
+    assert user_cache.get(user.id) is None
+
+    response = await client.post("/graphql", json={"query": ME_QUERY}, headers=headers)
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Inactive user"
+
+
+async def test_rolled_back_change_keeps_cached_user(db_session, create_user):
+    user = await create_user("alice")
+    user_id = user.id
+    cache_user(user)
+
+    user.full_name = "Alice"
+    await db_session.flush()
+    await db_session.rollback()
+
+    assert user_cache.get(user_id) is not None
+
+
+async def test_version_bump_from_another_worker_clears_local_cache(
+    db_session, create_user, monkeypatch
+):
+    redis = FakeRedis()
+    monkeypatch.setattr(user_cache_module, "get_redis", lambda: redis)
+    monkeypatch.setattr(settings, "USER_CACHE_VERSION_CHECK_INTERVAL", 0)
+    monkeypatch.setattr(user_cache_module, "_version", 0)
+
+    user = await create_user("alice")
+    cache_user(user)
+    assert await get_cached_user(user.id) is not None
+
+    redis.values[user_cache_module.USER_CACHE_VERSION_KEY] = 1
+
+    assert await get_cached_user(user.id) is None
+
+
+async def test_login_time_update_is_not_broadcast(db_session, create_user, monkeypatch):
+    redis = FakeRedis()
+    monkeypatch.setattr(user_cache_module, "get_redis", lambda: redis)
+    monkeypatch.setattr(user_cache_module, "_version", 0)
+
+    user = await create_user("alice")
+    cache_user(user)
+    user.last_login = user.created_at
+    await db_session.commit()
+    assert user_cache.get(user.id) is None
+    assert not redis.values
+
+    user.full_name = "Alice"
+    await db_session.commit()
+    await asyncio.gather(*user_cache_module._pending_bumps)
+    assert redis.values[user_cache_module.USER_CACHE_VERSION_KEY] == 1
+
+
+async def test_user_cache_health_endpoint(client):
+    response = await client.get("/health/user-cache")
+
+    assert response.status_code == 200
+    assert {"size", "hits", "misses", "hit_rate"} <= response.json().keys()
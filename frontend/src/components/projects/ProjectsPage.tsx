@@ -17,7 +17,8 @@ const ProjectsPage: React.FC = () => {
 
   const { data, loading, error, refetch } = useQuery(GET_PROJECTS);
 
-  const projects: Project[] = data?.projects || [];
+  const projects: Project[] =
+    data?.projects?.edges.map((edge: { node: Project }) => edge.node) || [];
 
   const filteredProjects = projects.filter((project) => {
     const matchesSearch = project.name.toLowerCase().includes(searchTerm.toLowerCase()) ||
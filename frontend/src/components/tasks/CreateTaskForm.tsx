@@ -61,7 +61,8 @@ const CreateTaskForm: React.FC<CreateTaskFormProps> = ({ onSuccess }) => {
     }
   };
 
-  const projects = projectsData?.projects || [];
+  const projects =
+    projectsData?.projects?.edges.map((edge: { node: any }) => edge.node) || [];
 
   return (
     <form onSubmit={handleSubmit(onSubmit)} className="space-y-6">
@@ -1,11 +1,22 @@
 import { ApolloClient, InMemoryCache, createHttpLink, from } from '@apollo/client';
 import { setContext } from '@apollo/client/link/context';
 import { onError } from '@apollo/client/link/error';
+import { createPersistedQueryLink } from '@apollo/client/link/persisted-queries';
 
 const httpLink = createHttpLink({
   uri: import.meta.env.VITE_GRAPHQL_URL || 'http://localhost:8000/graphql',
 });
 
+// 자동 persisted query: 해시만 보내고, 서버가 모르는 해시일 때만 본문을 재전송
+const sha256 = async (query: string) => {
+  const digest = await crypto.subtle.digest('SHA-256', new TextEncoder().encode(query));
+  return Array.from(new Uint8Array(digest))
+    .map((byte) => byte.toString(16).padStart(2, '0'))
+    .join('');
+};
+
+const persistedQueryLink = createPersistedQueryLink({ sha256 });
+
 const authLink = setContext((_, { headers }) => {
   const token = localStorage.getItem('token');
   return {
@@ -35,7 +46,7 @@ const errorLink = onError(({ graphQLErrors, networkError, operation, forward })
 });
 
 export const apolloClient = new ApolloClient({
-  link: from([errorLink, authLink, httpLink]),
+  link: from([errorLink, authLink, persistedQueryLink, httpLink]),
   cache: new InMemoryCache({
     typePolicies: {
       Query: {
@@ -20,20 +20,29 @@ export const GET_ME = gql`
 `;
 
 export const GET_USERS = gql`
-  query GetUsers {
-    users {
-      id
-      email
-      username
-      fullName
-      role
-      avatarUrl
-      phone
-      department
-      position
-      isActive
-      createdAt
-      updatedAt
+  query GetUsers($first: Int, $after: String) {
+    users(first: $first, after: $after) {
+      edges {
+        cursor
+        node {
+          id
+          email
+          username
+          fullName
+          role
+          avatarUrl
+          phone
+          department
+          position
+          isActive
+          createdAt
+          updatedAt
+        }
+      }
+      pageInfo {
+        hasNextPage
+        endCursor
+      }
     }
   }
 `;
\ No newline at end of file
@@ -9,7 +9,10 @@ export const GET_DASHBOARD_STATS = gql`
       totalTasks
       completedTasks
       overdueTasks
-      tasksByStatus
+      tasksByStatus {
+        status
+        count
+      }
     }
   }
 `;
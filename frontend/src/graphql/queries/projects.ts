@@ -1,30 +1,39 @@
 import { gql } from '@apollo/client';
 
 export const GET_PROJECTS = gql`
-  query GetProjects {
-    projects {
-      id
-      name
-      description
-      status
-      priority
-      startDate
-      endDate
-      progress
-      budget
-      createdAt
-      updatedAt
-      creator {
-        id
-        username
-        fullName
-        avatarUrl
+  query GetProjects($first: Int, $after: String) {
+    projects(first: $first, after: $after) {
+      edges {
+        cursor
+        node {
+          id
+          name
+          description
+          status
+          priority
+          startDate
+          endDate
+          progress
+          budget
+          createdAt
+          updatedAt
+          creator {
+            id
+            username
+            fullName
+            avatarUrl
+          }
+          members {
+            id
+            username
+            fullName
+            avatarUrl
+          }
+        }
       }
-      members {
-        id
-        username
-        fullName
-        avatarUrl
+      pageInfo {
+        hasNextPage
+        endCursor
       }
     }
   }
@@ -1,29 +1,38 @@
 import { gql } from '@apollo/client';
 
 export const GET_TASKS = gql`
-  query GetTasks($projectId: Int) {
-    tasks(projectId: $projectId) {
-      id
-      title
-      description
-      status
-      priority
-      estimatedHours
-      actualHours
-      startDate
-      dueDate
-      completedAt
-      createdAt
-      updatedAt
-      project {
-        id
-        name
+  query GetTasks($projectId: Int, $first: Int, $after: String) {
+    tasks(projectId: $projectId, first: $first, after: $after) {
+      edges {
+        cursor
+        node {
+          id
+          title
+          description
+          status
+          priority
+          estimatedHours
+          actualHours
+          startDate
+          dueDate
+          completedAt
+          createdAt
+          updatedAt
+          project {
+            id
+            name
+          }
+          assignees {
+            id
+            username
+            fullName
+            avatarUrl
+          }
+        }
       }
-      assignees {
-        id
-        username
-        fullName
-        avatarUrl
+      pageInfo {
+        hasNextPage
+        endCursor
       }
     }
   }
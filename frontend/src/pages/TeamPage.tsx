@@ -19,7 +19,7 @@ const TeamPage: React.FC = () => {
     );
   }
 
-  const users = data?.users || [];
+  const users = data?.users?.edges.map((edge: { node: any }) => edge.node) || [];
 
   return (
     <div className="space-y-6">
@@ -19,7 +19,8 @@ const TasksPage: React.FC = () => {
 
   const { data, loading, error, refetch } = useQuery(GET_TASKS);
 
-  const tasks: Task[] = data?.tasks || [];
+  const tasks: Task[] =
+    data?.tasks?.edges.map((edge: { node: Task }) => edge.node) || [];
 
   const filteredTasks = tasks.filter((task) => {
     const matchesSearch = task.title.toLowerCase().includes(searchTerm.toLowerCase()) ||